@@ -0,0 +1,171 @@
+"""
+モデルの生成速度を、以前のコンストラクタを模したベースラインと並べて計測する
+
+    $ python benchmarks/models.py
+"""
+
+import json
+import sys
+import timeit
+
+from yaylib.models import (
+    ChatRoom,
+    Message,
+    Post,
+    User,
+    get_field_keys,
+    get_fields,
+    get_nested_fields,
+)
+from yaylib.responses import ChatRoomsResponse, PostsResponse
+
+
+def make_payload(model: type, **overrides) -> dict:
+    """モデルの全フィールドを持つ、実際のレスポンスに近い辞書を作成する"""
+    keys = get_field_keys(model)
+    payload = {}
+    for name in get_fields(model):
+        if name == "id" or name.endswith(("_id", "_count", "_at")):
+            value = 123456789
+        elif name.startswith(("is_", "has_")) or name.endswith("ed"):
+            value = False
+        else:
+            value = f"{name}-value"
+        payload[keys.get(name, name)] = value
+    payload.update(overrides)
+    return payload
+
+
+def make_posts_page(size=100) -> dict:
+    user = make_payload(User)
+    posts = [make_payload(Post, id=i, user=dict(user, id=i % 10)) for i in range(size)]
+    return {"result": "success", "posts": posts, "next_page_value": "100"}
+
+
+def make_chat_rooms_page(size=50) -> dict:
+    user = make_payload(User)
+    rooms = [
+        make_payload(
+            ChatRoom,
+            id=i,
+            members=[dict(user, id=i), dict(user, id=i + 1)],
+            owner=dict(user, id=i),
+            last_message=make_payload(Message, id=i),
+        )
+        for i in range(size)
+    ]
+    return {"result": "success", "chat_rooms": rooms, "next_page_value": 1}
+
+
+class BaselineModel:
+    """以前のコンストラクタと同じく、辞書から全ての属性と入れ子のモデルを即座に生成する
+
+    Note:
+        宣言された属性を一つずつ `data.get()` で代入し、入れ子のモデルもその場で生成する。
+        生成されたデコーダーとの比較用であり、インスタンスは `__dict__` に属性を持つ
+    """
+
+    def __init__(self, model: type, data: dict) -> None:
+        self.data = data
+        keys = get_field_keys(model)
+        for name in get_fields(model):
+            setattr(self, name, data.get(keys.get(name, name)))
+        for field in get_nested_fields(model):
+            value = data.get(field.key)
+            if value is not None:
+                nested = field.model
+                if isinstance(nested, str):
+                    nested = getattr(sys.modules[field.module], nested)
+                if field.many:
+                    value = [BaselineModel(nested, item) for item in value]
+                else:
+                    value = BaselineModel(nested, value)
+            setattr(self, field.name, value)
+
+
+def touch_posts(response) -> None:
+    for post in response.posts:
+        post.id, post.liked
+
+
+def walk_posts(response) -> None:
+    for post in response.posts:
+        post.id, post.user.nickname, post.group
+
+
+def walk_chat_rooms(response) -> None:
+    for room in response.chat_rooms:
+        room.id, room.last_message.text, room.owner
+        for member in room.members:
+            member.nickname
+
+
+def measure(decode, walk, body: str, number=200) -> float:
+    def run():
+        walk(decode(json.loads(body)))
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / number
+
+
+def bench(name: str, decode, baseline, walk, body: str) -> None:
+    """ベースラインと生成されたデコーダーの 1 ページあたりの時間を並べて表示する"""
+    seconds = measure(decode, walk, body)
+    if baseline is None:
+        print(f"{name:<38} {'-':>10} {seconds * 1e3:10.3f} {'-':>8}")
+        return
+    base = measure(baseline, walk, body)
+    print(f"{name:<38} {base * 1e3:10.3f} {seconds * 1e3:10.3f} {base / seconds:7.2f}x")
+
+
+def main() -> None:
+    posts = json.dumps(make_posts_page())
+    chat_rooms = json.dumps(make_chat_rooms_page())
+
+    def slim(model):
+        return lambda data: model.from_dict(data, slim=True)
+
+    def baseline(model):
+        return lambda data: BaselineModel(model, data)
+
+    print(f"{'ms/page':<38} {'baseline':>10} {'generated':>10} {'speedup':>8}")
+    bench("json.loads only (100 posts)", dict, dict, lambda _: None, posts)
+    bench(
+        "PostsResponse, read id/liked",
+        PostsResponse,
+        baseline(PostsResponse),
+        touch_posts,
+        posts,
+    )
+    bench(
+        "PostsResponse, read user/group",
+        PostsResponse,
+        baseline(PostsResponse),
+        walk_posts,
+        posts,
+    )
+    bench(
+        "PostsResponse slim, read user/group",
+        slim(PostsResponse),
+        None,
+        walk_posts,
+        posts,
+    )
+    bench("json.loads only (50 chat rooms)", dict, dict, lambda _: None, chat_rooms)
+    bench(
+        "ChatRoomsResponse, read all",
+        ChatRoomsResponse,
+        baseline(ChatRoomsResponse),
+        walk_chat_rooms,
+        chat_rooms,
+    )
+    bench(
+        "ChatRoomsResponse slim, read all",
+        slim(ChatRoomsResponse),
+        None,
+        walk_chat_rooms,
+        chat_rooms,
+    )
+
+
+if __name__ == "__main__":
+    main()
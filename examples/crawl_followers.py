@@ -0,0 +1,28 @@
+# 特定のユーザーのフォロワーを、中断しても続きから再開できるように取得するサンプルコード
+
+
+import asyncio
+
+import yaylib
+
+
+async def main():
+    async with yaylib.Client() as client:
+        # フォロワーを取得する対象のユーザーID
+        target_id = 0
+
+        crawler = yaylib.Crawler(
+            client.state,
+            f"followers:{target_id}",
+            client.user.get_user_followers,
+            target_id,
+        )
+        checkpoint = await crawler.run()
+
+        print(checkpoint.items)
+
+        for follower in crawler.items():
+            print(follower["id"])
+
+
+asyncio.run(main())
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+
+from yaylib.cache import ResponseCache, get_cache_tag, get_invalidation_tags
+
+
+class TestCacheTags(unittest.TestCase):
+    def test_get_cache_tag(self):
+        self.assertEqual(get_cache_tag("https://api.yay.space/v2/users/1"), ("user", 1))
+        self.assertEqual(get_cache_tag("api.yay.space/v1/groups/2"), ("group", 2))
+        self.assertEqual(
+            get_cache_tag("api.yay.space/v1/groups/categories"),
+            ("group_categories", None),
+        )
+        self.assertIsNone(get_cache_tag("api.yay.space/v2/users/1/followers"))
+
+    def test_get_invalidation_tags(self):
+        self.assertEqual(
+            get_invalidation_tags("api.yay.space/v2/users/1/follow"), {("user", 1)}
+        )
+        self.assertEqual(
+            get_invalidation_tags(
+                "api.yay.space/v2/posts/mass_destroy", json={"posts_ids": [1, 2]}
+            ),
+            {("post", 1), ("post", 2)},
+        )
+        self.assertEqual(
+            get_invalidation_tags("api.yay.space/v3/users/edit", user_id=3),
+            {("user", 3)},
+        )
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", "api.yay.space/v2/users/1", "user")
+        self.assertEqual(cache.get("a"), "user")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_not_cacheable(self):
+        cache = ResponseCache(ttls={"post": 0})
+        cache.put("a", "api.yay.space/v2/posts/1", "post")
+        cache.put("b", "api.yay.space/v2/users/1/followers", "followers")
+        self.assertEqual(len(cache), 0)
+
+    @patch("yaylib.cache.time.monotonic")
+    def test_ttl(self, monotonic):
+        monotonic.return_value = 0.0
+        cache = ResponseCache(ttls={"user": 10})
+        cache.put("a", "api.yay.space/v2/users/1", "user")
+        monotonic.return_value = 11.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=2)
+        cache.put("a", "api.yay.space/v2/users/1", 1)
+        cache.put("b", "api.yay.space/v2/users/2", 2)
+        cache.get("a")
+        cache.put("c", "api.yay.space/v2/users/3", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        cache.put("a", "api.yay.space/v2/users/1", 1)
+        cache.put("b", "api.yay.space/v2/users/info/1", 1)
+        cache.put("c", "api.yay.space/v2/users/2", 2)
+        cache.invalidate_request("api.yay.space/v2/users/1/follow")
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 2)
+
+    def test_stale_generation(self):
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate("user", 1)
+        cache.put("a", "api.yay.space/v2/users/1", 1, generation)
+        self.assertIsNone(cache.get("a"))
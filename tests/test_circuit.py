@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from yaylib.circuit import CircuitBreaker, CircuitBreakerRegistry, is_circuit_failure
+from yaylib.errors import CircuitOpenError
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_open_after_consecutive_failures(self):
+        breaker = CircuitBreaker("api.yay.space", failure_threshold=2)
+        breaker.record_failure(breaker.acquire())
+        breaker.record_success(breaker.acquire())
+        breaker.record_failure(breaker.acquire())
+        self.assertEqual(breaker.state, "closed")
+
+        breaker.record_failure(breaker.acquire())
+        self.assertEqual(breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire()
+
+    @patch("yaylib.circuit.time.monotonic")
+    def test_half_open_probe(self, monotonic):
+        monotonic.return_value = 100.0
+        breaker = CircuitBreaker("api.yay.space", failure_threshold=1)
+        breaker.record_failure(breaker.acquire())
+
+        with self.assertRaises(CircuitOpenError) as ctx:
+            breaker.acquire()
+        self.assertEqual(ctx.exception.retry_after, 30.0)
+
+        monotonic.return_value = 131.0
+        self.assertEqual(breaker.state, "half_open")
+        probe = breaker.acquire()
+        self.assertTrue(probe)
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire()  # 試行リクエストは1件まで
+
+        breaker.record_failure(probe)
+        self.assertEqual(breaker.state, "open")
+
+        monotonic.return_value = 162.0
+        probe = breaker.acquire()
+        breaker.record_success(probe)
+        self.assertEqual(breaker.state, "closed")
+        self.assertFalse(breaker.acquire())
+
+    @patch("yaylib.circuit.time.monotonic")
+    def test_release_probe(self, monotonic):
+        monotonic.return_value = 0.0
+        breaker = CircuitBreaker("api.yay.space", failure_threshold=1)
+        breaker.record_failure()
+        monotonic.return_value = 60.0
+        breaker.release(breaker.acquire())
+        self.assertTrue(breaker.acquire())
+
+    def test_is_circuit_failure(self):
+        self.assertTrue(is_circuit_failure(asyncio.TimeoutError()))
+        self.assertFalse(is_circuit_failure(ValueError()))
+
+
+class TestCircuitBreakerRegistry(unittest.TestCase):
+    def test_per_host(self):
+        registry = CircuitBreakerRegistry()
+        api = registry.get_breaker("GET", "https://api.yay.space/v1/posts/1")
+        self.assertIs(api, registry.get_breaker("POST", "api.yay.space/v2/users"))
+        self.assertIsNot(
+            api, registry.get_breaker("GET", "https://settings.yay.space/")
+        )
+
+    def test_per_endpoint(self):
+        registry = CircuitBreakerRegistry(per_endpoint=True)
+        posts = registry.get_breaker("GET", "https://api.yay.space/v2/posts/timeline")
+        self.assertEqual(posts.name, "api.yay.space/posts")
+        self.assertIsNot(
+            posts, registry.get_breaker("GET", "https://api.yay.space/v1/x")
+        )
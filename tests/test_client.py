@@ -0,0 +1,402 @@
+import asyncio
+import logging
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import aiohttp
+
+from yaylib import config
+from yaylib.cache import PersistentCache, ResponseCache
+from yaylib.circuit import CircuitBreakerRegistry
+from yaylib.client import Client
+from yaylib.errors import AccessTokenExpiredError
+from yaylib.pagination import PageSpec, paginate
+from yaylib.projection import RAW, SLIM, Projection, response_format
+from yaylib.proxy import ProxyPool
+from yaylib.ratelimit import RateLimiter, RateLimitRule
+from yaylib.responses import ErrorResponse, PostsResponse
+from yaylib.retry import RetryPolicy
+from yaylib.scheduler import BULK, INTERACTIVE, request_priority
+from yaylib.state import LocalUser
+
+
+def create_client(responses=None, **kwargs) -> Client:
+    """送信したリクエストを記録し、`responses` の内容を返すクライアントを作成する"""
+    responses = responses or {}
+    kwargs.setdefault("base_path", tempfile.mkdtemp() + "/")
+    kwargs.setdefault(
+        "rate_limiter",
+        RateLimiter({"default": RateLimitRule(rate=1000, burst=1000)}),
+    )
+    client = Client(
+        use_portal=False,
+        loglevel=logging.ERROR,
+        **kwargs,
+    )
+    client.state.client_ip = "127.0.0.1"
+    client.state.client_ip_expires_at = 2**40
+    client.requests = []
+
+    async def fetch(method, url, **kwargs):
+        client.requests.append((method, url, kwargs.get("params")))
+        await asyncio.sleep(0.01)
+        response = MagicMock()
+        response.status = 200
+        for path, data in responses.items():
+            if url.endswith(path):
+                return response, data
+        return response, {"result": "success"}
+
+    client._Client__fetch = fetch
+    return client
+
+
+class TestSessionLifecycle(unittest.TestCase):
+    def setUp(self):
+        self.client = create_client()
+
+    async def get_session(self):
+        return self.client.session
+
+    def test_replace_closes_previous(self):
+        first = asyncio.run(self.get_session())
+        connector = first.connector
+        second = asyncio.run(self.get_session())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertTrue(connector.closed)
+        self.client.close()
+        self.assertTrue(second.closed)
+
+    def test_close_without_portal(self):
+        loop = asyncio.new_event_loop()
+        try:
+            session = loop.run_until_complete(self.get_session())
+            connector = session.connector
+            self.client.close()
+            self.assertTrue(session.closed)
+            self.assertTrue(connector.closed)
+        finally:
+            loop.close()
+
+    def test_shared_connector_not_closed(self):
+        async def run():
+            connector = aiohttp.TCPConnector()
+            client = create_client(connector=connector)
+            session = client.session
+            await client.aclose()
+            self.assertTrue(session.closed)
+            self.assertFalse(connector.closed)
+            await connector.close()
+
+        asyncio.run(run())
+
+
+class TestRequestCoalescing(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_coalesce_identical_get(self):
+        self.client = create_client()
+        results = await asyncio.gather(
+            *[
+                self.client.request("GET", "api.yay.space/v2/users/1", params={"a": 1})
+                for _ in range(10)
+            ],
+            self.client.request("GET", "api.yay.space/v2/users/1", params={"a": 2}),
+        )
+        self.assertEqual(len(self.client.requests), 2)
+        self.assertIs(results[0], results[9])
+
+    async def test_not_coalesce_post(self):
+        self.client = create_client()
+        await asyncio.gather(
+            *[self.client.request("POST", "api.yay.space/v2/users/1") for _ in range(3)]
+        )
+        self.assertEqual(len(self.client.requests), 3)
+
+    async def test_disabled(self):
+        self.client = create_client(coalesce_requests=False)
+        await asyncio.gather(
+            *[self.client.request("GET", "api.yay.space/v2/users/1") for _ in range(3)]
+        )
+        self.assertEqual(len(self.client.requests), 3)
+
+
+class TestTokenRefresh(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = create_client(retry_policy=RetryPolicy(max_retries=0))
+        self.client.state.set_user(
+            LocalUser(1, "", "uuid", "expired", "refresh", 0, "127.0.0.1", 2**40)
+        )
+        self.client.state.save()
+        self.refreshes = 0
+        self.sent = []
+
+        async def fetch(method, url, **kwargs):
+            await asyncio.sleep(0.01)
+            if url.endswith("/api/v1/oauth/token"):
+                self.refreshes += 1
+                return MagicMock(), {
+                    "access_token": "fresh",
+                    "refresh_token": "refresh",
+                    "expires_in": 3600,
+                }
+            self.sent.append(kwargs["headers"]["Authorization"])
+            if kwargs["headers"]["Authorization"] == "Bearer expired":
+                raise AccessTokenExpiredError(
+                    ErrorResponse({"result": "error", "error_code": -3})
+                )
+            return MagicMock(), {"result": "success"}
+
+        self.client._Client__fetch = fetch
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_replay_without_retries(self):
+        response = await self.client.request("POST", "api.yay.space/v1/users/1")
+        self.assertIsNotNone(response)
+        self.assertEqual(self.refreshes, 1)
+        self.assertEqual(self.sent, ["Bearer expired", "Bearer fresh"])
+
+    async def test_single_flight(self):
+        responses = await asyncio.gather(
+            *[self.client.request("POST", "api.yay.space/v1/users/1") for _ in range(5)]
+        )
+        self.assertTrue(all(response is not None for response in responses))
+        self.assertEqual(self.refreshes, 1)
+        self.assertEqual(self.sent.count("Bearer fresh"), 5)
+
+
+class TestRequestPriority(unittest.IsolatedAsyncioTestCase):
+    async def test_interactive_ahead_of_bulk_backlog(self):
+        client = create_client(
+            rate_limiter=RateLimiter({"default": RateLimitRule(rate=50, burst=1)}),
+            coalesce_requests=False,
+        )
+        try:
+            with request_priority(BULK):
+                bulk = [
+                    asyncio.create_task(
+                        client.request("GET", f"api.yay.space/v2/users/{i}")
+                    )
+                    for i in range(10)
+                ]
+            await asyncio.sleep(0.005)
+            with request_priority(INTERACTIVE):
+                await client.request("GET", "api.yay.space/v2/users/999")
+            urls = [url for _, url, _ in client.requests]
+            self.assertLess(urls.index("https://api.yay.space/v2/users/999"), 3)
+            await asyncio.gather(*bulk)
+        finally:
+            await client.aclose()
+
+
+class TestRequestDeadline(unittest.IsolatedAsyncioTestCase):
+    async def test_attempt_timeout_within_deadline(self):
+        policy = RetryPolicy(backoff_factor=0.01, jitter="none", deadline=5.0)
+        client = create_client(retry_policy=policy, timeout=0.05)
+        timeouts = []
+
+        async def fetch(method, url, **kwargs):
+            timeouts.append(kwargs["timeout"].total)
+            if len(timeouts) == 1:
+                await asyncio.wait_for(asyncio.sleep(10), kwargs["timeout"].total)
+            return MagicMock(), {"result": "success"}
+
+        client._Client__fetch = fetch
+        try:
+            response = await asyncio.wait_for(
+                client.request("GET", "api.yay.space/v2/users/1"), 1.0
+            )
+            self.assertEqual(response, {"result": "success"})
+            self.assertEqual(timeouts, [0.05, 0.05])
+        finally:
+            await client.aclose()
+
+
+class TestProxyPool(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pool = ProxyPool(
+            ["http://127.0.0.1:9", "http://127.0.0.1:10"], health_check_interval=0
+        )
+
+    async def test_proxy_failure_does_not_open_breaker(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        client = create_client(proxy_pool=self.pool, circuit_breaker=registry)
+        del client._Client__fetch
+        try:
+            with self.assertRaises(aiohttp.ClientProxyConnectionError):
+                await client.base_request("GET", "https://api.yay.space/")
+            breaker = registry.get_breaker("GET", "https://api.yay.space/")
+            self.assertEqual(breaker.state, "closed")
+            self.assertEqual(self.pool.proxies[0].failures, 1)
+        finally:
+            await client.aclose()
+
+    async def test_sticky_across_login_and_release(self):
+        client = create_client(proxy_pool=self.pool)
+        proxy_url = client.proxy_url
+        client.state.set_user(LocalUser(1, "", "uuid", "token", "refresh"))
+        self.assertEqual(client.proxy_url, proxy_url)
+        await client.aclose()
+        self.assertEqual(sum(proxy.assignments for proxy in self.pool.proxies), 0)
+
+    async def test_client_ip_follows_proxy(self):
+        client = create_client(
+            {"/v2/users/timestamp": {"ip_address": "1.1.1.1"}}, proxy_pool=self.pool
+        )
+        try:
+            await client.request("GET", "api.yay.space/v2/users/1")
+            await client.request("GET", "api.yay.space/v2/users/2")
+            self.assertEqual(len(client.requests), 3)
+            self.assertEqual(client.state.client_ip, "1.1.1.1")
+
+            proxy = next(p for p in self.pool.proxies if p.url == client.proxy_url)
+            self.pool.record_failure(proxy)
+            self.pool.record_failure(proxy)
+            self.pool.record_failure(proxy)
+            await client.request("GET", "api.yay.space/v2/users/3")
+            self.assertTrue(client.requests[-2][1].endswith("/v2/users/timestamp"))
+        finally:
+            await client.aclose()
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = create_client(response_cache=ResponseCache())
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_cache_and_invalidate(self):
+        url = "api.yay.space/v2/users/1"
+        first = await self.client.request("GET", url)
+        self.assertIs(await self.client.request("GET", url), first)
+        self.assertEqual(len(self.client.requests), 1)
+
+        await self.client.request("POST", "api.yay.space/v2/users/1/follow")
+        await self.client.request("GET", url)
+        self.assertEqual(len(self.client.requests), 3)
+        self.assertEqual(self.client.response_cache.hits, 1)
+
+
+class TestPersistentCache(unittest.IsolatedAsyncioTestCase):
+    async def test_cold_start(self):
+        responses = {"/v1/calls/bgm": {"bgm": [{"id": 1}]}}
+        base_path = tempfile.mkdtemp() + "/"
+        client = create_client(responses, base_path=base_path)
+        self.assertIsNone(client.persistent_cache)
+        await client.aclose()
+
+        client = create_client(responses, base_path=base_path, persistent_cache=True)
+        bgms = await client.call.get_bgms()
+        self.assertEqual(bgms.bgm[0].id, 1)
+        await client.aclose()
+
+        client = create_client(responses, base_path=base_path, persistent_cache=True)
+        bgms = await client.call.get_bgms()
+        self.assertEqual(bgms.bgm[0].id, 1)
+        self.assertEqual(len(client.requests), 0)
+        await client.aclose()
+
+    async def test_stale_while_revalidate(self):
+        client = create_client(
+            {"/v1/calls/bgm": {"bgm": [{"id": 2}]}},
+            persistent_cache=PersistentCache(tempfile.mkdtemp(), ttl=0),
+        )
+        key = PersistentCache.make_key(
+            "https://" + config.API_HOST + "/v1/calls/bgm", None, None, False, 0
+        )
+        client.persistent_cache.put(key, {"bgm": [{"id": 1}]})
+
+        bgms = await client.call.get_bgms()
+        self.assertEqual(bgms.bgm[0].id, 1)
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(client.requests), 1)
+        self.assertEqual(client.persistent_cache.get(key)[0]["bgm"][0]["id"], 2)
+        await client.aclose()
+
+    def test_revalidate_with_call_sync(self):
+        client = create_client(
+            {"/v1/calls/bgm": {"bgm": [{"id": 2}]}},
+            persistent_cache=PersistentCache(tempfile.mkdtemp(), ttl=0),
+        )
+        key = PersistentCache.make_key(
+            "https://" + config.API_HOST + "/v1/calls/bgm", None, None, False, 0
+        )
+        client.persistent_cache.put(key, {"bgm": [{"id": 1}]})
+
+        bgms = client.call_sync(client.call.get_bgms())
+        self.assertEqual(bgms.bgm[0].id, 1)
+        self.assertEqual(client.persistent_cache.get(key)[0]["bgm"][0]["id"], 2)
+        client.close()
+
+
+PAGE = {
+    "posts": [{"id": 1, "user": {"id": 10}, "liked": True}],
+    "next_page_value": None,
+}
+
+
+class TestResponseFormat(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = create_client({"/v2/posts/timeline": PAGE})
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def request(self):
+        return await self.client.request(
+            "GET", "api.yay.space/v2/posts/timeline", return_type=PostsResponse
+        )
+
+    async def test_models_by_default(self):
+        self.assertIsInstance(await self.request(), PostsResponse)
+
+    async def test_raw(self):
+        with response_format(RAW):
+            self.assertIs(await self.request(), PAGE)
+        self.assertIsInstance(await self.request(), PostsResponse)
+
+    async def test_projection_with_paginate(self):
+        spec = PageSpec("from_post_id", "posts")
+        with response_format(Projection("id", "liked")):
+            pages = paginate(self.request, spec=spec, max_pages=1)
+            items = [item async for item in pages.items()]
+        self.assertEqual([item.id for item in items], [1])
+        self.assertTrue(items[0].liked)
+
+    async def test_client_default(self):
+        client = create_client({"/v2/posts/timeline": PAGE}, response_format=RAW)
+        try:
+            response = await client.request(
+                "GET", "api.yay.space/v2/posts/timeline", return_type=PostsResponse
+            )
+            self.assertIsInstance(response, dict)
+        finally:
+            await client.aclose()
+
+    async def test_slim(self):
+        with response_format(SLIM):
+            response = await self.request()
+        self.assertIsInstance(response, PostsResponse)
+        self.assertEqual(response.posts[0].user.id, 10)
+        self.assertIsNot(response.data, PAGE)
+        self.assertEqual(response.data["posts"][0]["id"], 1)
+
+    async def test_identity_map(self):
+        client = create_client({"/v2/posts/timeline": PAGE}, identity_map=True)
+        try:
+            url = "api.yay.space/v2/posts/timeline"
+            first = await client.request("GET", url, return_type=PostsResponse)
+            second = await client.request(
+                "GET", url, params={"a": 1}, return_type=PostsResponse
+            )
+            self.assertIsNot(first, second)
+            self.assertIs(first.posts[0], second.posts[0])
+            self.assertIs(first.posts[0].user, second.posts[0].user)
+        finally:
+            await client.aclose()
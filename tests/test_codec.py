@@ -0,0 +1,49 @@
+import importlib.util
+import unittest
+
+from yaylib.codec import (
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    get_json_codec,
+)
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+test_payload = {
+    "result": "success",
+    "posts": [{"id": 1, "text": "こんにちは", "liked": False, "user": None}],
+}
+
+
+class TestJSONCodec(unittest.TestCase):
+    def assert_roundtrip(self, codec: JSONCodec):
+        encoded = codec.encode(test_payload)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(codec.loads(encoded), test_payload)
+        self.assertEqual(codec.loads(codec.dumps(test_payload)), test_payload)
+
+        with self.assertRaises(ValueError):
+            codec.loads(b"<html></html>")
+
+    def test_stdlib_codec(self):
+        self.assert_roundtrip(StdlibJSONCodec())
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_orjson_codec(self):
+        self.assert_roundtrip(OrjsonCodec())
+
+    @unittest.skipUnless(HAS_MSGSPEC, "msgspec is not installed")
+    def test_msgspec_codec(self):
+        self.assert_roundtrip(MsgspecCodec())
+
+    def test_get_json_codec(self):
+        codec = StdlibJSONCodec()
+        self.assertIs(get_json_codec(codec), codec)
+        self.assertIsInstance(get_json_codec("json"), StdlibJSONCodec)
+        self.assertIsInstance(get_json_codec(), JSONCodec)
+
+        with self.assertRaises(ValueError):
+            get_json_codec("__invalid_codec__")
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from yaylib.crawl import Crawler
+from yaylib.pagination import PageSpec
+from yaylib.responses import FollowUsersResponse
+from yaylib.state import Storage
+
+FOLLOWERS = PageSpec("from_follow_id", "users", "last_follow_id")
+
+
+class FakeUserApi:
+    def __init__(self, pages, fail_at=None):
+        self.pages = pages
+        self.fail_at = fail_at
+        self.calls = []
+
+    async def get_user_followers(self, user_id, **params):
+        cursor = params.get("from_follow_id") or 0
+        self.calls.append(cursor)
+        if cursor == self.fail_at:
+            raise ConnectionError()
+        if cursor >= self.pages:
+            return FollowUsersResponse({"users": [], "last_follow_id": None})
+        return FollowUsersResponse(
+            {
+                "users": [{"id": cursor * 10 + i} for i in range(3)],
+                "last_follow_id": cursor + 1,
+            }
+        )
+
+
+class TestCrawler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.storage = Storage(os.path.join(tempfile.mkdtemp(), "test.db"))
+
+    async def test_resume(self):
+        api = FakeUserApi(pages=4, fail_at=2)
+        crawler = Crawler(
+            self.storage, "followers:1", api.get_user_followers, 1, spec=FOLLOWERS
+        )
+        with self.assertRaises(ConnectionError):
+            await crawler.run()
+
+        checkpoint = crawler.checkpoint
+        self.assertEqual(checkpoint.cursor, 2)
+        self.assertEqual(checkpoint.items, 6)
+        self.assertFalse(checkpoint.done)
+
+        api.fail_at = None
+        api.calls.clear()
+        checkpoint = await crawler.run()
+        self.assertEqual(api.calls, [2, 3, 4])
+        self.assertTrue(checkpoint.done)
+        self.assertEqual(checkpoint.items, 12)
+        self.assertEqual(
+            [item["id"] for item in crawler.items()],
+            [0, 1, 2, 10, 11, 12, 20, 21, 22, 30, 31, 32],
+        )
+
+        api.calls.clear()
+        await crawler.run()
+        self.assertEqual(api.calls, [])
+
+    async def test_max_pages_and_reset(self):
+        api = FakeUserApi(pages=4)
+        crawler = Crawler(
+            self.storage,
+            "followers:1",
+            api.get_user_followers,
+            1,
+            spec=FOLLOWERS,
+            prefetch=0,
+        )
+        checkpoint = await crawler.run(max_pages=1)
+        self.assertEqual((checkpoint.cursor, checkpoint.pages), (1, 1))
+
+        crawler.reset()
+        self.assertIsNone(crawler.checkpoint)
+        self.assertEqual(list(crawler.items()), [])
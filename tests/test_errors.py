@@ -0,0 +1,30 @@
+import unittest
+
+from yaylib.errors import (
+    AccessTokenExpiredError,
+    ClientError,
+    QuotaLimitExceededError,
+    raise_for_json,
+)
+
+
+class TestRaiseForJson(unittest.TestCase):
+    def test_success_response(self):
+        self.assertIsNone(raise_for_json({"result": "success"}))
+
+    def test_non_dict_response(self):
+        self.assertIsNone(raise_for_json(None))
+        self.assertIsNone(raise_for_json([{"result": "error", "error_code": -3}]))
+
+    def test_known_error_code(self):
+        with self.assertRaises(AccessTokenExpiredError) as ctx:
+            raise_for_json({"result": "error", "error_code": -3, "message": "expired"})
+        self.assertEqual(ctx.exception.response.error_code, -3)
+
+        with self.assertRaises(QuotaLimitExceededError) as ctx:
+            raise_for_json({"result": "error", "error_code": -343, "retry_in": 60})
+        self.assertEqual(ctx.exception.response.retry_in, 60)
+
+    def test_unknown_error_code(self):
+        with self.assertRaises(ClientError):
+            raise_for_json({"result": "error", "error_code": -123456})
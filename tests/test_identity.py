@@ -0,0 +1,68 @@
+import gc
+import unittest
+
+from yaylib.identity import IdentityMap
+from yaylib.models import User
+from yaylib.responses import ActivitiesResponse, PostsResponse
+
+
+class TestIdentityMap(unittest.TestCase):
+    def setUp(self):
+        self.identity_map = IdentityMap()
+
+    def build(self, data, slim=False):
+        return self.identity_map.get_factory(PostsResponse, slim)(data)
+
+    def test_same_instance(self):
+        response = self.build(
+            {"posts": [{"id": 1, "user": {"id": 10}}, {"id": 2, "user": {"id": 10}}]}
+        )
+        self.assertIs(response.posts[0].user, response.posts[1].user)
+
+        activities = self.identity_map.get_factory(ActivitiesResponse)(
+            {"activities": [{"followers": [{"id": 10}]}]}
+        )
+        self.assertIs(activities.activities[0].followers[0], response.posts[0].user)
+
+    def test_update_in_place(self):
+        first = self.build({"posts": [{"id": 1, "user": {"id": 10, "nickname": "a"}}]})
+        user = first.posts[0].user
+        second = self.build(
+            {"posts": [{"id": 2, "user": {"id": 10, "followers_count": 5}}]}
+        )
+        self.assertIs(second.posts[0].user, user)
+        self.assertEqual(user.nickname, "a")
+        self.assertEqual(user.followers_count, 5)
+
+    def test_out_of_order_access(self):
+        older = self.build({"posts": [{"id": 1, "user": {"id": 10, "nickname": "a"}}]})
+        newer = self.build({"posts": [{"id": 2, "user": {"id": 10, "nickname": "b"}}]})
+        user = newer.posts[0].user
+        self.assertEqual(user.nickname, "b")
+        self.assertIs(older.posts[0].user, user)
+        self.assertEqual(user.nickname, "b")
+
+    def test_slim(self):
+        response = self.build(
+            {"posts": [{"id": 1, "user": {"id": 10}}, {"id": 2, "user": {"id": 10}}]},
+            slim=True,
+        )
+        self.assertIs(response.posts[0].user, response.posts[1].user)
+        self.build({"posts": [{"id": 3, "user": {"id": 10, "nickname": "b"}}]}, True)
+        self.assertEqual(response.posts[0].user.nickname, "b")
+
+    def test_weak_references(self):
+        User.from_dict({"id": 1}, identity_map=self.identity_map)
+        gc.collect()
+        self.assertEqual(len(self.identity_map), 0)
+
+    def test_intern(self):
+        nickname = "".join(["nick", "name"])
+        a = User.from_dict(
+            {"id": 1, "nickname": nickname}, identity_map=self.identity_map
+        )
+        b = User.from_dict(
+            {"id": 2, "nickname": "".join(["nick", "name"])},
+            identity_map=self.identity_map,
+        )
+        self.assertIs(a.nickname, b.nickname)
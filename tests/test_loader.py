@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from yaylib.loader import BatchLoader, DataLoader
+from yaylib.responses import PostsResponse, Response
+
+
+class TestDataLoader(unittest.IsolatedAsyncioTestCase):
+    async def test_batch(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(keys)
+            return {key: key * 10 for key in keys if key != 3}
+
+        loader = DataLoader(batch_fn)
+        results = await asyncio.gather(*(loader.load(key) for key in [1, 2, 2, 3]))
+        self.assertEqual(results, [10, 20, 20, None])
+        self.assertEqual(batches, [[1, 2, 3]])
+
+        self.assertEqual(await loader.load_many([4, 5]), [40, 50])
+        self.assertEqual(len(batches), 2)
+
+    async def test_max_batch_size(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(keys)
+            return {key: key for key in keys}
+
+        loader = DataLoader(batch_fn, max_batch_size=2)
+        await loader.load_many(range(5))
+        self.assertEqual(batches, [[0, 1], [2, 3], [4]])
+
+    async def test_error(self):
+        async def batch_fn(keys):
+            raise ValueError()
+
+        loader = DataLoader(batch_fn)
+        with self.assertRaises(ValueError):
+            await loader.load(1)
+
+
+class TestBatchLoader(unittest.IsolatedAsyncioTestCase):
+    async def test_load_post(self):
+        client = MagicMock()
+        client.post.get_posts = AsyncMock(
+            return_value=PostsResponse({"posts": [{"id": 1}, {"id": 2}]})
+        )
+        loader = BatchLoader(client)
+        posts = await asyncio.gather(*(loader.load_post(i) for i in [1, 2, 3]))
+        self.assertEqual([post and post.id for post in posts], [1, 2, None])
+        client.post.get_posts.assert_awaited_once_with([1, 2, 3])
+
+    async def test_load_group_joined_status(self):
+        client = MagicMock()
+        client.group.get_joined_statuses = AsyncMock(
+            return_value=Response({"statuses": {"1": "joined", "2": "pending"}})
+        )
+        loader = BatchLoader(client)
+        statuses = await asyncio.gather(
+            *(loader.load_group_joined_status(i) for i in [1, 2, 3])
+        )
+        self.assertEqual(statuses, ["joined", "pending", None])
+
+    async def test_unexpected_status_response(self):
+        client = MagicMock()
+        client.thread.get_thread_joined_statuses = AsyncMock(
+            return_value=Response({"result": "success", "data": {"1": "joined"}})
+        )
+        loader = BatchLoader(client)
+        with self.assertRaises(ValueError):
+            await loader.load_thread_joined_status(1)
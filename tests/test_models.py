@@ -0,0 +1,82 @@
+import unittest
+
+from yaylib.models import Activity, Metadata, Nested, Post, User
+from yaylib.responses import PostsResponse
+
+
+class TestNestedModels(unittest.TestCase):
+    def test_lazy_materialization(self):
+        response = PostsResponse({"posts": [{"id": 1, "user": {"id": 2}}]})
+        self.assertFalse(hasattr(response, "_nested_posts"))
+
+        post = response.posts[0]
+        self.assertIsInstance(post, Post)
+        self.assertFalse(hasattr(post, "_nested_user"))
+        self.assertIsInstance(post.user, User)
+        self.assertEqual(post.user.id, 2)
+
+    def test_cached(self):
+        activity = Activity({"user": {"id": 1}, "followers": [{"id": 2}]})
+        self.assertIs(activity.user, activity.user)
+        self.assertIs(activity.followers, activity.followers)
+        self.assertEqual([user.id for user in activity.followers], [2])
+
+    def test_missing_and_assignment(self):
+        post = Post({"id": 1})
+        self.assertIsNone(post.user)
+        post.user = User({"id": 3})
+        self.assertEqual(post.user.id, 3)
+
+    def test_descriptor(self):
+        self.assertIsInstance(Post.__dict__["user"], Nested)
+
+
+class TestSlimModels(unittest.TestCase):
+    def test_slim(self):
+        data = {"posts": [{"id": 1, "user": {"id": 2}, "unknown": {"a": 1}}]}
+        response = PostsResponse.from_dict(data, slim=True)
+        post = response.posts[0]
+        self.assertIsInstance(post.user, User)
+        self.assertNotIn("unknown", post.to_dict())
+        self.assertEqual(response.to_dict()["posts"][0]["user"]["id"], 2)
+        self.assertEqual(post.data["id"], 1)
+        self.assertFalse(hasattr(post, "__dict__"))
+        self.assertFalse(hasattr(post.user, "__dict__"))
+
+    def test_to_dict_keeps_unbuilt_nested(self):
+        data = {"id": 1, "user": {"id": 2, "unknown": True}}
+        post = Post(data)
+        self.assertIs(post.data, data)
+        self.assertIs(post.to_dict()["user"], data["user"])
+
+
+class TestGeneratedDecoders(unittest.TestCase):
+    def test_generated(self):
+        self.assertTrue(User._assign.__decoder__)
+        self.assertTrue(Metadata._assign.__decoder__)
+
+    def test_renamed_keys(self):
+        user = User({"id": 1, "last_loggedin_at": 10})
+        self.assertEqual(user.last_logged_in_at, 10)
+        self.assertEqual(user.to_dict()["last_loggedin_at"], 10)
+
+        slim = User.from_dict({"id": 1, "last_loggedin_at": 10}, slim=True)
+        self.assertEqual(slim.last_logged_in_at, 10)
+        slim.update({"nickname": "yay"})
+        self.assertEqual(slim.last_logged_in_at, 10)
+        self.assertEqual(slim.nickname, "yay")
+
+    def test_hand_written(self):
+        metadata = Metadata({"data": {"a": 1}, "title": "t"})
+        self.assertEqual(metadata.data, {"a": 1})
+        self.assertEqual(metadata.title, "t")
+
+    def test_update_merges_changed_fields(self):
+        post = Post({"id": 1, "text": "a", "likes_count": 1, "user": {"id": 2}})
+        user = post.user
+        post.update({"likes_count": 2, "user": {"id": 3}})
+        self.assertEqual(post.text, "a")
+        self.assertEqual(post.likes_count, 2)
+        self.assertIsNot(post.user, user)
+        self.assertEqual(post.user.id, 3)
+        self.assertEqual(post.data["text"], "a")
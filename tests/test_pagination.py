@@ -0,0 +1,97 @@
+import asyncio
+import gc
+import unittest
+
+from yaylib.api import UserApi
+from yaylib.pagination import PageSpec, get_page_spec, paginate
+from yaylib.responses import FollowUsersResponse, PostsResponse
+from yaylib.scheduler import BULK, get_request_priority
+
+
+class FakeApi:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.priorities = []
+
+    async def get_user_followers(self, user_id, **params):
+        self.calls.append(params.get("from_follow_id"))
+        self.priorities.append(get_request_priority("GET", "api.yay.space"))
+        await asyncio.sleep(0)
+        cursor = params.get("from_follow_id") or 0
+        if cursor >= self.pages:
+            return FollowUsersResponse({"users": [], "last_follow_id": None})
+        return FollowUsersResponse(
+            {
+                "users": [{"id": cursor * 10 + i} for i in range(2)],
+                "last_follow_id": cursor + 1,
+            }
+        )
+
+    async def get_user_timeline(self, **params):
+        from_post_id = params.get("from_post_id") or 100
+        posts = [
+            {"id": i} for i in range(from_post_id - 1, max(from_post_id - 3, 90), -1)
+        ]
+        return PostsResponse({"posts": posts})
+
+
+FOLLOWERS = PageSpec("from_follow_id", "users", "last_follow_id")
+
+
+class TestPaginator(unittest.IsolatedAsyncioTestCase):
+    async def test_pages(self):
+        api = FakeApi(pages=3)
+        pages = paginate(api.get_user_followers, 1, spec=FOLLOWERS, prefetch=2)
+        ids = [user.id async for user in pages.items()]
+        self.assertEqual(ids, [0, 1, 10, 11, 20, 21])
+        self.assertEqual(api.calls, [None, 1, 2, 3])
+        self.assertEqual(set(api.priorities), {BULK})
+        self.assertTrue(pages.done)
+
+    async def test_resume_from_cursor(self):
+        api = FakeApi(pages=3)
+        async with paginate(api.get_user_followers, 1, spec=FOLLOWERS) as pages:
+            await pages.__anext__()
+            cursor = pages.cursor
+        self.assertEqual(cursor, 1)
+
+        pages = paginate(api.get_user_followers, 1, spec=FOLLOWERS, cursor=cursor)
+        ids = [user.id async for user in pages.items()]
+        self.assertEqual(ids, [10, 11, 20, 21])
+
+    async def test_item_cursor_and_max_pages(self):
+        api = FakeApi(pages=0)
+        spec = PageSpec("from_post_id", "posts")
+        pages = paginate(api.get_user_timeline, spec=spec, prefetch=0, max_pages=2)
+        ids = [post.id async for post in pages.items()]
+        self.assertEqual(ids, [99, 98, 97, 96])
+        self.assertEqual(pages.cursor, 96)
+        self.assertFalse(pages.done)
+
+    async def test_prefetch_limit(self):
+        api = FakeApi(pages=10)
+        async with paginate(api.get_user_followers, 1, spec=FOLLOWERS) as pages:
+            await pages.__anext__()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            self.assertEqual(api.calls, [None, 1])
+
+    async def test_producer_cancelled_on_gc(self):
+        api = FakeApi(pages=10)
+        pages = paginate(api.get_user_followers, 1, spec=FOLLOWERS)
+        async for _ in pages:
+            break
+        producer = pages._Paginator__producer
+        del pages
+        gc.collect()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.assertTrue(producer.cancelled())
+
+    def test_get_page_spec(self):
+        self.assertEqual(
+            get_page_spec(UserApi.get_user_followers).cursor_param, "from_follow_id"
+        )
+        with self.assertRaises(ValueError):
+            get_page_spec(UserApi.get_user)
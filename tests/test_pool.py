@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import tempfile
+import unittest
+
+from yaylib.pool import ClientPool
+from yaylib.ratelimit import RateLimiter, RateLimitRule
+
+
+class TestClientPool(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pool = ClientPool(
+            base_path=tempfile.mkdtemp() + "/",
+            rate_limiter=RateLimiter({"default": RateLimitRule(rate=1, burst=10)}),
+            loglevel=logging.ERROR,
+        )
+
+    async def asyncTearDown(self):
+        await self.pool.aclose()
+
+    def add_client(self, user_id: int):
+        client = self.pool.create_client()
+        client.state.user_id = user_id
+        self.pool.add_client(client)
+        return client
+
+    async def test_shared_resources(self):
+        a = self.add_client(1)
+        b = self.add_client(2)
+        self.assertIs(a.rate_limiter, b.rate_limiter)
+        self.assertIs(a.circuit_breaker, b.circuit_breaker)
+        self.assertIs(self.pool.connector, self.pool.connector)
+        self.assertEqual(self.pool.user_ids, [1, 2])
+        self.assertIs(self.pool[2], b)
+
+    async def test_connector_closed_on_loop_change(self):
+        async def get_connector():
+            return self.pool.connector
+
+        previous = await asyncio.to_thread(asyncio.run, get_connector())
+        connector = self.pool.connector
+        await asyncio.sleep(0)
+        self.assertIsNot(connector, previous)
+        self.assertTrue(previous.closed)
+
+    async def test_reject_logged_out_client(self):
+        with self.assertRaises(ValueError):
+            self.pool.add_client(self.pool.create_client())
+
+    async def test_pick_least_used_account(self):
+        self.add_client(1)
+        self.add_client(2)
+        for _ in range(5):
+            self.pool.rate_limiter.get_bucket("default", 1).reserve()
+        for _ in range(3):
+            self.assertEqual(self.pool.pick().user_id, 2)
+
+    async def test_remove_account(self):
+        self.add_client(1)
+        await self.pool.remove_account(1)
+        self.assertNotIn(1, self.pool)
+        with self.assertRaises(LookupError):
+            self.pool.pick()
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from yaylib.portal import BlockingPortal
+
+
+class TestBlockingPortal(unittest.TestCase):
+    def setUp(self):
+        self.portal = BlockingPortal()
+
+    def tearDown(self):
+        self.portal.stop()
+
+    def test_call_returns_result(self):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        self.assertEqual(self.portal.call(add(1, 2)), 3)
+        self.assertTrue(self.portal.running)
+
+    def test_calls_share_one_loop(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            loops = list(
+                executor.map(lambda _: self.portal.call(current_loop()), range(8))
+            )
+
+        self.assertEqual(len(set(map(id, loops))), 1)
+        self.assertIs(loops[0], self.portal.loop)
+
+    def test_call_propagates_exception(self):
+        async def fail():
+            raise ValueError("error")
+
+        with self.assertRaises(ValueError):
+            self.portal.call(fail())
+
+    def test_call_from_portal_thread(self):
+        async def nested():
+            return self.portal.call(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            self.portal.call(nested())
+
+    def test_stop_runs_shutdown_hooks(self):
+        called = threading.Event()
+
+        async def hook():
+            called.set()
+
+        self.portal.add_shutdown_hook(hook)
+        self.portal.call(asyncio.sleep(0))
+        self.portal.stop()
+
+        self.assertTrue(called.is_set())
+        self.assertFalse(self.portal.running)
@@ -0,0 +1,22 @@
+import unittest
+
+from yaylib.projection import Projection
+
+PAGE = {
+    "posts": [{"id": 1, "user": {"id": 10}, "liked": True}],
+    "next_page_value": None,
+}
+
+
+class TestProjection(unittest.TestCase):
+    def test_project(self):
+        projection = Projection("id", "user.id", "user.nickname", "liked")
+        record = projection.project({"id": 1, "user": {"id": 2}, "liked": False})
+        self.assertEqual(record, (1, 2, None, False))
+        self.assertEqual(record.user_id, 2)
+        self.assertEqual(record.to_dict()["id"], 1)
+
+    def test_response(self):
+        result = Projection("id", "user.id")(PAGE)
+        self.assertEqual(result["posts"][0].user_id, 10)
+        self.assertIsNone(result["next_page_value"])
@@ -0,0 +1,78 @@
+import unittest
+
+from yaylib.proxy import ProxyPool
+
+
+class TestProxyPool(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.pool = ProxyPool(
+            ["http://proxy1:8080", "http://proxy2:8080", "http://proxy3:8080"],
+            failure_threshold=2,
+            ejection_time=60.0,
+            health_check_interval=0,
+        )
+        self.proxy1, self.proxy2, self.proxy3 = self.pool.proxies
+
+    def test_latency_ewma(self):
+        pool = ProxyPool(["http://proxy1:8080"], latency_alpha=0.5)
+        proxy = pool.proxies[0]
+        pool.record_success(proxy, 1.0)
+        pool.record_success(proxy, 3.0)
+        self.assertAlmostEqual(proxy.latency, 2.0)
+
+    def test_select_fastest(self):
+        self.pool.record_success(self.proxy1, 0.5)
+        self.pool.record_success(self.proxy2, 0.1)
+        self.pool.record_success(self.proxy3, 0.3)
+        self.assertIs(self.pool.get_proxy(), self.proxy2)
+
+    def test_sticky_assignment(self):
+        proxy = self.pool.get_proxy(1)
+        for other in self.pool.proxies:
+            if other is not proxy:
+                self.pool.record_success(other, 0.01)
+        self.pool.record_success(proxy, 1.0)
+        self.assertIs(self.pool.get_proxy(1), proxy)
+
+        self.pool.record_failure(proxy)
+        self.pool.record_failure(proxy)
+        self.assertFalse(proxy.healthy)
+        self.assertIsNot(self.pool.get_proxy(1), proxy)
+
+    def test_spread_assignments(self):
+        proxies = {self.pool.get_proxy(user_id) for user_id in range(3)}
+        self.assertEqual(len(proxies), 3)
+
+    def test_ejection_backoff(self):
+        self.pool.record_failure(self.proxy1)
+        self.assertTrue(self.proxy1.healthy)
+        self.pool.record_failure(self.proxy1)
+        self.assertFalse(self.proxy1.healthy)
+        self.assertNotIn(self.proxy1, self.pool.healthy_proxies)
+
+        self.pool.readmit(self.proxy1)
+        self.assertTrue(self.proxy1.healthy)
+        self.pool.record_failure(self.proxy1)
+        self.pool.record_failure(self.proxy1)
+        self.assertEqual(self.proxy1.ejections, 2)
+
+    async def test_health_check_failure(self):
+        pool = ProxyPool(
+            ["http://127.0.0.1:9"],
+            failure_threshold=1,
+            health_check_url="http://127.0.0.1:9/",
+            health_check_timeout=1.0,
+        )
+        self.assertEqual(await pool.check_all(), [False])
+        self.assertFalse(pool.proxies[0].healthy)
+        session = pool._ProxyPool__session
+        await pool.check_all()
+        self.assertIs(pool._ProxyPool__session, session)
+        await pool.aclose()
+        self.assertTrue(session.closed)
+
+    def test_release(self):
+        proxy = self.pool.get_proxy("a")
+        self.assertEqual(proxy.assignments, 1)
+        self.pool.release("a")
+        self.assertEqual(proxy.assignments, 0)
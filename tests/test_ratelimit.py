@@ -1,7 +1,16 @@
+import asyncio
 import unittest
 from unittest.mock import patch
 
 from yaylib.client import RateLimit
+from yaylib.errors import QuotaLimitExceededError
+from yaylib.ratelimit import (
+    RateLimiter,
+    RateLimitRule,
+    TokenBucket,
+    get_endpoint_group,
+)
+from yaylib.responses import ErrorResponse
 
 
 class TestException(Exception):
@@ -39,6 +48,25 @@ class TestRateLimit(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(TestException):
             await ratelimit.wait(TestException())
 
+    def test_retry_after_from_response(self):
+        ratelimit = RateLimit(wait_on_ratelimit=True, max_retries=3, retry_after=300)
+
+        err = QuotaLimitExceededError(ErrorResponse({"retry_in": 42}))
+        self.assertEqual(ratelimit.get_retry_after(err), 42)
+
+        err = QuotaLimitExceededError(ErrorResponse({}))
+        self.assertEqual(ratelimit.get_retry_after(err), 300)
+
+    async def test_wait_with_pause(self):
+        ratelimit = RateLimit(wait_on_ratelimit=True, max_retries=1, retry_after=1)
+        paused = []
+
+        err = QuotaLimitExceededError(ErrorResponse({"retry_in": 7}))
+        await ratelimit.wait(err, paused.append)
+
+        self.assertEqual(paused, [7])
+        self.assertEqual(ratelimit.retries_performed, 1)
+
     @patch("asyncio.sleep", return_value=None)
     async def test_wait_on_ratelimit_disabled(self, mock_sleep):
         ratelimit = RateLimit(wait_on_ratelimit=False, max_retries=2, retry_after=1)
@@ -47,3 +75,138 @@ class TestRateLimit(unittest.IsolatedAsyncioTestCase):
 
         with self.assertRaises(TestException):
             await ratelimit.wait(TestException())
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, burst=3)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertGreater(bucket.reserve(), 0)
+
+    def test_reservations_are_fifo(self):
+        bucket = TokenBucket(rate=10, burst=1)
+        delays = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(delays[0], 0)
+        self.assertEqual(delays, sorted(delays))
+        self.assertAlmostEqual(delays[-1], 0.4, places=2)
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.pause(30)
+        self.assertGreater(bucket.reserve(), 29)
+
+    def test_aimd(self):
+        bucket = TokenBucket(rate=4, burst=1, min_rate=1, max_rate=5)
+
+        bucket.decrease(0.5)
+        self.assertEqual(bucket.rate, 2)
+        bucket.decrease(0.1)
+        self.assertEqual(bucket.rate, 1)
+
+        for _ in range(100):
+            bucket.increase(0.05)
+        self.assertEqual(bucket.rate, 5)
+
+    def test_invalid_rule(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, burst=1)
+
+    async def test_cancelled_acquire_refunds_tokens(self):
+        bucket = TokenBucket(rate=1, burst=1)
+        await bucket.acquire()
+
+        task = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertGreater(bucket.tokens, -0.5)
+
+    async def test_priority_order(self):
+        bucket = TokenBucket(rate=100, burst=1)
+        order = []
+
+        async def acquire(name, priority):
+            await bucket.acquire(priority=priority)
+            order.append(name)
+
+        tasks = [asyncio.create_task(acquire(f"bulk{i}", 2)) for i in range(5)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(acquire("interactive", 0)))
+        await asyncio.gather(*tasks)
+
+        self.assertLess(order.index("interactive"), 3)
+        self.assertEqual(
+            [name for name in order if name != "interactive"],
+            [f"bulk{i}" for i in range(5)],
+        )
+
+    async def test_cancelled_waiter_passes_turn(self):
+        bucket = TokenBucket(rate=100, burst=1)
+        first = asyncio.create_task(bucket.acquire())
+        waiting = asyncio.create_task(bucket.acquire())
+        last = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+
+        await asyncio.wait_for(asyncio.gather(first, last), 1)
+        self.assertTrue(waiting.cancelled())
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    def test_endpoint_group(self):
+        host = "api.yay.space"
+        self.assertEqual(get_endpoint_group("POST", host + "/v3/posts/new"), "posts")
+        self.assertEqual(get_endpoint_group("GET", host + "/v2/posts/search"), "search")
+        self.assertEqual(
+            get_endpoint_group("POST", host + "/v2/users/1/follow"), "follow"
+        )
+        self.assertEqual(get_endpoint_group("GET", host + "/v2/chat_rooms/1"), "chat")
+        self.assertEqual(get_endpoint_group("GET", host + "/v2/users/1"), "default")
+
+    def test_buckets_per_account_and_group(self):
+        limiter = RateLimiter({"posts": RateLimitRule(rate=5, burst=2)})
+        bucket = limiter.get_bucket("posts", 1)
+
+        self.assertIs(limiter.get_bucket("posts", 1), bucket)
+        self.assertIsNot(limiter.get_bucket("posts", 2), bucket)
+        self.assertIsNot(limiter.get_bucket("chat", 1), bucket)
+        self.assertEqual(bucket.rate, 5)
+        self.assertEqual(
+            limiter.get_bucket("__unknown__").rate, limiter.get_rule("default").rate
+        )
+
+    def test_rate_limited_pauses_only_group(self):
+        limiter = RateLimiter()
+        url = "api.yay.space/v3/posts/new"
+
+        limiter.on_rate_limited("POST", url, 1, retry_after=60)
+
+        self.assertGreater(limiter.get_bucket("posts", 1).paused_for, 59)
+        self.assertLess(
+            limiter.get_bucket("posts", 1).rate, limiter.get_rule("posts").rate
+        )
+        self.assertEqual(limiter.get_bucket("chat", 1).paused_for, 0)
+        self.assertEqual(limiter.get_bucket("posts", 2).paused_for, 0)
+
+    def test_pause_account(self):
+        limiter = RateLimiter()
+        limiter.get_bucket("posts", 1)
+
+        limiter.pause_account(1, 60)
+
+        self.assertGreater(limiter.get_bucket("posts", 1).paused_for, 59)
+        self.assertGreater(limiter.get_bucket("chat", 1).paused_for, 59)
+        self.assertEqual(limiter.get_bucket("posts", 2).paused_for, 0)
+
+    @patch("asyncio.sleep", return_value=None)
+    async def test_acquire(self, mock_sleep):
+        limiter = RateLimiter({"posts": RateLimitRule(rate=1, burst=1)})
+        url = "api.yay.space/v3/posts/new"
+
+        self.assertEqual(await limiter.acquire("POST", url, 1), 0)
+        self.assertGreater(await limiter.acquire("POST", url, 1), 0)
+        self.assertEqual(await limiter.acquire("POST", url, 2), 0)
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from yaylib.errors import HTTPInternalServerError, UserNotFoundError
+from yaylib.responses import ErrorResponse
+from yaylib.retry import RetryBudget, RetryPolicy
+
+
+def server_error():
+    response = MagicMock()
+    response.status = 500
+    return HTTPInternalServerError(response)
+
+
+class TestRetryPolicy(unittest.IsolatedAsyncioTestCase):
+    async def test_retry_idempotent_method(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry("GET", server_error(), 0, 0))
+        self.assertTrue(policy.should_retry("DELETE", asyncio.TimeoutError(), 1, 0))
+        self.assertFalse(policy.should_retry("GET", server_error(), 2, 0))
+
+    async def test_no_retry_non_idempotent_method(self):
+        policy = RetryPolicy()
+        self.assertFalse(policy.should_retry("POST", server_error(), 0, 0))
+        self.assertFalse(policy.should_retry("POST", asyncio.TimeoutError(), 0, 0))
+
+    async def test_no_retry_client_error(self):
+        policy = RetryPolicy()
+        err = UserNotFoundError(ErrorResponse({"error_code": -5}))
+        self.assertFalse(policy.should_retry("GET", err, 0, 0))
+
+    async def test_deadline(self):
+        policy = RetryPolicy(deadline=1.0)
+        deadline = policy.get_deadline()
+        self.assertTrue(
+            policy.should_retry("GET", server_error(), 0, 0.5, deadline=deadline)
+        )
+        self.assertFalse(
+            policy.should_retry("GET", server_error(), 0, 2.0, deadline=deadline)
+        )
+
+    async def test_budget(self):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, ttl=10)
+        policy = RetryPolicy(max_retries=10, budget=budget)
+        for _ in range(4):
+            budget.record_request()
+        self.assertTrue(policy.should_retry("GET", server_error(), 0, 0))
+        self.assertTrue(policy.should_retry("GET", server_error(), 1, 0))
+        self.assertFalse(policy.should_retry("GET", server_error(), 2, 0))
+        self.assertEqual(budget.available, 0)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter="none")
+        self.assertEqual(policy.get_backoff(0), 1)
+        self.assertEqual(policy.get_backoff(2), 4)
+        self.assertEqual(policy.get_backoff(10), 5)
+
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter="full")
+        for attempt in range(5):
+            self.assertLessEqual(policy.get_backoff(attempt), min(5, 2**attempt))
+
+        with self.assertRaises(ValueError):
+            RetryPolicy(jitter="random")
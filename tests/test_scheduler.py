@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from yaylib.scheduler import (
+    BULK,
+    INTERACTIVE,
+    NORMAL,
+    PriorityClass,
+    RequestScheduler,
+    get_request_priority,
+    request_priority,
+)
+
+
+class TestRequestPriority(unittest.TestCase):
+    def test_default_priority(self):
+        url = "api.yay.space/v3/chat_rooms/1/messages/new"
+        self.assertEqual(get_request_priority("POST", url), INTERACTIVE)
+        self.assertEqual(
+            get_request_priority("GET", "api.yay.space/v2/users/1"), NORMAL
+        )
+
+    def test_context_priority(self):
+        with request_priority(BULK):
+            self.assertEqual(
+                get_request_priority("GET", "api.yay.space/v1/users"), BULK
+            )
+        self.assertEqual(get_request_priority("GET", "api.yay.space/v1/users"), NORMAL)
+
+
+class TestRequestScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_class_concurrency(self):
+        scheduler = RequestScheduler(
+            {BULK: PriorityClass(priority=2, max_concurrency=2)}
+        )
+        running = []
+
+        async def request():
+            async with scheduler.slot(BULK):
+                running.append(scheduler.get_active(BULK))
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[request() for _ in range(6)])
+        self.assertEqual(max(running), 2)
+        self.assertEqual(scheduler.active, 0)
+
+    async def test_interactive_not_blocked_by_bulk(self):
+        scheduler = RequestScheduler(max_concurrency=8)
+        release = asyncio.Event()
+
+        async def bulk():
+            async with scheduler.slot(BULK):
+                await release.wait()
+
+        tasks = [asyncio.create_task(bulk()) for _ in range(100)]
+        await asyncio.sleep(0)
+        self.assertEqual(scheduler.get_waiting(BULK), 96)
+        await asyncio.wait_for(scheduler.acquire(INTERACTIVE), timeout=1)
+        scheduler.release(INTERACTIVE)
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_priority_order(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        order = []
+        await scheduler.acquire(NORMAL)
+
+        async def request(name):
+            async with scheduler.slot(name):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(request(name)) for name in (BULK, NORMAL, INTERACTIVE)
+        ]
+        await asyncio.sleep(0)
+        scheduler.release(NORMAL)
+        await asyncio.gather(*tasks)
+        self.assertEqual(order, [INTERACTIVE, NORMAL, BULK])
+
+    async def test_cancel_waiter(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        await scheduler.acquire(NORMAL)
+        task = asyncio.create_task(scheduler.acquire(NORMAL))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        scheduler.release(NORMAL)
+        self.assertEqual(scheduler.active, 0)
+        self.assertEqual(scheduler.get_waiting(NORMAL), 0)
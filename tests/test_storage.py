@@ -1,4 +1,5 @@
 import os
+import sqlite3
 import unittest
 
 from yaylib.state import LocalUser, Storage
@@ -120,3 +121,58 @@ class TestStorage(unittest.TestCase):
 
         user = self.storage.get_user(test_user.user_id)
         self.assertIsNone(user)
+
+    def test_migrate_legacy_table(self):
+        self.clean()
+        conn = sqlite3.connect(db_filename)
+        conn.execute("""
+            CREATE TABLE users (
+                id INTEGER PRIMARY KEY,
+                email TEXT NOT NULL,
+                device_uuid TEXT NOT NULL,
+                access_token TEXT NOT NULL,
+                refresh_token TEXT NOT NULL
+            );
+            """)
+        conn.execute(
+            "INSERT INTO users VALUES (?, ?, ?, ?, ?)",
+            (
+                test_user.user_id,
+                test_user.email,
+                test_user.device_uuid,
+                test_user.access_token,
+                test_user.refresh_token,
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        storage = Storage(db_filename)
+        user = storage.get_user(test_user.user_id)
+
+        self.assertIsNotNone(user)
+        self.assertEqual(user.access_token, test_user.access_token)
+        self.assertEqual(user.access_token_expires_at, 0)
+
+        result = storage.update_user(test_user.user_id, access_token_expires_at=100)
+        self.assertTrue(result)
+        self.assertEqual(
+            storage.get_user(test_user.user_id).access_token_expires_at, 100
+        )
+        self.assertEqual(storage.get_user(test_user.user_id).client_ip, "")
+
+    def test_update_client_ip(self):
+        result = self.storage.create_user(test_user)
+        self.assertTrue(result)
+
+        result = self.storage.update_user(
+            test_user.user_id, client_ip="203.0.113.1", client_ip_expires_at=200
+        )
+        self.assertTrue(result)
+
+        user = self.storage.get_user(test_user.user_id)
+
+        self.assertIsNotNone(user)
+        self.assertEqual(user.client_ip, "203.0.113.1")
+        self.assertEqual(user.client_ip_expires_at, 200)
+        self.assertEqual(user.access_token, test_user.access_token)
@@ -25,21 +25,45 @@ __copyright__ = "Copyright (c) 2023 ekkx"
 # 1.0.0.post1 Post Release
 __version__ = "1.5.1"
 
+from .cache import *
+from .circuit import *
 from .client import Client
 from .constants import *
+from .crawl import *
 from .errors import *
+from .identity import *
+from .loader import *
 from .models import *
+from .pagination import *
+from .pool import ClientPool
+from .projection import *
+from .proxy import *
+from .ratelimit import *
 from .responses import *
+from .retry import *
+from .scheduler import *
 from .state import State
 from .utils import mention
 from .ws import *
 
 __all__ = (
+    "cache",
+    "circuit",
     "Client",
     "constants",
+    "crawl",
     "errors",
+    "identity",
+    "loader",
     "models",
+    "pagination",
+    "ClientPool",
+    "projection",
+    "proxy",
+    "ratelimit",
     "responses",
+    "retry",
+    "scheduler",
     "State",
     "mention",
     "ws",
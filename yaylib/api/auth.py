@@ -28,9 +28,10 @@ from typing import Optional
 from cryptography import fernet
 
 from .. import config
+from ..projection import MODELS, response_format
 from ..responses import LoginUpdateResponse, LoginUserResponse, Response, TokenResponse
 from ..state import LocalUser
-from ..utils import md5
+from ..utils import get_expires_at, md5
 
 
 class AuthApi:
@@ -149,12 +150,13 @@ class AuthApi:
         if two_fa_code is not None:
             payload["two_fa_code"] = two_fa_code
 
-        response: LoginUserResponse = await self.__client.request(
-            "POST",
-            config.API_HOST + "/v3/users/login_with_email",
-            json=payload,
-            return_type=LoginUserResponse,
-        )
+        with response_format(MODELS):
+            response: LoginUserResponse = await self.__client.request(
+                "POST",
+                config.API_HOST + "/v3/users/login_with_email",
+                json=payload,
+                return_type=LoginUserResponse,
+            )
 
         self.__client.state.set_user(
             LocalUser(
@@ -163,6 +165,9 @@ class AuthApi:
                 device_uuid=self.__client.device_uuid,
                 access_token=response.access_token,
                 refresh_token=response.refresh_token,
+                access_token_expires_at=get_expires_at(response.expires_in),
+                client_ip=self.__client.state.client_ip,
+                client_ip_expires_at=self.__client.state.client_ip_expires_at,
             )
         )
         self.__client.state.save()
@@ -74,6 +74,7 @@ class CallApi:
             "GET",
             config.API_HOST + "/v1/calls/bgm",
             return_type=BgmsResponse,
+            persistent=True,
         )
 
     async def get_call(self, call_id: int) -> ConferenceCallResponse:
@@ -142,6 +143,7 @@ class CallApi:
             config.API_HOST + "/v1/games/apps",
             params=params,
             return_type=GamesResponse,
+            persistent=True,
         )
 
     async def get_genres(self, **params) -> GenresResponse:
@@ -159,6 +161,7 @@ class CallApi:
             config.API_HOST + "/v1/genres",
             params=params,
             return_type=GenresResponse,
+            persistent=True,
         )
 
     async def get_group_calls(self, **params) -> PostsResponse:
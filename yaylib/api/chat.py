@@ -292,6 +292,7 @@ class ChatApi:
             "GET",
             config.API_HOST + "/v2/sticker_packs",
             return_type=StickerPacksResponse,
+            persistent=True,
         )
 
     async def get_total_chat_requests(self) -> TotalChatRequestResponse:
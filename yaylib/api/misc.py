@@ -33,6 +33,7 @@ from PIL import Image
 from .. import config
 from ..constants import ImageType
 from ..models import Attachment
+from ..projection import MODELS, response_format
 from ..responses import (
     ApplicationConfigResponse,
     BanWordsResponse,
@@ -313,9 +314,10 @@ class MiscApi:
             _files.append(thumbnail_attachment)
 
         file_names = [x.filename for x in _files]
-        res_presigned_url: PresignedUrlsResponse = (
-            await self.get_file_upload_presigned_urls(file_names)
-        )
+        with response_format(MODELS):
+            res_presigned_url: PresignedUrlsResponse = (
+                await self.get_file_upload_presigned_urls(file_names)
+            )
         presigned_urls = res_presigned_url.presigned_urls
 
         res_upload: List[Attachment] = []
@@ -374,9 +376,10 @@ class MiscApi:
         uuid = generate_uuid(False)[:16]
         filename = f"{uuid}_{int(datetime.now().timestamp())}{extension}"
 
-        res_presigned_url: PresignedUrlResponse = (
-            await self.get_old_file_upload_presigned_url(filename)
-        )
+        with response_format(MODELS):
+            res_presigned_url: PresignedUrlResponse = (
+                await self.get_old_file_upload_presigned_url(filename)
+            )
         presigned_url = res_presigned_url.presigned_url
 
         with open(video_path, "br") as f:
@@ -400,6 +403,7 @@ class MiscApi:
             "GET",
             config.CONFIG_HOST + "/api/apps/yay",
             return_type=ApplicationConfigResponse,
+            persistent=True,
         )
 
     async def get_banned_words(self, country_code: str = "jp") -> BanWordsResponse:
@@ -415,6 +419,7 @@ class MiscApi:
             "GET",
             config.CONFIG_HOST + f"/{country_code}/api/v2/banned_words",
             return_type=BanWordsResponse,
+            persistent=True,
         )
 
     async def get_popular_words(self, country_code: str = "jp") -> PopularWordsResponse:
@@ -430,4 +435,5 @@ class MiscApi:
             "GET",
             config.CONFIG_HOST + f"/{country_code}/api/apps/yay/popular_words",
             return_type=PopularWordsResponse,
+            persistent=True,
         )
@@ -0,0 +1,390 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from .codec import JSONCodec, get_json_codec
+
+__all__ = [
+    "PersistentCache",
+    "ResponseCache",
+]
+
+# (ファミリー, リソース識別子)
+CacheTag = Tuple[str, Optional[int]]
+
+DEFAULT_CACHE_TTLS = {
+    "user": 60.0,
+    "group": 120.0,
+    "post": 30.0,
+    "chat_room": 30.0,
+    "group_categories": 3600.0,
+}
+
+# キャッシュ対象となる GET エンドポイント
+CACHE_PATTERNS = (
+    ("user", re.compile(r"^/v\d+/users/(?:info/)?(\d+)$")),
+    ("group", re.compile(r"^/v\d+/groups/(\d+)$")),
+    ("post", re.compile(r"^/v\d+/posts/(\d+)$")),
+    ("chat_room", re.compile(r"^/v\d+/chat_rooms/(\d+)$")),
+    ("group_categories", re.compile(r"^/v\d+/groups/categories$")),
+)
+
+# 更新系リクエストのパスから、影響を受けるリソースを判定する
+INVALIDATION_PATTERNS = (
+    ("user", re.compile(r"^/v\d+/users/(?:info/)?(\d+)?")),
+    ("group", re.compile(r"^/v\d+/groups/(\d+)")),
+    ("post", re.compile(r"^/v\d+/posts/(\d+)?")),
+    ("chat_room", re.compile(r"^/v\d+/chat_rooms/(\d+)")),
+)
+
+# 更新系リクエストのパラメータから、影響を受けるリソースを判定する
+INVALIDATION_KEYS = {
+    "user": ("user_id", "user_ids", "user_ids[]"),
+    "group": ("group_id", "group_ids"),
+    "post": ("post_id", "post_ids", "posts_ids", "post_ids[]"),
+    "chat_room": ("chat_room_id", "chat_room_ids", "room_id"),
+}
+
+
+def _get_path(url: str) -> str:
+    return urlsplit(url if "://" in url else "https://" + url).path
+
+
+def _iter_ids(value: Any) -> List[int]:
+    values = value if isinstance(value, (list, tuple)) else [value]
+    ids = []
+    for v in values:
+        try:
+            ids.append(int(v))
+        except (TypeError, ValueError):
+            continue
+    return ids
+
+
+def get_cache_tag(url: str) -> Optional[CacheTag]:
+    """GET リクエストの URL からキャッシュのファミリーとリソース識別子を判定する
+
+    Args:
+        url (str):
+
+    Returns:
+        Optional[CacheTag]: キャッシュ対象外の場合は None
+    """
+    path = _get_path(url)
+    for family, pattern in CACHE_PATTERNS:
+        match = pattern.match(path)
+        if match:
+            return family, int(match.group(1)) if match.groups() else None
+    return None
+
+
+def get_invalidation_tags(
+    url: str,
+    params: Optional[dict] = None,
+    json: Optional[dict] = None,
+    user_id: int = 0,
+) -> Set[CacheTag]:
+    """更新系リクエストによって無効化されるリソースを判定する
+
+    Args:
+        url (str):
+        params (dict, optional):
+        json (dict, optional):
+        user_id (int): ログインしているユーザーの識別子
+
+    Returns:
+        Set[CacheTag]:
+    """
+    path = _get_path(url)
+    tags: Set[CacheTag] = set()
+    for family, pattern in INVALIDATION_PATTERNS:
+        match = pattern.match(path)
+        if match is None:
+            continue
+        if match.group(1) is not None:
+            tags.add((family, int(match.group(1))))
+        elif family == "user" and user_id:
+            tags.add((family, user_id))  # 自分のプロフィールの更新
+    for payload in (params, json):
+        if not isinstance(payload, dict):
+            continue
+        for family, keys in INVALIDATION_KEYS.items():
+            for key in keys:
+                if key in payload:
+                    tags.update((family, i) for i in _iter_ids(payload[key]))
+    return tags
+
+
+class ResponseCache:
+    """GET リクエストのレスポンスを保持する TTL 付きの LRU キャッシュ
+
+    Note:
+        同じクライアントから更新系のリクエストを送信すると、影響を受けるリソースのキャッシュは破棄される
+
+    Args:
+        maxsize (int): 保持するレスポンスの最大件数
+        ttls (Dict[str, float], optional): ファミリーごとの有効期間（秒）。0 の場合はキャッシュしない
+    """
+
+    def __init__(self, maxsize=1024, ttls: Optional[Dict[str, float]] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.__maxsize = maxsize
+        self.__ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.__entries: OrderedDict[Hashable, Tuple[float, CacheTag, Any]] = (
+            OrderedDict()
+        )
+        self.__tags: Dict[CacheTag, Set[Hashable]] = {}
+        self.__generation = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def hits(self) -> int:
+        """キャッシュヒット数"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """キャッシュミス数"""
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """容量超過によって破棄された件数"""
+        return self.__evictions
+
+    @property
+    def generation(self) -> int:
+        """キャッシュが無効化されるたびに増加するカウンタ"""
+        return self.__generation
+
+    def is_cacheable(self, url: str) -> bool:
+        """URL がキャッシュ対象かどうか"""
+        tag = get_cache_tag(url)
+        return tag is not None and self.__ttls.get(tag[0], 0) > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """キャッシュされたレスポンスを取得する
+
+        Args:
+            key (Hashable):
+            default (Any): キャッシュが存在しない場合の戻り値
+
+        Returns:
+            Any:
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self.__remove(key)
+                self.__misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[2]
+
+    def put(
+        self,
+        key: Hashable,
+        url: str,
+        value: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """レスポンスをキャッシュする
+
+        Args:
+            key (Hashable):
+            url (str): リクエストの URL
+            value (Any):
+            generation (int, optional): リクエスト送信前の `generation`。
+                送信中にキャッシュが無効化された場合は保存しない
+        """
+        tag = get_cache_tag(url)
+        if tag is None or value is None:
+            return
+        ttl = self.__ttls.get(tag[0], 0)
+        if ttl <= 0:
+            return
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = (time.monotonic() + ttl, tag, value)
+            self.__tags.setdefault(tag, set()).add(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__remove(next(iter(self.__entries)))
+                self.__evictions += 1
+
+    def __remove(self, key: Hashable) -> None:
+        _, tag, _ = self.__entries.pop(key)
+        keys = self.__tags.get(tag)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.__tags[tag]
+
+    def invalidate(self, family: str, resource_id: Optional[int] = None) -> None:
+        """リソースのキャッシュを破棄する
+
+        Args:
+            family (str): `user`、`group`、`post`、`chat_room`、`group_categories` など
+            resource_id (int, optional): None の場合はファミリー全体を破棄する
+        """
+        with self.__lock:
+            self.__generation += 1
+            if resource_id is not None:
+                tags = [(family, resource_id)]
+            else:
+                tags = [tag for tag in self.__tags if tag[0] == family]
+            for tag in tags:
+                for key in list(self.__tags.get(tag, ())):
+                    self.__remove(key)
+
+    def invalidate_request(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        user_id: int = 0,
+    ) -> None:
+        """更新系リクエストの影響を受けるリソースのキャッシュを破棄する"""
+        for family, resource_id in get_invalidation_tags(url, params, json, user_id):
+            self.invalidate(family, resource_id)
+
+    def clear(self) -> None:
+        """すべてのキャッシュを破棄する"""
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            self.__tags.clear()
+
+
+class PersistentCache:
+    """ほとんど変化しない設定系エンドポイントのレスポンスをディスクに保存するキャッシュ
+
+    Note:
+        有効期間 `ttl` を過ぎたレスポンスも `max_stale` 秒までは返却され、
+        その間にクライアントがバックグラウンドで再取得する (stale-while-revalidate)。
+        既定では無効のため、使用する場合はクライアントに指定する
+
+    Examples:
+        >>> client = yaylib.Client(persistent_cache=True)
+
+    Args:
+        path (str): レスポンスを保存するディレクトリ
+        ttl (float): レスポンスの有効期間（秒）
+        max_stale (float): 有効期間を過ぎたレスポンスを返却する期間（秒）
+        json_codec (str | JSONCodec, optional): 保存に使用する JSON コーデック
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl=60 * 60 * 6,
+        max_stale=60 * 60 * 24 * 7,
+        json_codec: Optional[str | JSONCodec] = None,
+    ) -> None:
+        self.__path = path
+        self.__ttl = ttl
+        self.__max_stale = max_stale
+        self.__json_codec = get_json_codec(json_codec)
+
+    @property
+    def path(self) -> str:
+        """レスポンスを保存するディレクトリ"""
+        return self.__path
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """キャッシュのキーを生成する"""
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def __get_filename(self, key: str) -> str:
+        return os.path.join(self.__path, key + ".json")
+
+    def get(self, key: str) -> Optional[Tuple[Any, bool]]:
+        """保存されたレスポンスを取得する
+
+        Args:
+            key (str):
+
+        Returns:
+            Optional[Tuple[Any, bool]]: レスポンスと、有効期間内かどうか。
+                存在しない、もしくは `max_stale` を過ぎた場合は None
+        """
+        try:
+            with open(self.__get_filename(key), "rb") as f:
+                entry = self.__json_codec.loads(f.read())
+            age = time.time() - entry["stored_at"]
+            data = entry["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if age > self.__ttl + self.__max_stale:
+            return None
+        return data, age <= self.__ttl
+
+    def put(self, key: str, data: Any) -> None:
+        """レスポンスを保存する
+
+        Args:
+            key (str):
+            data (Any): JSON に変換可能なレスポンス
+        """
+        if data is None:
+            return
+        os.makedirs(self.__path, exist_ok=True)
+        body = self.__json_codec.encode({"stored_at": time.time(), "data": data})
+        fd, tmp = tempfile.mkstemp(dir=self.__path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(tmp, self.__get_filename(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def clear(self) -> None:
+        """保存されたすべてのレスポンスを削除する"""
+        if not os.path.isdir(self.__path):
+            return
+        for filename in os.listdir(self.__path):
+            if filename.endswith(".json"):
+                os.remove(os.path.join(self.__path, filename))
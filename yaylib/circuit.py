@@ -0,0 +1,252 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .errors import CircuitOpenError
+from .ratelimit import get_endpoint_group
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+]
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_circuit_failure(err: BaseException) -> bool:
+    """例外がホストの障害を示すものかどうか
+
+    Args:
+        err (BaseException):
+
+    Returns:
+        bool: 接続エラー、タイムアウト、5xx の場合は True
+    """
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500
+    return isinstance(err, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+class CircuitBreaker:
+    """ホストへのリクエストの失敗が続いた場合に、一定時間リクエストを遮断するクラス
+
+    Note:
+        連続した失敗が `failure_threshold` 回に達すると開状態となり、リクエストは送信されずに
+        `CircuitOpenError` で即座に失敗する。`recovery_timeout` 秒後に半開状態となり、
+        `half_open_max_calls` 件の試行リクエストが成功すれば閉状態に戻る
+
+    Args:
+        name (str): サーキットブレーカーの名前
+        failure_threshold (int): 開状態に移行する連続失敗回数
+        recovery_timeout (float): 開状態から半開状態に移行するまでの秒数
+        half_open_max_calls (int): 半開状態で同時に許可する試行リクエスト数
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold=5,
+        recovery_timeout=30.0,
+        half_open_max_calls=1,
+    ) -> None:
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_calls must be at least 1."
+            )
+        self.__name = name
+        self.__failure_threshold = failure_threshold
+        self.__recovery_timeout = recovery_timeout
+        self.__half_open_max_calls = half_open_max_calls
+        self.__state = CLOSED
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__probes = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """サーキットブレーカーの名前"""
+        return self.__name
+
+    @property
+    def state(self) -> str:
+        """`closed`、`open`、`half_open` のいずれか"""
+        with self.__lock:
+            return self.__current_state(time.monotonic())
+
+    @property
+    def retry_after(self) -> float:
+        """半開状態に移行するまでの秒数"""
+        with self.__lock:
+            return self.__retry_after(time.monotonic())
+
+    def __current_state(self, now: float) -> str:
+        if self.__state == OPEN and now >= self.__opened_at + self.__recovery_timeout:
+            self.__state = HALF_OPEN
+            self.__probes = 0
+        return self.__state
+
+    def __retry_after(self, now: float) -> float:
+        if self.__state != OPEN:
+            return 0.0
+        return max(0.0, self.__opened_at + self.__recovery_timeout - now)
+
+    def __open(self, now: float) -> None:
+        self.__state = OPEN
+        self.__opened_at = now
+        self.__probes = 0
+
+    def acquire(self) -> bool:
+        """リクエストの送信許可を得る
+
+        Returns:
+            bool: 半開状態での試行リクエストの場合は True
+
+        Raises:
+            CircuitOpenError: 開状態、もしくは試行リクエストの枠が埋まっている場合
+        """
+        with self.__lock:
+            now = time.monotonic()
+            state = self.__current_state(now)
+            if state == CLOSED:
+                return False
+            if state == HALF_OPEN and self.__probes < self.__half_open_max_calls:
+                self.__probes += 1
+                return True
+            retry_after = self.__retry_after(now)
+        raise CircuitOpenError(self.__name, retry_after)
+
+    def record_success(self, probe=False) -> None:
+        """リクエストの成功を記録する
+
+        Args:
+            probe (bool): `acquire()` の戻り値
+        """
+        with self.__lock:
+            if probe and self.__state == HALF_OPEN:
+                self.__state = CLOSED
+                self.__probes = 0
+            if self.__state == CLOSED:
+                self.__failures = 0
+
+    def record_failure(self, probe=False) -> None:
+        """リクエストの失敗を記録する
+
+        Args:
+            probe (bool): `acquire()` の戻り値
+        """
+        with self.__lock:
+            now = time.monotonic()
+            if probe and self.__state == HALF_OPEN:
+                self.__open(now)
+            elif self.__state == CLOSED:
+                self.__failures += 1
+                if self.__failures >= self.__failure_threshold:
+                    self.__open(now)
+
+    def release(self, probe=False) -> None:
+        """成否が判定できなかったリクエストの送信許可を返却する
+
+        Args:
+            probe (bool): `acquire()` の戻り値
+        """
+        with self.__lock:
+            if probe and self.__state == HALF_OPEN:
+                self.__probes = max(0, self.__probes - 1)
+
+    def reset(self) -> None:
+        """閉状態に戻す"""
+        with self.__lock:
+            self.__state = CLOSED
+            self.__failures = 0
+            self.__probes = 0
+
+
+class CircuitBreakerRegistry:
+    """ホストごと（任意でエンドポイントグループごと）のサーキットブレーカーを管理するクラス
+
+    Args:
+        failure_threshold (int): 開状態に移行する連続失敗回数
+        recovery_timeout (float): 開状態から半開状態に移行するまでの秒数
+        half_open_max_calls (int): 半開状態で同時に許可する試行リクエスト数
+        per_endpoint (bool): ホストに加えてエンドポイントグループごとに分けるかどうか
+    """
+
+    def __init__(
+        self,
+        failure_threshold=5,
+        recovery_timeout=30.0,
+        half_open_max_calls=1,
+        per_endpoint=False,
+    ) -> None:
+        self.__options = {
+            "failure_threshold": failure_threshold,
+            "recovery_timeout": recovery_timeout,
+            "half_open_max_calls": half_open_max_calls,
+        }
+        self.__per_endpoint = per_endpoint
+        self.__breakers: Dict[str, CircuitBreaker] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def breakers(self) -> Dict[str, CircuitBreaker]:
+        """作成済みのサーキットブレーカー"""
+        with self.__lock:
+            return dict(self.__breakers)
+
+    def get_breaker(self, method: str, url: str) -> CircuitBreaker:
+        """URL に対応するサーキットブレーカーを取得する
+
+        Args:
+            method (str):
+            url (str):
+
+        Returns:
+            CircuitBreaker:
+        """
+        name = urlsplit(url if "://" in url else "https://" + url).netloc
+        if self.__per_endpoint:
+            name += "/" + get_endpoint_group(method, url)
+        breaker = self.__breakers.get(name)
+        if breaker is None:
+            with self.__lock:
+                breaker = self.__breakers.setdefault(
+                    name, CircuitBreaker(name, **self.__options)
+                )
+        return breaker
+
+    def reset(self) -> None:
+        """すべてのサーキットブレーカーを閉状態に戻す"""
+        with self.__lock:
+            for breaker in self.__breakers.values():
+                breaker.reset()
@@ -23,11 +23,14 @@ SOFTWARE.
 """
 
 import asyncio
+import functools
 import logging
 import os
-import random
+import time
+import warnings
+import weakref
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple, TypeVar
 
 import aiohttp
 
@@ -42,19 +45,37 @@ from .api.post import PostApi
 from .api.review import ReviewApi
 from .api.thread import ThreadApi
 from .api.user import UserApi
+from .cache import PersistentCache, ResponseCache
+from .circuit import CircuitBreakerRegistry, is_circuit_failure
+from .codec import JSONCodec, get_json_codec
 from .config import API_HOST, API_VERSION_NAME
 from .device import Device
 from .errors import (
     AccessTokenExpiredError,
     AccessTokenInvalidError,
-    HTTPInternalServerError,
+    HTTPError,
+    HTTPRateLimitError,
     QuotaLimitExceededError,
     TooManyRequestsError,
     UnauthorizedError,
-    raise_for_code,
+    raise_for_json,
     raise_for_status,
 )
+from .identity import IdentityMap
+from .loader import BatchLoader
 from .models import Attachment, CreateGroupQuota, Model, Post, SharedUrl, ThreadInfo
+from .portal import BlockingPortal
+from .projection import (
+    MODELS,
+    RAW,
+    SLIM,
+    Projection,
+    get_response_format,
+    get_slim_factory,
+    response_format as use_response_format,
+)
+from .proxy import Proxy, ProxyPool, is_proxy_failure
+from .ratelimit import RateLimit, RateLimiter
 from .responses import (
     ActiveFollowingsResponse,
     ActivitiesResponse,
@@ -121,67 +142,21 @@ from .responses import (
     VoteSurveyResponse,
     WebSocketTokenResponse,
 )
+from .retry import RetryBudget, RetryPolicy
+from .scheduler import RequestScheduler, get_request_priority
 from .state import LocalUser, State
-from .utils import CustomFormatter, filter_dict, generate_jwt
+from .utils import (
+    CustomFormatter,
+    filter_dict,
+    generate_jwt,
+    get_expires_at,
+    make_hashable,
+)
 from .ws import Intents, WebSocketInteractor
 
 __all__ = ["Client"]
 
-
-class RateLimit:
-    """レート制限を管理するクラス"""
-
-    def __init__(
-        self, wait_on_ratelimit: bool, max_retries: int, retry_after=60 * 5
-    ) -> None:
-        self.__wait_on_ratelimit = wait_on_ratelimit
-        self.__max_retries = max_retries
-        self.__retries_performed = 0
-        self.__retry_after = retry_after
-
-    @property
-    def retries_performed(self) -> int:
-        """レート制限によるリトライ回数
-
-        Returns:
-            int: リトライ回数
-        """
-        return self.__retries_performed
-
-    @retries_performed.setter
-    def retries_performed(self, value: int) -> None:
-        self.__retries_performed = min(value, self.__max_retries)
-
-    @property
-    def max_retries(self) -> int:
-        """レート制限によるリトライ回数の上限
-
-        Returns:
-            int: リトライ回数の上限
-        """
-        return self.__max_retries
-
-    @property
-    def max_retries_reached(self) -> bool:
-        """リトライ回数上限に達したか否か"""
-        return not self.__wait_on_ratelimit or (
-            self.__retries_performed >= self.__max_retries
-        )
-
-    def reset(self) -> None:
-        """レート制限をリセットする"""
-        self.__retries_performed = 0
-
-    async def wait(self, err: Exception) -> None:
-        """レート制限が解除されるまで待機する
-
-        Raises:
-            Exception: リトライ回数の上限でスロー
-        """
-        if not self.__wait_on_ratelimit or self.max_retries_reached:
-            raise err
-        await asyncio.sleep(self.__retry_after)
-        self.__retries_performed += 1
+T = TypeVar("T")
 
 
 class HeaderManager:
@@ -194,7 +169,6 @@ class HeaderManager:
         self.__user_agent = device.get_user_agent()
         self.__device_info = device.get_device_info()
         self.__app_version = API_VERSION_NAME
-        self.__client_ip = ""
         self.__connection_speed = "0 kbps"
         self.__connection_type = "wifi"
         self.__content_type = "application/json;charset=UTF-8"
@@ -222,11 +196,11 @@ class HeaderManager:
     @property
     def client_ip(self) -> str:
         """クライアント IP アドレス"""
-        return self.__client_ip
+        return self.__state.client_ip
 
     @client_ip.setter
     def client_ip(self, value: str) -> None:
-        self.__client_ip = value
+        self.__state.client_ip = value
 
     @property
     def connection_speed(self) -> str:
@@ -252,7 +226,7 @@ class HeaderManager:
             "X-App-Version": self.__app_version,
             "X-Device-Info": self.__device_info,
             "X-Device-UUID": self.__state.device_uuid,
-            "X-Client-IP": self.__client_ip,
+            "X-Client-IP": self.client_ip,
             "X-Connection-Type": self.__connection_type,
             "X-Connection-Speed": self.__connection_speed,
             "Accept-Language": self.__locale,
@@ -262,8 +236,8 @@ class HeaderManager:
         if jwt_required:
             headers.update({"X-Jwt": generate_jwt()})
 
-        if self.__client_ip != "":
-            headers.update({"X-Client-IP": self.__client_ip})
+        if self.client_ip != "":
+            headers.update({"X-Client-IP": self.client_ip})
 
         if self.__state.access_token != "":
             headers.update({"Authorization": "Bearer " + self.__state.access_token})
@@ -283,27 +257,91 @@ class Client(WebSocketInteractor):
         *,
         intents: Optional[Intents] = None,
         proxy_url: Optional[str] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        max_connections=100,
+        max_connections_per_host=30,
+        keepalive_timeout=30,
+        dns_cache_ttl=300,
         timeout=30,
         max_retries=3,
         backoff_factor=1.5,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreakerRegistry] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        coalesce_requests=True,
+        response_cache: Optional[ResponseCache] = None,
+        persistent_cache: Optional[PersistentCache | bool] = None,
+        auto_refresh_token=False,
+        token_refresh_margin=300,
+        client_ip_ttl=60 * 60 * 6,
         wait_on_ratelimit=True,
         max_ratelimit_retries=15,
-        min_delay=0.3,
-        max_delay=1.2,
+        rate_limiter: Optional[RateLimiter] = None,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
         base_path=current_path + "/.config/",
         state: Optional[State] = None,
+        json_codec: Optional[str | JSONCodec] = None,
+        response_format: str | Projection = MODELS,
+        identity_map: Optional[IdentityMap | bool] = None,
+        use_portal=True,
         loglevel=logging.INFO,
     ) -> None:
-        super().__init__(self, intents)
+        self.__json_codec = get_json_codec(json_codec)
+        self.__response_format = response_format
+        self.__identity_map: Optional[IdentityMap] = None
+        if isinstance(identity_map, IdentityMap):
+            self.__identity_map = identity_map
+        elif identity_map:
+            self.__identity_map = IdentityMap()
+
+        super().__init__(self, intents, self.__json_codec)
+
+        if proxy_url is not None and proxy_pool is not None:
+            raise ValueError("proxy_url and proxy_pool cannot be used together.")
 
         self.__proxy_url = proxy_url
+        self.__proxy_pool = proxy_pool
+        self.__proxy_key = object()
+        self.__client_ip_proxy: Optional[Proxy] = None
         self.__timeout = timeout
-        self.__session = None
-        self.__min_delay = min_delay
-        self.__max_delay = max_delay
-        self.__last_request_ts = 0
-        self.__max_retries = max_retries
-        self.__backoff_factor = backoff_factor
+        self.__connector = connector
+        self.__connector_options = {
+            "limit": max_connections,
+            "limit_per_host": max_connections_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": dns_cache_ttl,
+        }
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__closing_sessions: Set[asyncio.Task] = set()
+        self.__portal: Optional[BlockingPortal] = None
+        if use_portal:
+            self.__portal = BlockingPortal()
+            self.__portal.add_shutdown_hook(self.__weak_aclose(weakref.ref(self)))
+            weakref.finalize(self, self.__portal.stop)
+        self.__rate_limiter = rate_limiter or RateLimiter()
+        if min_delay is not None or max_delay is not None:
+            warnings.warn(
+                "min_delay and max_delay are deprecated and have no effect. "
+                "Use rate_limiter instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        self.__retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            budget=RetryBudget(),
+        )
+        self.__circuit_breaker = circuit_breaker or CircuitBreakerRegistry()
+        self.__scheduler = scheduler or RequestScheduler(
+            max_concurrency=max_connections
+        )
+        self.__coalesce_requests = coalesce_requests
+        self.__inflight_requests: Dict[tuple, asyncio.Task] = {}
+        self.__response_cache = response_cache
+        self.__revalidations: Dict[str, asyncio.Task] = {}
 
         self.auth = AuthApi(self)
         self.call = CallApi(self)
@@ -315,22 +353,36 @@ class Client(WebSocketInteractor):
         self.review = ReviewApi(self)
         self.thread = ThreadApi(self)
         self.user = UserApi(self)
+        self.loader = BatchLoader(self)
 
         if not os.path.exists(base_path):
             os.makedirs(base_path)
 
         self.__state = state or State(storage_path=base_path + "secret.db")
+        self.__persistent_cache: Optional[PersistentCache] = None
+        if isinstance(persistent_cache, PersistentCache):
+            self.__persistent_cache = persistent_cache
+        elif persistent_cache:
+            self.__persistent_cache = PersistentCache(
+                base_path + "cache/", json_codec=self.__json_codec
+            )
         self.__header_manager = HeaderManager(Device.create(), self.__state)
-        self.__ratelimit = RateLimit(wait_on_ratelimit, max_ratelimit_retries)
+        self.__refresh_task: Optional[asyncio.Future] = None
+        self.__auto_refresh_token = auto_refresh_token
+        self.__token_refresh_margin = token_refresh_margin
+        self.__token_refresher: Optional[asyncio.Task] = None
+        self.__client_ip_ttl = client_ip_ttl
+        self.__client_ip_task: Optional[asyncio.Future] = None
+        self.__wait_on_ratelimit = wait_on_ratelimit
+        self.__max_ratelimit_retries = max_ratelimit_retries
 
         self.logger = logging.getLogger("yaylib version: " + __version__)
 
-        ch = logging.StreamHandler()
-        ch.setLevel(loglevel)
-        ch.setFormatter(CustomFormatter())
-
-        self.logger.addHandler(ch)
-        self.logger.setLevel(logging.DEBUG)
+        if not self.logger.handlers:
+            ch = logging.StreamHandler()
+            ch.setFormatter(CustomFormatter())
+            self.logger.addHandler(ch)
+        self.logger.setLevel(loglevel)
 
         self.logger.info("yaylib version: %s started.", __version__)
 
@@ -359,10 +411,210 @@ class Client(WebSocketInteractor):
         """デバイスの識別子"""
         return self.__state.device_uuid
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """エンドポイントグループ、アカウントごとのレート制限"""
+        return self.__rate_limiter
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """レスポンスキャッシュ、無効な場合は None"""
+        return self.__response_cache
+
+    @property
+    def persistent_cache(self) -> Optional[PersistentCache]:
+        """設定系エンドポイントのディスクキャッシュ、無効な場合は None"""
+        return self.__persistent_cache
+
+    @property
+    def identity_map(self) -> Optional[IdentityMap]:
+        """同じ識別子のモデルをまとめるマップ"""
+        return self.__identity_map
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """リクエストスケジューラー"""
+        return self.__scheduler
+
+    @property
+    def proxy_pool(self) -> Optional[ProxyPool]:
+        """プロキシプール"""
+        return self.__proxy_pool
+
+    @property
+    def proxy_url(self) -> Optional[str]:
+        """このクライアントが使用するプロキシの URL"""
+        proxy = self.__get_proxy()
+        return proxy.url if proxy is not None else self.__proxy_url
+
+    def __get_proxy(self) -> Optional[Proxy]:
+        """プロキシプールからクライアントに固定されたプロキシを取得する
+
+        Note:
+            ログインの前後で割り当てが変わらないよう、クライアントごとに一定のキーを使用する
+        """
+        if self.__proxy_pool is None:
+            return None
+        return self.__proxy_pool.get_proxy(self.__proxy_key)
+
+    @property
+    def circuit_breaker(self) -> CircuitBreakerRegistry:
+        """ホストごとのサーキットブレーカー"""
+        return self.__circuit_breaker
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """リクエスト、レスポンスに使用する JSON コーデック"""
+        return self.__json_codec
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """全ての API で共有される HTTP セッション
+
+        Note:
+            イベントループ内で初めて参照されたときに生成され、
+            `aclose()` が呼ばれるまでコネクションを再利用する。
+            異なるイベントループから参照された場合は、以前のセッションを終了してから作り直す
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self.__session is None
+            or self.__session.closed
+            or self.__session_loop is not loop
+        ):
+            self.__discard_session(loop)
+            connector = self.__connector
+            if connector is None:
+                connector = aiohttp.TCPConnector(**self.__connector_options)
+            self.__session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=self.__connector is None,
+                timeout=aiohttp.ClientTimeout(total=self.__timeout),
+            )
+            self.__session_loop = loop
+        return self.__session
+
+    def __discard_session(self, loop: asyncio.AbstractEventLoop) -> None:
+        """以前のイベントループで生成された HTTP セッションを終了する"""
+        session, session_loop = self.__session, self.__session_loop
+        self.__session = None
+        self.__session_loop = None
+        if session is None or session.closed:
+            return
+        if session_loop is not None and session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            return
+        # 停止、もしくは終了したイベントループのトランスポートは現在のループから閉じる
+        task = loop.create_task(session.close())
+        self.__closing_sessions.add(task)
+        task.add_done_callback(self.__closing_sessions.discard)
+
+    async def aclose(self) -> None:
+        """HTTP セッションを終了し、コネクションとプロキシの割り当てを解放する"""
+        for task in list(self.__revalidations.values()):
+            task.cancel()
+        self.__revalidations.clear()
+        await self.__close_session()
+        if self.__proxy_pool is not None:
+            self.__proxy_pool.release(self.__proxy_key)
+
+    async def __close_session(self) -> None:
+        """アクセストークンのリフレッシュを停止し、HTTP セッションを終了する"""
+        self.stop_token_refresher()
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+        self.__session_loop = None
+
+    def close(self) -> None:
+        """HTTP セッションを終了し、同期メソッド用のイベントループを停止する
+
+        Note:
+            `use_portal` が無効な場合は、セッションを生成したイベントループで終了する。
+            イベントループ内から呼び出された場合は、終了をタスクとして予約する
+        """
+        if self.__portal is not None:
+            if self.__portal.running:
+                self.__portal.call(self.aclose())
+            self.__portal.stop()
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        loop = self.__session_loop
+        if running_loop is not None:
+            task = running_loop.create_task(self.aclose())
+            self.__closing_sessions.add(task)
+            task.add_done_callback(self.__closing_sessions.discard)
+        elif loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        elif loop is not None and not loop.is_closed():
+            loop.run_until_complete(self.aclose())
+        else:
+            asyncio.run(self.aclose())
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @staticmethod
+    def __weak_aclose(ref: "weakref.ref[Client]"):
+        def hook():
+            client = ref()
+            return client.aclose() if client is not None else None
+
+        return hook
+
+    async def __run_and_close(self, coro: Coroutine[Any, Any, T]) -> T:
+        try:
+            return await coro
+        finally:
+            await self.__wait_revalidations()
+            await self.__close_session()
+
+    async def __wait_revalidations(self) -> None:
+        """イベントループを終了する前に、実行中の再取得の完了を待機する"""
+        loop = asyncio.get_running_loop()
+        tasks = [
+            task for task in self.__revalidations.values() if task.get_loop() is loop
+        ]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def call_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """コルーチンを同期的に実行する
+
+        Note:
+            `use_portal` が有効な場合は、クライアント専用のイベントループに送信して実行する。
+            複数のスレッドから同時に呼び出すことができ、HTTP セッションも再利用される
+
+        Args:
+            coro (Coroutine[Any, Any, T]):
+
+        Returns:
+            T: コルーチンの戻り値
+        """
+        if self.__portal is None:
+            return asyncio.run(self.__run_and_close(coro))
+        return self.__portal.call(coro)
+
     def __construct_response(
         self, response: Optional[dict], data_type: Optional[Model] = None
     ) -> Optional[dict | Model]:
         """辞書型レスポンスからモデルを生成する"""
+        if isinstance(data_type, Projection):
+            return data_type(response)
         if data_type is not None:
             if isinstance(response, list):
                 response = [data_type(result) for result in response]
@@ -374,37 +626,86 @@ class Client(WebSocketInteractor):
         self, method: str, url: str, **kwargs
     ) -> aiohttp.ClientResponse:
         """共通の基底リクエストを行う"""
-        self.logger.debug(
-            "Making API request: [%s] %s\n\nParameters: %s\n\nHeaders: %s\n\nBody: %s\n",
-            method,
-            url,
-            kwargs.get("params"),
-            kwargs.get("headers"),
-            kwargs.get("json"),
-        )
+        response, _ = await self.__fetch(method, url, **kwargs)
+        return response
 
-        session = self.__session or aiohttp.ClientSession()
-        async with session.request(
-            method, url, proxy=self.__proxy_url, timeout=self.__timeout, **kwargs
-        ) as response:
-            await response.read()
+    async def __fetch(
+        self, method: str, url: str, *, json_required=False, **kwargs
+    ) -> Tuple[aiohttp.ClientResponse, Any]:
+        """リクエストを行い、レスポンスボディを一度だけ読み込んでデコードする"""
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                "Making API request: [%s] %s\n\nParameters: %s\n\nHeaders: %s\n\nBody: %s\n",
+                method,
+                url,
+                kwargs.get("params"),
+                kwargs.get("headers"),
+                kwargs.get("json"),
+            )
 
-        if self.__session is None:
-            await session.close()
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            kwargs["data"] = self.__json_codec.encode(payload)
+
+        proxy = self.__get_proxy()
+        proxy_url = proxy.url if proxy is not None else self.__proxy_url
+
+        priority = get_request_priority(method, url)
+        breaker = self.__circuit_breaker.get_breaker(method, url)
+        probe = breaker.acquire()
+        try:
+            async with self.__scheduler.slot(priority):
+                start = time.monotonic()
+                async with self.session.request(
+                    method, url, proxy=proxy_url, **kwargs
+                ) as response:
+                    body = await response.read()
+        except BaseException as exc:
+            proxy_failure = proxy is not None and is_proxy_failure(exc)
+            if is_circuit_failure(exc) and not proxy_failure:
+                breaker.record_failure(probe)
+            else:
+                breaker.release(probe)
+            if proxy is not None and isinstance(
+                exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+            ):
+                self.__proxy_pool.record_failure(proxy)
+            raise
+
+        if proxy is not None:
+            self.__proxy_pool.record_success(proxy, time.monotonic() - start)
+
+        if response.status >= 500:
+            breaker.record_failure(probe)
+        else:
+            breaker.record_success(probe)
+
+        if debug:
+            self.logger.debug(
+                "Received API response: [%s] %s\n\nHTTP Status: %s\n\nHeaders: %s\n\nResponse: %s\n",
+                method,
+                url,
+                response.status,
+                response.headers,
+                body.decode(response.get_encoding(), errors="replace"),
+            )
 
-        self.logger.debug(
-            "Received API response: [%s] %s\n\nHTTP Status: %s\n\nHeaders: %s\n\nResponse: %s\n",
-            method,
-            url,
-            response.status,
-            response.headers,
-            await response.text(),
-        )
+        response_json = None
+        decode_error = None
+        if body.strip():
+            try:
+                response_json = self.__json_codec.loads(body)
+            except ValueError as exc:
+                decode_error = exc
 
-        await raise_for_code(response)
+        raise_for_json(response_json)
         await raise_for_status(response)
 
-        return response
+        if json_required and decode_error is not None:
+            raise decode_error
+
+        return response, response_json
 
     async def __make_request(
         self,
@@ -415,19 +716,50 @@ class Client(WebSocketInteractor):
         json: Optional[dict] = None,
         headers: Optional[dict] = None,
         return_type: Optional[dict] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[dict | Model]:
         """リクエストを行いモデルを生成する"""
-        response = await self.base_request(
-            method, url, params=params, json=json, headers=headers
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        _, response_json = await self.__fetch(
+            method,
+            url,
+            json_required=True,
+            params=params,
+            json=json,
+            headers=headers,
+            **kwargs,
         )
-        response_json: Optional[dict] = await response.json(content_type=None)
         return self.__construct_response(response_json, return_type)
 
-    async def __refresh_client_tokens(self) -> None:
-        """認証トークンのリフレッシュを行う"""
-        response = await self.auth.get_token(
-            grant_type="refresh_token", refresh_token=self.__state.refresh_token
-        )
+    async def __refresh_client_tokens(self, expired_access_token: str) -> None:
+        """認証トークンのリフレッシュを行う
+
+        Note:
+            同時に複数のリクエストが失敗した場合でも、リフレッシュは一度だけ実行され、
+            他のリクエストはその完了を待機する
+        """
+        if self.__state.access_token != expired_access_token:
+            return  # 既に他のリクエストによってリフレッシュ済み
+
+        task = self.__refresh_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.ensure_future(self.__perform_token_refresh())
+            self.__refresh_task = task
+
+        await asyncio.shield(task)
+
+    async def __perform_token_refresh(self) -> None:
+        """認証トークンのリフレッシュを実行する"""
+        with use_response_format(MODELS):
+            response = await self.auth.get_token(
+                grant_type="refresh_token", refresh_token=self.__state.refresh_token
+            )
         self.__state.set_user(
             LocalUser(
                 user_id=self.__state.user_id,
@@ -435,15 +767,119 @@ class Client(WebSocketInteractor):
                 device_uuid=self.__state.device_uuid,
                 access_token=response.access_token,
                 refresh_token=response.refresh_token,
+                access_token_expires_at=get_expires_at(response.expires_in),
+                client_ip=self.__state.client_ip,
+                client_ip_expires_at=self.__state.client_ip_expires_at,
             )
         )
         self.__state.update()
 
-    async def __insert_delay(self) -> None:
-        """リクエスト間の時間が1秒未満のときに遅延を挿入する"""
-        if int(datetime.now().timestamp()) - self.__last_request_ts < 1:
-            await asyncio.sleep(random.uniform(self.__min_delay, self.__max_delay))
-        self.__last_request_ts = int(datetime.now().timestamp())
+    def __has_valid_client_ip(self) -> bool:
+        """有効期限内のクライアント IP アドレスを保持しているかどうか
+
+        Note:
+            プロキシプールを使用している場合は、現在割り当てられているプロキシを経由して
+            取得したものに限り有効とする
+        """
+        if (
+            self.__proxy_pool is not None
+            and self.__client_ip_proxy is not self.__get_proxy()
+        ):
+            return False
+        return (
+            self.__state.client_ip != ""
+            and self.__state.client_ip_expires_at > datetime.now().timestamp()
+        )
+
+    async def __bootstrap_client_ip(self) -> None:
+        """クライアント IP アドレスを取得する
+
+        Note:
+            同時に複数のリクエストが発生した場合でも、取得は一度だけ実行され、
+            他のリクエストはその完了を待機する
+        """
+        task = self.__client_ip_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.ensure_future(self.__fetch_client_ip())
+            self.__client_ip_task = task
+
+        await asyncio.shield(task)
+
+    async def __fetch_client_ip(self) -> None:
+        """クライアント IP アドレスを取得し、有効期限付きで保存する"""
+        proxy = self.__get_proxy()
+        with use_response_format(MODELS):
+            metadata = await self.user.get_timestamp()
+        self.__client_ip_proxy = proxy
+        self.__state.client_ip = metadata.ip_address
+        self.__state.client_ip_expires_at = get_expires_at(self.__client_ip_ttl)
+        if self.__state.user_id != 0:
+            self.__state.update()
+
+    def start_token_refresher(self) -> None:
+        """アクセストークンの有効期限が切れる前にリフレッシュを行うタスクを起動する
+
+        Note:
+            イベントループ内から呼び出す必要がある。
+            `auto_refresh_token` が有効な場合はリクエスト時に自動的に起動される
+        """
+        task = self.__token_refresher
+        loop = asyncio.get_running_loop()
+        if task is None or task.done() or task.get_loop() is not loop:
+            self.__token_refresher = loop.create_task(self.__token_refresh_loop())
+
+    def stop_token_refresher(self) -> None:
+        """アクセストークンのリフレッシュを行うタスクを停止する"""
+        if self.__token_refresher is not None:
+            self.__token_refresher.cancel()
+            self.__token_refresher = None
+
+    async def __token_refresh_loop(self) -> None:
+        """有効期限の `token_refresh_margin` 秒前にアクセストークンをリフレッシュする"""
+        while self.__state.user_id != 0:
+            expires_at = self.__state.access_token_expires_at
+            if not expires_at or not self.__state.refresh_token:
+                await asyncio.sleep(60)  # 有効期限が判明するまで待機
+                continue
+
+            now = datetime.now().timestamp()
+            delay = expires_at - self.__token_refresh_margin - now
+            if delay > 0:
+                await asyncio.sleep(min(delay, 60))
+                continue
+
+            try:
+                await self.__refresh_client_tokens(self.__state.access_token)
+                self.logger.debug("Access token refreshed in background.")
+            except UnauthorizedError:
+                return
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.logger.warning("Failed to refresh access token: %s", exc)
+                await asyncio.sleep(30)
+
+    def __on_rate_limited(
+        self,
+        method: str,
+        url: str,
+        err: Exception,
+        ratelimit: RateLimit,
+        retry_after: float,
+    ) -> None:
+        """レート制限に達したエンドポイントグループ、もしくはアカウントを一時停止する"""
+        self.logger.warning(
+            "Rate limit exceeded. Waiting %.1f seconds... (%s/%s)",
+            retry_after,
+            ratelimit.retries_performed + 1,
+            ratelimit.max_retries,
+        )
+        if isinstance(err, TooManyRequestsError) and err.response.ban_until:
+            self.__rate_limiter.pause_account(self.user_id, retry_after)
+        else:
+            self.__rate_limiter.on_rate_limited(method, url, self.user_id, retry_after)
 
     async def request(
         self,
@@ -455,26 +891,215 @@ class Client(WebSocketInteractor):
         headers: Optional[dict] = None,
         return_type: Optional[Model] = None,
         jwt_required=False,
+        persistent=False,
     ) -> Optional[dict | Model]:
-        """リクエストに必要な処理を行う"""
+        """リクエストに必要な処理を行う
+
+        Note:
+            `coalesce_requests` が有効な場合、同時に発生した同一の GET リクエスト
+            （URL、パラメータ、ヘッダー、ログインユーザーが同じもの）は一度だけ送信され、
+            結果が共有される。`persistent` を指定した GET リクエストのレスポンスは
+            `persistent_cache` によってディスクに保存される。
+            `response_format` が `raw` の場合はモデルを生成せずに辞書型のまま返却し、
+            `slim` の場合は元の辞書を保持しないモデルを、`Projection` の場合は
+            指定したフィールドのみを持つレコードを返却する。`identity_map` が有効な場合、
+            同じ識別子のユーザー、サークル、投稿は一つのインスタンスにまとめられる
+        """
         if not url.startswith("https://"):
             url = "https://" + url
 
-        if not self.__header_manager.client_ip and "v2/users/timestamp" not in url:
-            metadata = await self.user.get_timestamp()
-            self.__header_manager.client_ip = metadata.ip_address
+        if return_type is not None:
+            fmt = get_response_format(self.__response_format)
+            if fmt == RAW:
+                return_type = None
+            elif isinstance(fmt, Projection):
+                return_type = fmt
+            elif self.__identity_map is not None:
+                return_type = self.__identity_map.get_factory(
+                    return_type, slim=fmt == SLIM
+                )
+            elif fmt == SLIM:
+                return_type = get_slim_factory(return_type)
+
+        kwargs = {
+            "params": params,
+            "json": json,
+            "headers": headers,
+            "return_type": return_type,
+            "jwt_required": jwt_required,
+        }
+        cache = self.__response_cache
 
-        backoff_duration = 0
-        headers = headers or {}
+        if method.upper() != "GET":
+            try:
+                return await self.__request(method, url, **kwargs)
+            finally:
+                if cache is not None:
+                    cache.invalidate_request(url, params, json, self.__state.user_id)
+
+        if persistent and self.__persistent_cache is not None:
+            return await self.__request_persistent(method, url, **kwargs)
+
+        use_cache = cache is not None and cache.is_cacheable(url)
+        if not use_cache and not self.__coalesce_requests:
+            return await self.__request(method, url, **kwargs)
 
-        response = None
+        key = (
+            url,
+            make_hashable(filter_dict(params)),
+            make_hashable(headers),
+            return_type,
+            jwt_required,
+            self.__state.user_id,
+        )
+
+        if use_cache:
+            generation = cache.generation
+            response = cache.get(key)
+            if response is not None:
+                return response
+
+        if self.__coalesce_requests:
+            response = await self.__coalesce(key, method, url, **kwargs)
+        else:
+            response = await self.__request(method, url, **kwargs)
+
+        if use_cache:
+            cache.put(key, url, response, generation)
+        return response
+
+    async def __coalesce(
+        self,
+        key: tuple,
+        method: str,
+        url: str,
+        request: Optional[Callable[..., Coroutine]] = None,
+        **kwargs,
+    ) -> Optional[dict | Model]:
+        """同一のリクエストが送信中であれば、その結果を待機する"""
+        loop = asyncio.get_running_loop()
+        task = self.__inflight_requests.get(key)
+        if task is None or task.get_loop() is not loop:
+            if kwargs.get("headers"):
+                kwargs["headers"] = dict(kwargs["headers"])
+            request = request or self.__request
+            task = loop.create_task(request(method, url, **kwargs))
+            self.__inflight_requests[key] = task
+            task.add_done_callback(functools.partial(self.__on_request_done, key))
+
+        return await asyncio.shield(task)
+
+    async def __request_persistent(
+        self, method: str, url: str, **kwargs
+    ) -> Optional[dict | Model]:
+        """ディスクに保存されたレスポンスを返却し、有効期間を過ぎていれば再取得を予約する"""
+        return_type = kwargs.pop("return_type")
+        key = PersistentCache.make_key(
+            url,
+            make_hashable(filter_dict(kwargs["params"])),
+            make_hashable(kwargs["headers"]),
+            kwargs["jwt_required"],
+            self.__state.user_id,
+        )
+
+        entry = self.__persistent_cache.get(key)
+        if entry is None:
+            response = await self.__coalesce(
+                ("persistent", key),
+                method,
+                url,
+                request=functools.partial(self.__request_and_persist, key),
+                **kwargs,
+            )
+        else:
+            response, fresh = entry
+            if not fresh:
+                self.__revalidate(key, method, url, **kwargs)
+
+        return self.__construct_response(response, return_type)
+
+    async def __request_and_persist(
+        self, key: str, method: str, url: str, **kwargs
+    ) -> Any:
+        """リクエストを行い、レスポンスをディスクに保存する"""
+        response = await self.__request(method, url, **kwargs)
+        self.__persistent_cache.put(key, response)
+        return response
+
+    def __revalidate(self, key: str, method: str, url: str, **kwargs) -> None:
+        """ディスクに保存されたレスポンスをバックグラウンドで再取得する"""
+        loop = asyncio.get_running_loop()
+        task = self.__revalidations.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        task = loop.create_task(self.__request_and_persist(key, method, url, **kwargs))
+        self.__revalidations[key] = task
+        task.add_done_callback(functools.partial(self.__on_revalidated, key))
+
+    def __on_revalidated(self, key: str, task: asyncio.Task) -> None:
+        """再取得の完了を記録する"""
+        if self.__revalidations.get(key) is task:
+            del self.__revalidations[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(
+                "Failed to revalidate cached response: %s", task.exception()
+            )
+
+    def __on_request_done(self, key: tuple, task: asyncio.Task) -> None:
+        """完了したリクエストを共有対象から外す"""
+        if self.__inflight_requests.get(key) is task:
+            del self.__inflight_requests[key]
+        if not task.cancelled():
+            task.exception()  # 待機者がいない場合の未取得例外の警告を抑止する
 
-        for i in range(max(1, self.__max_retries + 1)):
+    async def __request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        return_type: Optional[Model] = None,
+        jwt_required=False,
+    ) -> Optional[dict | Model]:
+        """認証トークンの更新や再試行を含めたリクエストを行う"""
+        if self.__auto_refresh_token and self.__state.user_id != 0:
+            self.start_token_refresher()
+
+        if not self.__has_valid_client_ip() and "v2/users/timestamp" not in url:
+            await self.__bootstrap_client_ip()
+
+        backoff_duration = 0
+        headers = headers or {}
+        ratelimit = RateLimit(self.__wait_on_ratelimit, self.__max_ratelimit_retries)
+        retry_policy = self.__retry_policy
+        deadline = retry_policy.get_deadline()
+        if retry_policy.budget is not None:
+            retry_policy.budget.record_request()
+
+        attempt = 0
+        replayed = False
+        # 優先度はレート制限の待機順にも反映する
+        priority = self.__scheduler.get_priority(get_request_priority(method, url))
+
+        while True:
             try:
                 await asyncio.sleep(backoff_duration)
                 while True:
                     try:
-                        await self.__insert_delay()
+                        await self.__rate_limiter.acquire(
+                            method, url, self.user_id, priority=priority
+                        )
+                        timeout = None
+                        if deadline is not None:
+                            timeout = deadline - asyncio.get_running_loop().time()
+                            if timeout <= 0:
+                                raise asyncio.TimeoutError("Request deadline exceeded.")
+                            # 1 回の試行は `timeout` 秒までとし、残りの時間を再試行に残す
+                            if self.__timeout is not None:
+                                timeout = min(self.__timeout, timeout)
+                        access_token = self.__state.access_token
                         headers.update(self.__header_manager.generate(jwt_required))
                         response = await self.__make_request(
                             method,
@@ -483,22 +1108,32 @@ class Client(WebSocketInteractor):
                             json=filter_dict(json),
                             headers=headers,
                             return_type=return_type,
+                            timeout=timeout,
                         )
                         break
-                    except (QuotaLimitExceededError, TooManyRequestsError) as err:
-                        self.logger.warning(
-                            "Rate limit exceeded. Waiting... (%s/%s)",
-                            self.__ratelimit.retries_performed,
-                            self.__ratelimit.max_retries,
+                    except (
+                        QuotaLimitExceededError,
+                        TooManyRequestsError,
+                        HTTPRateLimitError,
+                    ) as err:
+                        await ratelimit.wait(
+                            err,
+                            functools.partial(
+                                self.__on_rate_limited, method, url, err, ratelimit
+                            ),
                         )
-                        await self.__ratelimit.wait(err)
-                self.__ratelimit.reset()
-                break
+                self.__rate_limiter.on_success(method, url, self.user_id)
+                return response
             except (AccessTokenExpiredError, AccessTokenInvalidError) as err:
                 if self.user_id == 0:
                     self.logger.error("Authentication required to perform the action.")
                     raise err
-                await self.__refresh_client_tokens()
+                if "/api/v1/oauth/token" in url or replayed:
+                    raise err
+                await self.__refresh_client_tokens(access_token)
+                # リフレッシュ後の再送は再試行回数に含めない
+                replayed = True
+                backoff_duration = 0
             except UnauthorizedError as err:
                 if "/api/v1/oauth/token" in url:
                     self.__state.destory(self.user_id)
@@ -506,13 +1141,22 @@ class Client(WebSocketInteractor):
                         "Failed to refresh credentials. Please try logging in again."
                     )
                     raise err
-            except HTTPInternalServerError as err:
+                if attempt >= retry_policy.max_retries:
+                    raise err
+                attempt += 1
+                backoff_duration = 0
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                backoff_duration = retry_policy.get_backoff(attempt)
+                if not retry_policy.should_retry(
+                    method, err, attempt, backoff_duration, deadline=deadline
+                ):
+                    raise err
+                attempt += 1
                 self.logger.error(
-                    "Request failed with status %s! Retrying...", err.response.status
+                    "Request failed with %s! Retrying in %.1f seconds...",
+                    err.response.status if isinstance(err, HTTPError) else repr(err),
+                    backoff_duration,
                 )
-                backoff_duration = self.__backoff_factor * (2**i)
-
-        return response
 
     # ---------- call api ----------
 
@@ -525,7 +1169,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostResponse:
         """
-        return asyncio.run(self.call.get_user_active_call(user_id))
+        return self.call_sync(self.call.get_user_active_call(user_id))
 
     def get_bgms(self) -> BgmsResponse:
         """通話のBGMを取得する
@@ -533,7 +1177,7 @@ class Client(WebSocketInteractor):
         Returns:
             BgmsResponse:
         """
-        return asyncio.run(self.call.get_bgms())
+        return self.call_sync(self.call.get_bgms())
 
     def get_call(self, call_id: int) -> ConferenceCallResponse:
         """通話を取得する
@@ -544,7 +1188,7 @@ class Client(WebSocketInteractor):
         Returns:
             ConferenceCallResponse:
         """
-        return asyncio.run(self.call.get_call(call_id))
+        return self.call_sync(self.call.get_call(call_id))
 
     def get_call_invitable_users(self, **params) -> UsersByTimestampResponse:
         """通話に招待可能なユーザーを取得する
@@ -556,7 +1200,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersByTimestampResponse:
         """
-        return asyncio.run(self.call.get_call_invitable_users(**params))
+        return self.call_sync(self.call.get_call_invitable_users(**params))
 
     def get_call_status(self, opponent_id: int) -> CallStatusResponse:
         """通話の状態を取得します
@@ -567,7 +1211,7 @@ class Client(WebSocketInteractor):
         Returns:
             CallStatusResponse:
         """
-        return asyncio.run(self.call.get_call_status(opponent_id))
+        return self.call_sync(self.call.get_call_status(opponent_id))
 
     def get_games(self, **params) -> GamesResponse:
         """通話に設定可能なゲームを取得する
@@ -580,7 +1224,7 @@ class Client(WebSocketInteractor):
         Returns:
             GamesResponse:
         """
-        return asyncio.run(self.call.get_games(**params))
+        return self.call_sync(self.call.get_games(**params))
 
     def get_genres(self, **params) -> GenresResponse:
         """通話のジャンルを取得する
@@ -592,7 +1236,7 @@ class Client(WebSocketInteractor):
         Returns:
             GenresResponse:
         """
-        return asyncio.run(self.call.get_genres(**params))
+        return self.call_sync(self.call.get_genres(**params))
 
     def get_group_calls(self, **params) -> PostsResponse:
         """サークル内の通話を取得する
@@ -606,7 +1250,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.call.get_group_calls(**params))
+        return self.call_sync(self.call.get_group_calls(**params))
 
     def invite_online_followings_to_call(self, **params) -> Response:
         """オンラインの友達をまとめて通話に招待します
@@ -618,7 +1262,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.call.invite_online_followings_to_call(**params))
+        return self.call_sync(self.call.invite_online_followings_to_call(**params))
 
     def invite_users_to_call(self, call_id: int, user_ids: List[int]) -> Response:
         """通話に複数のユーザーを招待する
@@ -630,7 +1274,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.call.invite_users_to_call(call_id, user_ids))
+        return self.call_sync(self.call.invite_users_to_call(call_id, user_ids))
 
     def invite_users_to_chat_call(self, **params) -> Response:
         """ユーザーをチャット通話に招待する
@@ -643,7 +1287,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.call.invite_users_to_chat_call(**params))
+        return self.call_sync(self.call.invite_users_to_chat_call(**params))
 
     def kick_user_from_call(
         self, call_id: int, **params
@@ -658,7 +1302,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        asyncio.run(self.call.kick_user_from_call(call_id, **params))
+        self.call_sync(self.call.kick_user_from_call(call_id, **params))
 
     def start_call(self, call_id: int, **params) -> Response:
         """通話を開始する
@@ -672,7 +1316,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.call.start_call(call_id, **params))
+        return self.call_sync(self.call.start_call(call_id, **params))
 
     def set_user_role(self, call_id: int, user_id: int, role: str) -> Response:
         """通話の参加者に役職を付与する
@@ -685,7 +1329,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.call.set_user_role(call_id, user_id, role))
+        return self.call_sync(self.call.set_user_role(call_id, user_id, role))
 
     def join_call(self, **params) -> ConferenceCallResponse:
         """通話に参加する
@@ -697,7 +1341,7 @@ class Client(WebSocketInteractor):
         Returns:
             ConferenceCallResponse:
         """
-        return asyncio.run(self.call.join_call(**params))
+        return self.call_sync(self.call.join_call(**params))
 
     def leave_call(self, **params) -> Response:
         """通話から退出する
@@ -709,7 +1353,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.call.leave_call(**params))
+        return self.call_sync(self.call.leave_call(**params))
 
     def join_call_as_anonymous(self, **params) -> ConferenceCallResponse:
         """匿名で通話に参加する
@@ -721,7 +1365,7 @@ class Client(WebSocketInteractor):
         Returns:
             ConferenceCallResponse:
         """
-        return asyncio.run(self.call.join_call_as_anonymous(**params))
+        return self.call_sync(self.call.join_call_as_anonymous(**params))
 
     def leave_call_as_anonymous(self, **params) -> Response:
         """匿名で参加した通話を退出する
@@ -733,7 +1377,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response: _description_
         """
-        return asyncio.run(self.call.leave_call_as_anonymous(**params))
+        return self.call_sync(self.call.leave_call_as_anonymous(**params))
 
     # ---------- notification api ----------
 
@@ -748,7 +1392,7 @@ class Client(WebSocketInteractor):
         Returns:
             ActivitiesResponse:
         """
-        return asyncio.run(self.notification.get_activities(**params))
+        return self.call_sync(self.notification.get_activities(**params))
 
     def get_merged_activities(self, **params) -> ActivitiesResponse:
         """全種類の通知を取得する
@@ -760,7 +1404,7 @@ class Client(WebSocketInteractor):
         Returns:
             ActivitiesResponse:
         """
-        return asyncio.run(self.notification.get_merged_activities(**params))
+        return self.call_sync(self.notification.get_merged_activities(**params))
 
     # ---------- chat api ----------
 
@@ -773,7 +1417,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.accept_chat_requests(**params))
+        return self.call_sync(self.chat.accept_chat_requests(**params))
 
     def check_unread_status(self, **params) -> UnreadStatusResponse:
         """チャットの未読ステータスを確認する
@@ -784,7 +1428,7 @@ class Client(WebSocketInteractor):
         Returns:
             UnreadStatusResponse:
         """
-        return asyncio.run(self.chat.check_unread_status(**params))
+        return self.call_sync(self.chat.check_unread_status(**params))
 
     def create_group_chat(self, **params) -> CreateChatRoomResponse:
         """グループチャットを作成する
@@ -798,7 +1442,7 @@ class Client(WebSocketInteractor):
         Returns:
             CreateChatRoomResponse:
         """
-        return asyncio.run(self.chat.create_group_chat(**params))
+        return self.call_sync(self.chat.create_group_chat(**params))
 
     def create_private_chat(self, **params) -> CreateChatRoomResponse:
         """個人チャットを作成する
@@ -811,7 +1455,7 @@ class Client(WebSocketInteractor):
         Returns:
             CreateChatRoomResponse:
         """
-        return asyncio.run(self.chat.create_private_chat(**params))
+        return self.call_sync(self.chat.create_private_chat(**params))
 
     def delete_chat_background(self, room_id: int) -> Response:
         """チャットの背景を削除する
@@ -822,7 +1466,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.delete_chat_background(room_id))
+        return self.call_sync(self.chat.delete_chat_background(room_id))
 
     def delete_message(self, room_id: int, message_id: int) -> Response:
         """チャットメッセージを削除する
@@ -834,7 +1478,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.delete_message(room_id, message_id))
+        return self.call_sync(self.chat.delete_message(room_id, message_id))
 
     def edit_chat_room(self, **params) -> Response:
         """チャットルームを編集する
@@ -848,7 +1492,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.edit_chat_room(**params))
+        return self.call_sync(self.chat.edit_chat_room(**params))
 
     def get_chatable_users(self, **params) -> FollowUsersResponse:
         """チャット可能なユーザーを取得する
@@ -861,7 +1505,7 @@ class Client(WebSocketInteractor):
         Returns:
             FollowUsersResponse:
         """
-        return asyncio.run(self.chat.get_chatable_users(**params))
+        return self.call_sync(self.chat.get_chatable_users(**params))
 
     def get_gifs_data(self) -> GifsDataResponse:
         """チャット用 GIF データを取得する
@@ -869,7 +1513,7 @@ class Client(WebSocketInteractor):
         Returns:
             GifsDataResponse:
         """
-        return asyncio.run(self.chat.get_gifs_data())
+        return self.call_sync(self.chat.get_gifs_data())
 
     def get_hidden_chat_rooms(self, **params) -> ChatRoomsResponse:
         """非表示に設定したチャットルームを取得する
@@ -881,7 +1525,7 @@ class Client(WebSocketInteractor):
         Returns:
             ChatRoomsResponse:
         """
-        return asyncio.run(self.chat.get_hidden_chat_rooms(**params))
+        return self.call_sync(self.chat.get_hidden_chat_rooms(**params))
 
     def get_main_chat_rooms(self, **params) -> ChatRoomsResponse:
         """メインのチャットルームを取得する
@@ -892,7 +1536,7 @@ class Client(WebSocketInteractor):
         Returns:
             ChatRoomsResponse:
         """
-        return asyncio.run(self.chat.get_main_chat_rooms(**params))
+        return self.call_sync(self.chat.get_main_chat_rooms(**params))
 
     def get_messages(self, chat_room_id: int, **params) -> MessagesResponse:
         """メッセージを取得する
@@ -904,7 +1548,7 @@ class Client(WebSocketInteractor):
         Returns:
             MessagesResponse:
         """
-        return asyncio.run(self.chat.get_messages(chat_room_id, **params))
+        return self.call_sync(self.chat.get_messages(chat_room_id, **params))
 
     def get_chat_requests(self, **params) -> ChatRoomsResponse:
         """チャットリクエストを取得する
@@ -916,7 +1560,7 @@ class Client(WebSocketInteractor):
         Returns:
             ChatRoomsResponse:
         """
-        return asyncio.run(self.chat.get_chat_requests(**params))
+        return self.call_sync(self.chat.get_chat_requests(**params))
 
     def get_chat_room(self, chat_room_id: int) -> ChatRoomResponse:
         """チャットルームを取得する
@@ -927,7 +1571,7 @@ class Client(WebSocketInteractor):
         Returns:
             ChatRoomResponse:
         """
-        return asyncio.run(self.chat.get_chat_room(chat_room_id))
+        return self.call_sync(self.chat.get_chat_room(chat_room_id))
 
     def get_sticker_packs(self) -> StickerPacksResponse:
         """チャット用のスタンプを取得する
@@ -935,7 +1579,7 @@ class Client(WebSocketInteractor):
         Returns:
             StickerPacksResponse:
         """
-        return asyncio.run(self.chat.get_sticker_packs())
+        return self.call_sync(self.chat.get_sticker_packs())
 
     def get_total_chat_requests(self) -> TotalChatRequestResponse:
         """チャットリクエストの総数を取得する
@@ -943,7 +1587,7 @@ class Client(WebSocketInteractor):
         Returns:
             TotalChatRequestResponse:
         """
-        return asyncio.run(self.chat.get_total_chat_requests())
+        return self.call_sync(self.chat.get_total_chat_requests())
 
     def hide_chat(self, chat_room_id: int) -> Response:
         """チャットルームを非表示にする
@@ -954,7 +1598,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.hide_chat(chat_room_id))
+        return self.call_sync(self.chat.hide_chat(chat_room_id))
 
     def invite_to_chat(self, **params) -> Response:
         """チャットルームにユーザーを招待する
@@ -966,7 +1610,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.invite_to_chat(**params))
+        return self.call_sync(self.chat.invite_to_chat(**params))
 
     def kick_users_from_chat(self, **params) -> Response:
         """チャットルームからユーザーを追放する
@@ -978,7 +1622,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.kick_users_from_chat(**params))
+        return self.call_sync(self.chat.kick_users_from_chat(**params))
 
     def pin_chat(self, room_id: int) -> Response:
         """チャットルームをピン留めする
@@ -989,7 +1633,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.pin_chat(room_id))
+        return self.call_sync(self.chat.pin_chat(room_id))
 
     def read_message(self, chat_room_id: int, message_id: int) -> Response:
         """メッセージを既読にする
@@ -1001,7 +1645,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.read_message(chat_room_id, message_id))
+        return self.call_sync(self.chat.read_message(chat_room_id, message_id))
 
     def refresh_chat_rooms(self, **params) -> ChatRoomsResponse:
         """チャットルームを更新する
@@ -1012,7 +1656,7 @@ class Client(WebSocketInteractor):
         Returns:
             ChatRoomsResponse:
         """
-        return asyncio.run(self.chat.refresh_chat_rooms(**params))
+        return self.call_sync(self.chat.refresh_chat_rooms(**params))
 
     def delete_chat_rooms(self, **params) -> Response:
         """チャットルームを削除する
@@ -1023,7 +1667,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.delete_chat_rooms(**params))
+        return self.call_sync(self.chat.delete_chat_rooms(**params))
 
     def send_message(
         self,
@@ -1038,7 +1682,7 @@ class Client(WebSocketInteractor):
         Returns:
             MessageResponse:
         """
-        return asyncio.run(self.chat.send_message(chat_room_id, **params))
+        return self.call_sync(self.chat.send_message(chat_room_id, **params))
 
     def unhide_chat(self, **params) -> Response:
         """非表示に設定したチャットルームを表示する
@@ -1049,7 +1693,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.unhide_chat(**params))
+        return self.call_sync(self.chat.unhide_chat(**params))
 
     def unpin_chat(self, chat_room_id: int) -> Response:
         """チャットのピン留めを解除する
@@ -1060,7 +1704,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.chat.unpin_chat(chat_room_id))
+        return self.call_sync(self.chat.unpin_chat(chat_room_id))
 
     # ---------- group api ----------
 
@@ -1073,7 +1717,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.accept_moderator_offer(group_id))
+        return self.call_sync(self.group.accept_moderator_offer(group_id))
 
     def accept_ownership_offer(self, group_id: int) -> Response:
         """サークル管理人の権限オファーを引き受けます
@@ -1084,7 +1728,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.accept_ownership_offer(group_id))
+        return self.call_sync(self.group.accept_ownership_offer(group_id))
 
     def accept_group_join_request(self, group_id: int, user_id: int) -> Response:
         """サークル参加リクエストを承認します
@@ -1096,7 +1740,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.accept_group_join_request(group_id, user_id))
+        return self.call_sync(self.group.accept_group_join_request(group_id, user_id))
 
     def add_related_groups(
         self, group_id: int, related_group_id: List[int]
@@ -1110,7 +1754,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.add_related_groups(group_id, related_group_id))
+        return self.call_sync(self.group.add_related_groups(group_id, related_group_id))
 
     def ban_group_user(self, group_id: int, user_id: int) -> Response:
         """サークルからユーザーを追放する
@@ -1122,7 +1766,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.ban_group_user(group_id, user_id))
+        return self.call_sync(self.group.ban_group_user(group_id, user_id))
 
     def check_group_unread_status(self, **params) -> UnreadStatusResponse:
         """サークルの未読ステータスを取得する
@@ -1133,7 +1777,7 @@ class Client(WebSocketInteractor):
         Returns:
             UnreadStatusResponse:
         """
-        return asyncio.run(self.group.check_group_unread_status(**params))
+        return self.call_sync(self.group.check_group_unread_status(**params))
 
     def create_group(self, **params) -> CreateGroupResponse:
         """サークルを作成する
@@ -1163,7 +1807,7 @@ class Client(WebSocketInteractor):
         Returns:
             CreateGroupResponse:
         """
-        return asyncio.run(self.group.create_group(**params))
+        return self.call_sync(self.group.create_group(**params))
 
     def pin_group(self, group_id: int) -> Response:
         """サークルをピン留めする
@@ -1174,7 +1818,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.pin_group(group_id))
+        return self.call_sync(self.group.pin_group(group_id))
 
     def decline_moderator_offer(self, group_id: int) -> Response:
         """サークル副管理人の権限オファーを断る
@@ -1185,7 +1829,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.decline_moderator_offer(group_id))
+        return self.call_sync(self.group.decline_moderator_offer(group_id))
 
     def decline_ownership_offer(self, group_id: int) -> Response:
         """サークル管理人の権限オファーを断る
@@ -1196,7 +1840,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.decline_ownership_offer(group_id))
+        return self.call_sync(self.group.decline_ownership_offer(group_id))
 
     def decline_group_join_request(self, group_id: int, user_id: int) -> Response:
         """サークル参加リクエストを断る
@@ -1208,7 +1852,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.decline_group_join_request(group_id, user_id))
+        return self.call_sync(self.group.decline_group_join_request(group_id, user_id))
 
     def unpin_group(self, group_id: int) -> Response:
         """サークルのピン留めを解除する
@@ -1219,7 +1863,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.unpin_group(group_id))
+        return self.call_sync(self.group.unpin_group(group_id))
 
     def get_banned_group_members(self, **params) -> UsersResponse:
         """追放されたサークルメンバーを取得する
@@ -1231,7 +1875,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersResponse:
         """
-        return asyncio.run(self.group.get_banned_group_members(**params))
+        return self.call_sync(self.group.get_banned_group_members(**params))
 
     def get_group_categories(self, **params) -> GroupCategoriesResponse:
         """サークルのカテゴリーを取得する
@@ -1243,7 +1887,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupCategoriesResponse:
         """
-        return asyncio.run(self.group.get_group_categories(**params))
+        return self.call_sync(self.group.get_group_categories(**params))
 
     def get_create_group_quota(self) -> CreateGroupQuota:
         """残りのサークル作成可能回数を取得する
@@ -1251,7 +1895,7 @@ class Client(WebSocketInteractor):
         Returns:
             CreateGroupQuota:
         """
-        return asyncio.run(self.group.get_create_group_quota())
+        return self.call_sync(self.group.get_create_group_quota())
 
     def get_group(self, group_id: int) -> GroupResponse:
         """サークルの詳細を取得する
@@ -1262,7 +1906,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupResponse:
         """
-        return asyncio.run(self.group.get_group(group_id))
+        return self.call_sync(self.group.get_group(group_id))
 
     def get_groups(self, **params) -> GroupsResponse:
         """複数のサークル情報を取得する
@@ -1276,7 +1920,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupsResponse:
         """
-        return asyncio.run(self.group.get_groups(**params))
+        return self.call_sync(self.group.get_groups(**params))
 
     def get_invitable_users(self, group_id: int, **params) -> UsersByTimestampResponse:
         """サークルに招待可能なユーザーを取得する
@@ -1289,7 +1933,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersByTimestampResponse:
         """
-        return asyncio.run(self.group.get_invitable_users(group_id, **params))
+        return self.call_sync(self.group.get_invitable_users(group_id, **params))
 
     def get_joined_statuses(self, ids: List[int]) -> Response:
         """サークルの参加ステータスを取得する
@@ -1300,7 +1944,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.get_joined_statuses(ids))
+        return self.call_sync(self.group.get_joined_statuses(ids))
 
     def get_group_member(self, group_id: int, user_id: int) -> GroupUserResponse:
         """特定のサークルメンバーの情報を取得する
@@ -1312,7 +1956,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupUserResponse:
         """
-        return asyncio.run(self.group.get_group_member(group_id, user_id))
+        return self.call_sync(self.group.get_group_member(group_id, user_id))
 
     def get_group_members(self, group_id: int, **params) -> GroupUsersResponse:
         """サークルメンバーを取得する
@@ -1330,7 +1974,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupUsersResponse:
         """
-        return asyncio.run(self.group.get_group_members(group_id, **params))
+        return self.call_sync(self.group.get_group_members(group_id, **params))
 
     def get_my_groups(self, **params) -> GroupsResponse:
         """自分のサークルを取得する
@@ -1341,7 +1985,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupsResponse:
         """
-        return asyncio.run(self.group.get_my_groups(**params))
+        return self.call_sync(self.group.get_my_groups(**params))
 
     def get_relatable_groups(self, group_id: int, **params) -> GroupsRelatedResponse:
         """関連がある可能性があるサークルを取得する
@@ -1354,7 +1998,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupsRelatedResponse:
         """
-        return asyncio.run(self.group.get_relatable_groups(group_id, **params))
+        return self.call_sync(self.group.get_relatable_groups(group_id, **params))
 
     def get_related_groups(self, group_id: int, **params) -> GroupsRelatedResponse:
         """関連があるサークルを取得する
@@ -1367,7 +2011,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupsRelatedResponse:
         """
-        return asyncio.run(self.group.get_related_groups(group_id, **params))
+        return self.call_sync(self.group.get_related_groups(group_id, **params))
 
     def get_user_groups(self, **params) -> GroupsResponse:
         """特定のユーザーが参加しているサークルを取得する
@@ -1379,7 +2023,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupsResponse:
         """
-        return asyncio.run(self.group.get_user_groups(**params))
+        return self.call_sync(self.group.get_user_groups(**params))
 
     def invite_users_to_group(self, group_id: int, user_ids: List[int]) -> Response:
         """サークルにユーザーを招待する
@@ -1391,7 +2035,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.invite_users_to_group(group_id, user_ids))
+        return self.call_sync(self.group.invite_users_to_group(group_id, user_ids))
 
     def join_group(self, group_id: int) -> Response:
         """サークルに参加する
@@ -1402,7 +2046,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.join_group(group_id))
+        return self.call_sync(self.group.join_group(group_id))
 
     def leave_group(self, group_id: int) -> Response:
         """サークルから脱退する
@@ -1413,7 +2057,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.leave_group(group_id))
+        return self.call_sync(self.group.leave_group(group_id))
 
     def delete_group_cover(self, group_id: int) -> Response:
         """サークルのカバー画像を削除する
@@ -1424,7 +2068,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.delete_group_cover(group_id))
+        return self.call_sync(self.group.delete_group_cover(group_id))
 
     def delete_moderator(self, group_id: int, user_id: int) -> Response:
         """サークルの副管理人を削除する
@@ -1436,7 +2080,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.delete_moderator(group_id, user_id))
+        return self.call_sync(self.group.delete_moderator(group_id, user_id))
 
     def delete_related_groups(
         self, group_id: int, related_group_ids: List[int]
@@ -1450,7 +2094,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(
+        return self.call_sync(
             self.group.delete_related_groups(group_id, related_group_ids)
         )
 
@@ -1464,7 +2108,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.send_moderator_offers(group_id, user_ids))
+        return self.call_sync(self.group.send_moderator_offers(group_id, user_ids))
 
     def send_ownership_offer(self, group_id: int, user_id: int) -> Response:
         """サークル管理人権限のオファーを送信する
@@ -1476,7 +2120,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.send_ownership_offer(group_id, user_id))
+        return self.call_sync(self.group.send_ownership_offer(group_id, user_id))
 
     def set_group_title(self, group_id: int, title: str) -> Response:
         """サークルのタイトルを設定する
@@ -1488,7 +2132,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.set_group_title(group_id, title))
+        return self.call_sync(self.group.set_group_title(group_id, title))
 
     def take_over_group_ownership(self, group_id: int) -> Response:
         """サークル管理人の権限を引き継ぐ
@@ -1499,7 +2143,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.take_over_group_ownership(group_id))
+        return self.call_sync(self.group.take_over_group_ownership(group_id))
 
     def unban_group_member(self, group_id: int, user_id: int) -> Response:
         """特定のサークルメンバーの追放を解除する
@@ -1511,7 +2155,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.unban_group_member(group_id, user_id))
+        return self.call_sync(self.group.unban_group_member(group_id, user_id))
 
     def update_group(self, group_id: int, **params) -> GroupResponse:
         """サークルを編集する
@@ -1542,7 +2186,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupResponse:
         """
-        return asyncio.run(self.group.update_group(group_id, **params))
+        return self.call_sync(self.group.update_group(group_id, **params))
 
     def withdraw_moderator_offer(self, group_id: int, user_id: int) -> Response:
         """サークル副管理人のオファーを取り消す
@@ -1554,7 +2198,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.withdraw_moderator_offer(group_id, user_id))
+        return self.call_sync(self.group.withdraw_moderator_offer(group_id, user_id))
 
     def withdraw_ownership_offer(self, group_id: int, user_id: int) -> Response:
         """サークル管理人のオファーを取り消す
@@ -1566,7 +2210,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.group.withdraw_ownership_offer(group_id, user_id))
+        return self.call_sync(self.group.withdraw_ownership_offer(group_id, user_id))
 
     # ---------- auth api ----------
 
@@ -1581,7 +2225,7 @@ class Client(WebSocketInteractor):
         Returns:
             LoginUpdateResponse:
         """
-        return asyncio.run(self.auth.change_email(**params))
+        return self.call_sync(self.auth.change_email(**params))
 
     def change_password(self, **params) -> LoginUpdateResponse:
         """パスワードを変更する
@@ -1593,7 +2237,7 @@ class Client(WebSocketInteractor):
         Returns:
             LoginUpdateResponse:
         """
-        return asyncio.run(self.auth.change_password(**params))
+        return self.call_sync(self.auth.change_password(**params))
 
     def get_token(self, **params) -> TokenResponse:
         """認証トークンを取得する
@@ -1607,7 +2251,7 @@ class Client(WebSocketInteractor):
         Returns:
             TokenResponse:
         """
-        return asyncio.run(self.auth.get_token(**params))
+        return self.call_sync(self.auth.get_token(**params))
 
     def login(
         self, email: str, password: str, two_fa_code: Optional[str] = None
@@ -1622,7 +2266,7 @@ class Client(WebSocketInteractor):
         Returns:
             LoginUserResponse:
         """
-        return asyncio.run(self.auth.login(email, password, two_fa_code))
+        return self.call_sync(self.auth.login(email, password, two_fa_code))
 
     def resend_confirm_email(self) -> Response:
         """確認メールを再送信する
@@ -1630,7 +2274,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.auth.resend_confirm_email())
+        return self.call_sync(self.auth.resend_confirm_email())
 
     def restore_user(self, **params) -> LoginUserResponse:
         """ユーザーを復元する
@@ -1641,7 +2285,7 @@ class Client(WebSocketInteractor):
         Returns:
             LoginUserResponse:
         """
-        return asyncio.run(self.auth.restore_user(**params))
+        return self.call_sync(self.auth.restore_user(**params))
 
     def save_account_with_email(self, **params) -> LoginUpdateResponse:
         """メールアドレスでアカウントを保存する
@@ -1655,7 +2299,7 @@ class Client(WebSocketInteractor):
         Returns:
             LoginUpdateResponse:
         """
-        return asyncio.run(self.auth.save_account_with_email(**params))
+        return self.call_sync(self.auth.save_account_with_email(**params))
 
     # ---------- misc api ----------
 
@@ -1668,7 +2312,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.misc.accept_policy_agreement(agreement_type))
+        return self.call_sync(self.misc.accept_policy_agreement(agreement_type))
 
     def send_verification_code(self, email: str, intent: str, locale="ja") -> Response:
         """メールアドレス認証コードを送信する
@@ -1681,7 +2325,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.misc.send_verification_code(email, intent, locale))
+        return self.call_sync(self.misc.send_verification_code(email, intent, locale))
 
     def get_email_grant_token(self, **params) -> EmailGrantTokenResponse:
         """メールアドレス認証トークンを取得する
@@ -1693,7 +2337,7 @@ class Client(WebSocketInteractor):
         Returns:
             EmailGrantTokenResponse:
         """
-        return asyncio.run(self.misc.get_email_grant_token(**params))
+        return self.call_sync(self.misc.get_email_grant_token(**params))
 
     def get_email_verification_presigned_url(
         self, email: str, locale: str = "ja", intent: Optional[str] = None
@@ -1708,7 +2352,7 @@ class Client(WebSocketInteractor):
         Returns:
             EmailVerificationPresignedUrlResponse:
         """
-        return asyncio.run(
+        return self.call_sync(
             self.misc.get_email_verification_presigned_url(email, locale, intent)
         )
 
@@ -1723,7 +2367,7 @@ class Client(WebSocketInteractor):
         Returns:
             PresignedUrlsResponse:
         """
-        return asyncio.run(self.misc.get_file_upload_presigned_urls(file_names))
+        return self.call_sync(self.misc.get_file_upload_presigned_urls(file_names))
 
     def get_id_checker_presigned_url(
         self, model: str, action: str, **params
@@ -1737,7 +2381,7 @@ class Client(WebSocketInteractor):
         Returns:
             IdCheckerPresignedUrlResponse:
         """
-        return asyncio.run(
+        return self.call_sync(
             self.misc.get_id_checker_presigned_url(model, action, **params)
         )
 
@@ -1752,7 +2396,9 @@ class Client(WebSocketInteractor):
         Returns:
             PresignedUrlResponse:
         """
-        return asyncio.run(self.misc.get_old_file_upload_presigned_url(video_file_name))
+        return self.call_sync(
+            self.misc.get_old_file_upload_presigned_url(video_file_name)
+        )
 
     def get_policy_agreed(self) -> PolicyAgreementsResponse:
         """利用規約、ポリシー同意書に同意しているかどうかを取得する
@@ -1760,7 +2406,7 @@ class Client(WebSocketInteractor):
         Returns:
             PolicyAgreementsResponse:
         """
-        return asyncio.run(self.misc.get_policy_agreed())
+        return self.call_sync(self.misc.get_policy_agreed())
 
     def get_web_socket_token(self) -> WebSocketTokenResponse:
         """WebSocket トークンを取得する
@@ -1768,7 +2414,7 @@ class Client(WebSocketInteractor):
         Returns:
             WebSocketTokenResponse:
         """
-        return asyncio.run(self.misc.get_web_socket_token())
+        return self.call_sync(self.misc.get_web_socket_token())
 
     def upload_image(self, image_paths: List[str], image_type: str) -> List[Attachment]:
         """画像をアップロードして、サーバー上のファイルのリストを取得する
@@ -1797,7 +2443,7 @@ class Client(WebSocketInteractor):
         Returns:
             List[Attachment]: サーバー上のファイル情報
         """
-        return asyncio.run(self.misc.upload_image(image_paths, image_type))
+        return self.call_sync(self.misc.upload_image(image_paths, image_type))
 
     def upload_video(self, video_path: str) -> str:
         """動画をアップロードして、サーバー上のファイル名を取得する
@@ -1822,7 +2468,7 @@ class Client(WebSocketInteractor):
         Returns:
             str: サーバー上のファイル名
         """
-        return asyncio.run(self.misc.upload_video(video_path))
+        return self.call_sync(self.misc.upload_video(video_path))
 
     def get_app_config(self) -> ApplicationConfigResponse:
         """アプリケーションのメタデータを取得する
@@ -1830,7 +2476,7 @@ class Client(WebSocketInteractor):
         Returns:
             ApplicationConfigResponse:
         """
-        return asyncio.run(self.misc.get_app_config())
+        return self.call_sync(self.misc.get_app_config())
 
     def get_banned_words(self, country_code: str = "jp") -> BanWordsResponse:
         """禁止ワードの一覧を取得する
@@ -1841,7 +2487,7 @@ class Client(WebSocketInteractor):
         Returns:
             BanWordsResponse:
         """
-        return asyncio.run(self.misc.get_banned_words(country_code))
+        return self.call_sync(self.misc.get_banned_words(country_code))
 
     def get_popular_words(self, country_code: str = "jp") -> PopularWordsResponse:
         """人気ワードの一覧を取得する
@@ -1852,7 +2498,7 @@ class Client(WebSocketInteractor):
         Returns:
             PopularWordsResponse:
         """
-        return asyncio.run(self.misc.get_popular_words(country_code))
+        return self.call_sync(self.misc.get_popular_words(country_code))
 
     # ---------- post api ----------
 
@@ -1866,7 +2512,7 @@ class Client(WebSocketInteractor):
         Returns:
             BookmarkPostResponse:
         """
-        return asyncio.run(self.post.add_bookmark(user_id, post_id))
+        return self.call_sync(self.post.add_bookmark(user_id, post_id))
 
     def add_group_highlight_post(self, group_id: int, post_id: int) -> Response:
         """投稿をグループのまとめに追加する
@@ -1878,7 +2524,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.add_group_highlight_post(group_id, post_id))
+        return self.call_sync(self.post.add_group_highlight_post(group_id, post_id))
 
     def create_call_post(
         self, text: Optional[str] = None, **params
@@ -1908,7 +2554,7 @@ class Client(WebSocketInteractor):
         Returns:
             CreatePostResponse:
         """
-        return asyncio.run(self.post.create_call_post(text, **params))
+        return self.call_sync(self.post.create_call_post(text, **params))
 
     def pin_group_post(self, post_id: int, group_id: int) -> Response:
         """サークルの投稿をピン留めする
@@ -1920,7 +2566,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.pin_group_post(post_id, group_id))
+        return self.call_sync(self.post.pin_group_post(post_id, group_id))
 
     def pin_post(self, post_id: int) -> Response:
         """プロフィールに投稿をピン留めする
@@ -1931,7 +2577,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.pin_post(post_id))
+        return self.call_sync(self.post.pin_post(post_id))
 
     def create_post(self, text: Optional[str] = None, **params) -> Post:
         """投稿を作成する
@@ -1960,7 +2606,7 @@ class Client(WebSocketInteractor):
         Returns:
             Post:
         """
-        return asyncio.run(self.post.create_post(text, **params))
+        return self.call_sync(self.post.create_post(text, **params))
 
     def create_repost(
         self, post_id: int, text: Optional[str] = None, **params
@@ -1992,7 +2638,7 @@ class Client(WebSocketInteractor):
         Returns:
             CreatePostResponse:
         """
-        return asyncio.run(self.post.create_repost(post_id, text, **params))
+        return self.call_sync(self.post.create_repost(post_id, text, **params))
 
     def create_share_post(
         self,
@@ -2014,7 +2660,7 @@ class Client(WebSocketInteractor):
         Returns:
             Post:
         """
-        return asyncio.run(
+        return self.call_sync(
             self.post.create_share_post(shareable_type, shareable_id, text, **params)
         )
 
@@ -2048,7 +2694,7 @@ class Client(WebSocketInteractor):
         Returns:
             Post:
         """
-        return asyncio.run(self.post.create_thread_post(post_id, text, **params))
+        return self.call_sync(self.post.create_thread_post(post_id, text, **params))
 
     def delete_all_posts(self) -> Response:
         """すべての自分の投稿を削除する
@@ -2056,7 +2702,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.delete_all_posts())
+        return self.call_sync(self.post.delete_all_posts())
 
     def unpin_group_post(self, group_id: int) -> Response:
         """グループのピン投稿を解除する
@@ -2067,7 +2713,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.unpin_group_post(group_id))
+        return self.call_sync(self.post.unpin_group_post(group_id))
 
     def unpin_post(self, post_id: int) -> Response:
         """プロフィール投稿のピンを解除する
@@ -2078,7 +2724,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.unpin_post(post_id))
+        return self.call_sync(self.post.unpin_post(post_id))
 
     def get_bookmark(self, user_id: int, **params) -> PostsResponse:
         """ブックマークを取得する
@@ -2090,7 +2736,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_bookmark(user_id, **params))
+        return self.call_sync(self.post.get_bookmark(user_id, **params))
 
     def get_timeline_calls(self, **params) -> PostsResponse:
         """誰でも通話を取得する
@@ -2109,7 +2755,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_timeline_calls(**params))
+        return self.call_sync(self.post.get_timeline_calls(**params))
 
     def get_conversation(self, conversation_id: int, **params) -> PostsResponse:
         """リプライを含める投稿の会話を取得する
@@ -2125,7 +2771,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_conversation(conversation_id, **params))
+        return self.call_sync(self.post.get_conversation(conversation_id, **params))
 
     def get_conversation_root_posts(self, post_ids: List[int]) -> PostsResponse:
         """会話の原点の投稿を取得する
@@ -2136,7 +2782,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_conversation_root_posts(post_ids))
+        return self.call_sync(self.post.get_conversation_root_posts(post_ids))
 
     def get_following_call_timeline(self, **params) -> PostsResponse:
         """フォロー中の通話を取得する
@@ -2151,7 +2797,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_following_call_timeline(**params))
+        return self.call_sync(self.post.get_following_call_timeline(**params))
 
     def get_following_timeline(self, **params) -> PostsResponse:
         """フォロー中のタイムラインを取得する
@@ -2168,7 +2814,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_following_timeline(**params))
+        return self.call_sync(self.post.get_following_timeline(**params))
 
     def get_group_highlight_posts(self, group_id: int, **params) -> PostsResponse:
         """グループのまとめ投稿を取得する
@@ -2181,7 +2827,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_group_highlight_posts(group_id, **params))
+        return self.call_sync(self.post.get_group_highlight_posts(group_id, **params))
 
     def get_group_timeline_by_keyword(
         self, group_id: int, keyword: str, **params
@@ -2198,7 +2844,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(
+        return self.call_sync(
             self.post.get_group_timeline_by_keyword(group_id, keyword, **params)
         )
 
@@ -2216,7 +2862,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_group_timeline(group_id, **params))
+        return self.call_sync(self.post.get_group_timeline(group_id, **params))
 
     def get_timeline_by_hashtag(self, hashtag: str, **params) -> PostsResponse:
         """ハッシュタグでタイムラインを検索する
@@ -2229,7 +2875,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_timeline_by_hashtag(hashtag, **params))
+        return self.call_sync(self.post.get_timeline_by_hashtag(hashtag, **params))
 
     def get_my_posts(self, **params) -> PostsResponse:
         """自分の投稿を取得する
@@ -2242,7 +2888,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_my_posts(**params))
+        return self.call_sync(self.post.get_my_posts(**params))
 
     def get_post(self, post_id: int) -> PostResponse:
         """投稿の詳細を取得する
@@ -2253,7 +2899,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostResponse:
         """
-        return asyncio.run(self.post.get_post(post_id))
+        return self.call_sync(self.post.get_post(post_id))
 
     def get_post_likers(self, post_id: int, **params) -> PostLikersResponse:
         """投稿にいいねしたユーザーを取得する
@@ -2266,7 +2912,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostLikersResponse:
         """
-        return asyncio.run(self.post.get_post_likers(post_id, **params))
+        return self.call_sync(self.post.get_post_likers(post_id, **params))
 
     def get_reposts(self, post_id: int, **params: int) -> PostsResponse:
         """投稿の(´∀｀∩)↑age↑を取得する
@@ -2279,7 +2925,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_reposts(post_id, **params))
+        return self.call_sync(self.post.get_reposts(post_id, **params))
 
     def get_posts(self, post_ids: List[int]) -> PostsResponse:
         """複数の投稿を取得する
@@ -2290,7 +2936,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_posts(post_ids))
+        return self.call_sync(self.post.get_posts(post_ids))
 
     def get_recommended_post_tags(self, **params) -> PostTagsResponse:
         """おすすめのタグ候補を取得する
@@ -2302,7 +2948,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostTagsResponse:
         """
-        return asyncio.run(self.post.get_recommended_post_tags(**params))
+        return self.call_sync(self.post.get_recommended_post_tags(**params))
 
     def get_recommended_posts(self, **params) -> PostsResponse:
         """おすすめの投稿を取得する
@@ -2316,7 +2962,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_recommended_posts(**params))
+        return self.call_sync(self.post.get_recommended_posts(**params))
 
     def get_timeline_by_keyword(
         self,
@@ -2333,7 +2979,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_timeline_by_keyword(keyword, **params))
+        return self.call_sync(self.post.get_timeline_by_keyword(keyword, **params))
 
     def get_timeline(self, **params) -> PostsResponse:
         """タイムラインを取得する
@@ -2354,7 +3000,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_timeline(**params))
+        return self.call_sync(self.post.get_timeline(**params))
 
     def get_url_metadata(self, url: str) -> SharedUrl:
         """URLのメタデータを取得する
@@ -2365,7 +3011,7 @@ class Client(WebSocketInteractor):
         Returns:
             SharedUrl:
         """
-        return asyncio.run(self.post.get_url_metadata(url))
+        return self.call_sync(self.post.get_url_metadata(url))
 
     def get_user_timeline(self, user_id: int, **params) -> PostsResponse:
         """ユーザーのタイムラインを取得する
@@ -2379,7 +3025,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.post.get_user_timeline(user_id, **params))
+        return self.call_sync(self.post.get_user_timeline(user_id, **params))
 
     def like(self, post_ids: List[int]) -> LikePostsResponse:
         """投稿にいいねする
@@ -2390,7 +3036,7 @@ class Client(WebSocketInteractor):
         Returns:
             LikePostsResponse:
         """
-        return asyncio.run(self.post.like(post_ids))
+        return self.call_sync(self.post.like(post_ids))
 
     def delete_bookmark(self, user_id: int, post_id: int) -> Response:
         """ブックマークを削除する
@@ -2402,7 +3048,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.delete_bookmark(user_id, post_id))
+        return self.call_sync(self.post.delete_bookmark(user_id, post_id))
 
     def delete_group_highlight_post(self, group_id: int, post_id: int) -> Response:
         """サークルのまとめから投稿を解除する
@@ -2414,7 +3060,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.delete_group_highlight_post(group_id, post_id))
+        return self.call_sync(self.post.delete_group_highlight_post(group_id, post_id))
 
     def delete_posts(self, post_ids: List[int]) -> Response:
         """投稿を削除する
@@ -2425,7 +3071,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.delete_posts(post_ids))
+        return self.call_sync(self.post.delete_posts(post_ids))
 
     def unlike(self, post_id: int) -> Response:
         """いいねを解除する
@@ -2436,7 +3082,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.unlike(post_id))
+        return self.call_sync(self.post.unlike(post_id))
 
     def update_post(self, **params) -> Post:
         """投稿を編集する
@@ -2451,7 +3097,7 @@ class Client(WebSocketInteractor):
         Returns:
             Post:
         """
-        return asyncio.run(self.post.update_post(**params))
+        return self.call_sync(self.post.update_post(**params))
 
     def view_video(self, video_id: int) -> Response:
         """動画を視聴する
@@ -2462,7 +3108,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.post.view_video(video_id))
+        return self.call_sync(self.post.view_video(video_id))
 
     def vote_survey(self, survey_id: int, choice_id: int) -> VoteSurveyResponse:
         """アンケートに投票する
@@ -2474,7 +3120,7 @@ class Client(WebSocketInteractor):
         Returns:
             VoteSurveyResponse:
         """
-        return asyncio.run(self.post.vote_survey(survey_id, choice_id))
+        return self.call_sync(self.post.vote_survey(survey_id, choice_id))
 
     # ---------- review api ----------
 
@@ -2488,7 +3134,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.review.create_review(user_id, comment))
+        return self.call_sync(self.review.create_review(user_id, comment))
 
     def delete_reviews(self, review_ids: List[int]) -> Response:
         """レターを削除する
@@ -2499,7 +3145,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.review.delete_reviews(review_ids))
+        return self.call_sync(self.review.delete_reviews(review_ids))
 
     def get_my_reviews(self, **params) -> ReviewsResponse:
         """送信したレターを取得する
@@ -2511,7 +3157,7 @@ class Client(WebSocketInteractor):
         Returns:
             ReviewsResponse:
         """
-        return asyncio.run(self.review.get_my_reviews(**params))
+        return self.call_sync(self.review.get_my_reviews(**params))
 
     def get_reviews(self, user_id: int, **params) -> ReviewsResponse:
         """ユーザーが受け取ったレターを取得する
@@ -2524,7 +3170,7 @@ class Client(WebSocketInteractor):
         Returns:
             ReviewsResponse:
         """
-        return asyncio.run(self.review.get_reviews(user_id, **params))
+        return self.call_sync(self.review.get_reviews(user_id, **params))
 
     def pin_review(self, review_id: int) -> Response:
         """レターをピン留めする
@@ -2535,7 +3181,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.review.pin_review(review_id))
+        return self.call_sync(self.review.pin_review(review_id))
 
     def unpin_review(self, review_id: int) -> Response:
         """レターのピン留めを解除する
@@ -2546,7 +3192,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.review.unpin_review(review_id))
+        return self.call_sync(self.review.unpin_review(review_id))
 
     # ---------- thread api ----------
 
@@ -2560,7 +3206,7 @@ class Client(WebSocketInteractor):
         Returns:
             ThreadInfo:
         """
-        return asyncio.run(self.thread.add_post_to_thread(post_id, thread_id))
+        return self.call_sync(self.thread.add_post_to_thread(post_id, thread_id))
 
     def convert_post_to_thread(self, post_id: int, **params) -> ThreadInfo:
         """投稿をスレッドに変換する
@@ -2573,7 +3219,7 @@ class Client(WebSocketInteractor):
         Returns:
             ThreadInfo:
         """
-        return asyncio.run(self.thread.convert_post_to_thread(post_id, **params))
+        return self.call_sync(self.thread.convert_post_to_thread(post_id, **params))
 
     def create_thread(
         self,
@@ -2591,7 +3237,7 @@ class Client(WebSocketInteractor):
         Returns:
             ThreadInfo:
         """
-        return asyncio.run(
+        return self.call_sync(
             self.thread.create_thread(group_id, title, thread_icon_filename)
         )
 
@@ -2606,7 +3252,7 @@ class Client(WebSocketInteractor):
         Returns:
             GroupThreadListResponse:
         """
-        return asyncio.run(self.thread.get_group_thread_list(**params))
+        return self.call_sync(self.thread.get_group_thread_list(**params))
 
     def get_thread_joined_statuses(self, ids: List[int]) -> Response:
         """スレッド参加ステータスを取得する
@@ -2617,7 +3263,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.thread.get_thread_joined_statuses(ids))
+        return self.call_sync(self.thread.get_thread_joined_statuses(ids))
 
     def get_thread_posts(self, thread_id: int, **params) -> PostsResponse:
         """スレッド内のタイムラインを取得する
@@ -2630,7 +3276,7 @@ class Client(WebSocketInteractor):
         Returns:
             PostsResponse:
         """
-        return asyncio.run(self.thread.get_thread_posts(thread_id, **params))
+        return self.call_sync(self.thread.get_thread_posts(thread_id, **params))
 
     def join_thread(self, thread_id: int, user_id: int) -> Response:
         """スレッドに参加する
@@ -2642,7 +3288,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.thread.join_thread(thread_id, user_id))
+        return self.call_sync(self.thread.join_thread(thread_id, user_id))
 
     def leave_thread(self, thread_id: int, user_id: int) -> Response:
         """スレッドから脱退する
@@ -2654,7 +3300,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.thread.leave_thread(thread_id, user_id))
+        return self.call_sync(self.thread.leave_thread(thread_id, user_id))
 
     def delete_thread(self, thread_id: int) -> Response:
         """スレッドを削除する
@@ -2665,7 +3311,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.thread.delete_thread(thread_id))
+        return self.call_sync(self.thread.delete_thread(thread_id))
 
     def update_thread(self, thread_id: int, **params) -> Response:
         """スレッドをアップデートする
@@ -2678,7 +3324,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.thread.update_thread(thread_id, **params))
+        return self.call_sync(self.thread.update_thread(thread_id, **params))
 
     # ---------- user api ----------
 
@@ -2692,7 +3338,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.delete_footprint(user_id, footprint_id))
+        return self.call_sync(self.user.delete_footprint(user_id, footprint_id))
 
     def follow_user(self, user_id: int) -> Response:
         """ユーザーをフォローする
@@ -2703,7 +3349,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.follow_user(user_id))
+        return self.call_sync(self.user.follow_user(user_id))
 
     def follow_users(self, user_ids: List[int]) -> Response:
         """複数のユーザーをフォローする
@@ -2714,7 +3360,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.follow_users(user_ids))
+        return self.call_sync(self.user.follow_users(user_ids))
 
     def get_active_followings(self, **params) -> ActiveFollowingsResponse:
         """アクティブなフォロー中のユーザーを取得する
@@ -2726,7 +3372,7 @@ class Client(WebSocketInteractor):
         Returns:
             ActiveFollowingsResponse:
         """
-        return asyncio.run(self.user.get_active_followings(**params))
+        return self.call_sync(self.user.get_active_followings(**params))
 
     def get_follow_recommendations(self, **params) -> FollowRecommendationsResponse:
         """フォローするのにおすすめのユーザーを取得する
@@ -2739,7 +3385,7 @@ class Client(WebSocketInteractor):
         Returns:
             FollowRecommendationsResponse:
         """
-        return asyncio.run(self.user.get_follow_recommendations(**params))
+        return self.call_sync(self.user.get_follow_recommendations(**params))
 
     def get_follow_request(self, **params) -> UsersByTimestampResponse:
         """フォローリクエストを取得する
@@ -2750,7 +3396,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersByTimestampResponse:
         """
-        return asyncio.run(self.user.get_follow_request(**params))
+        return self.call_sync(self.user.get_follow_request(**params))
 
     def get_follow_request_count(self) -> FollowRequestCountResponse:
         """フォローリクエストの数を取得する
@@ -2758,7 +3404,7 @@ class Client(WebSocketInteractor):
         Returns:
             FollowRequestCountResponse:
         """
-        return asyncio.run(self.user.get_follow_request_count())
+        return self.call_sync(self.user.get_follow_request_count())
 
     def get_following_users_born(self, **params) -> UsersResponse:
         """フォロー中のユーザーの誕生日を取得する
@@ -2769,7 +3415,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersResponse:
         """
-        return asyncio.run(self.user.get_following_users_born(**params))
+        return self.call_sync(self.user.get_following_users_born(**params))
 
     def get_footprints(self, **params) -> FootprintsResponse:
         """足跡を取得する
@@ -2782,7 +3428,7 @@ class Client(WebSocketInteractor):
         Returns:
             FootprintsResponse:
         """
-        return asyncio.run(self.user.get_footprints(**params))
+        return self.call_sync(self.user.get_footprints(**params))
 
     def get_fresh_user(self, user_id: int) -> UserResponse:
         """認証情報などを含んだユーザー情報を取得する
@@ -2793,7 +3439,7 @@ class Client(WebSocketInteractor):
         Returns:
             UserResponse:
         """
-        return asyncio.run(self.user.get_fresh_user(user_id))
+        return self.call_sync(self.user.get_fresh_user(user_id))
 
     def get_hima_users(self, **params) -> HimaUsersResponse:
         """暇なユーザーを取得する
@@ -2805,7 +3451,7 @@ class Client(WebSocketInteractor):
         Returns:
             HimaUsersResponse:
         """
-        return asyncio.run(self.user.get_hima_users(**params))
+        return self.call_sync(self.user.get_hima_users(**params))
 
     def get_user_ranking(self, mode: str) -> RankingUsersResponse:
         """ユーザーのフォロワーランキングを取得する
@@ -2826,7 +3472,7 @@ class Client(WebSocketInteractor):
         Returns:
             RankingUsersResponse:
         """
-        return asyncio.run(self.user.get_user_ranking(mode))
+        return self.call_sync(self.user.get_user_ranking(mode))
 
     def get_profile_refresh_counter_requests(self) -> RefreshCounterRequestsResponse:
         """投稿数やフォロワー数をリフレッシュするための残リクエスト数を取得する
@@ -2834,7 +3480,7 @@ class Client(WebSocketInteractor):
         Returns:
             RefreshCounterRequestsResponse:
         """
-        return asyncio.run(self.user.get_profile_refresh_counter_requests())
+        return self.call_sync(self.user.get_profile_refresh_counter_requests())
 
     def get_social_shared_users(self, **params) -> SocialShareUsersResponse:
         """SNS共有をしたユーザーを取得する
@@ -2847,7 +3493,7 @@ class Client(WebSocketInteractor):
         Returns:
             SocialShareUsersResponse:
         """
-        return asyncio.run(self.user.get_social_shared_users(**params))
+        return self.call_sync(self.user.get_social_shared_users(**params))
 
     def get_timestamp(self) -> UserTimestampResponse:
         """タイムスタンプを取得する
@@ -2855,7 +3501,7 @@ class Client(WebSocketInteractor):
         Returns:
             UserTimestampResponse:
         """
-        return asyncio.run(self.user.get_timestamp())
+        return self.call_sync(self.user.get_timestamp())
 
     def get_user(self, user_id: int) -> UserResponse:
         """ユーザーの情報を取得する
@@ -2866,7 +3512,7 @@ class Client(WebSocketInteractor):
         Returns:
             UserResponse:
         """
-        return asyncio.run(self.user.get_user(user_id))
+        return self.call_sync(self.user.get_user(user_id))
 
     def get_user_followers(self, user_id: int, **params) -> FollowUsersResponse:
         """ユーザーのフォロワーを取得する
@@ -2880,7 +3526,7 @@ class Client(WebSocketInteractor):
         Returns:
             FollowUsersResponse:
         """
-        return asyncio.run(self.user.get_user_followers(user_id, **params))
+        return self.call_sync(self.user.get_user_followers(user_id, **params))
 
     def get_user_followings(self, user_id: int, **params) -> FollowUsersResponse:
         """フォロー中のユーザーを取得する
@@ -2895,7 +3541,7 @@ class Client(WebSocketInteractor):
         Returns:
             FollowUsersResponse:
         """
-        return asyncio.run(self.user.get_user_followings(user_id, **params))
+        return self.call_sync(self.user.get_user_followings(user_id, **params))
 
     def get_user_from_qr(self, qr: str) -> UserResponse:
         """QRコードからユーザーを取得する
@@ -2906,7 +3552,7 @@ class Client(WebSocketInteractor):
         Returns:
             UserResponse:
         """
-        return asyncio.run(self.user.get_user_from_qr(qr))
+        return self.call_sync(self.user.get_user_from_qr(qr))
 
     def get_user_without_leaving_footprint(self, user_id: int) -> UserResponse:
         """足跡をつけずにユーザーの情報を取得する
@@ -2917,7 +3563,7 @@ class Client(WebSocketInteractor):
         Returns:
             UserResponse:
         """
-        return asyncio.run(self.user.get_user_without_leaving_footprint(user_id))
+        return self.call_sync(self.user.get_user_without_leaving_footprint(user_id))
 
     def get_users(self, user_ids: List[int]) -> UsersResponse:
         """複数のユーザーの情報を取得する
@@ -2928,7 +3574,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersResponse:
         """
-        return asyncio.run(self.user.get_users(user_ids))
+        return self.call_sync(self.user.get_users(user_ids))
 
     def refresh_profile_counter(self, counter: str) -> Response:
         """プロフィールのカウンターを更新する
@@ -2939,7 +3585,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.refresh_profile_counter(counter))
+        return self.call_sync(self.user.refresh_profile_counter(counter))
 
     def register(self, **params) -> CreateUserResponse:
         """
@@ -2961,7 +3607,7 @@ class Client(WebSocketInteractor):
         Returns:
             CreateUserResponse:
         """
-        return asyncio.run(self.user.register(**params))
+        return self.call_sync(self.user.register(**params))
 
     def delete_user_avatar(self) -> Response:
         """ユーザーのアイコンを削除する
@@ -2969,7 +3615,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.delete_user_avatar())
+        return self.call_sync(self.user.delete_user_avatar())
 
     def delete_user_cover(self) -> Response:
         """ユーザーのカバー画像を削除する
@@ -2977,7 +3623,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.delete_user_cover())
+        return self.call_sync(self.user.delete_user_cover())
 
     def reset_password(self, **params) -> Response:
         """パスワードをリセットする
@@ -2990,7 +3636,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.reset_password(**params))
+        return self.call_sync(self.user.reset_password(**params))
 
     def search_lobi_users(self, **params) -> UsersResponse:
         """Lobiのユーザーを検索する
@@ -3003,7 +3649,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersResponse:
         """
-        return asyncio.run(self.user.search_lobi_users(**params))
+        return self.call_sync(self.user.search_lobi_users(**params))
 
     def search_users(self, **params) -> UsersResponse:
         """ユーザーを検索する
@@ -3023,7 +3669,7 @@ class Client(WebSocketInteractor):
         Returns:
             UsersResponse:
         """
-        return asyncio.run(self.user.search_users(**params))
+        return self.call_sync(self.user.search_users(**params))
 
     def set_follow_permission_enabled(self, **params) -> Response:
         """フォローを許可制にするかを設定する
@@ -3035,7 +3681,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.set_follow_permission_enabled(**params))
+        return self.call_sync(self.user.set_follow_permission_enabled(**params))
 
     def take_action_follow_request(self, user_id: int, action: str) -> Response:
         """フォローリクエストを操作する
@@ -3047,7 +3693,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.take_action_follow_request(user_id, action))
+        return self.call_sync(self.user.take_action_follow_request(user_id, action))
 
     def turn_on_hima(self) -> Response:
         """ひまなうを有効にする
@@ -3055,7 +3701,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.turn_on_hima())
+        return self.call_sync(self.user.turn_on_hima())
 
     def unfollow_user(self, user_id: int) -> Response:
         """ユーザーをアンフォローする
@@ -3066,7 +3712,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.unfollow_user(user_id))
+        return self.call_sync(self.user.unfollow_user(user_id))
 
     def update_user(self, nickname: str, **params) -> Response:
         """プロフィールを更新する
@@ -3084,7 +3730,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.update_user(nickname, **params))
+        return self.call_sync(self.user.update_user(nickname, **params))
 
     def block_user(self, user_id: int) -> Response:
         """ユーザーをブロックする
@@ -3095,7 +3741,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.block_user(user_id))
+        return self.call_sync(self.user.block_user(user_id))
 
     def get_blocked_user_ids(self) -> BlockedUserIdsResponse:
         """あなたをブロックしたユーザーを取得する
@@ -3103,7 +3749,7 @@ class Client(WebSocketInteractor):
         Returns:
             BlockedUserIdsResponse:
         """
-        return asyncio.run(self.user.get_blocked_user_ids())
+        return self.call_sync(self.user.get_blocked_user_ids())
 
     def get_blocked_users(self, **params) -> BlockedUsersResponse:
         """ブロックしたユーザーを取得する
@@ -3114,7 +3760,7 @@ class Client(WebSocketInteractor):
         Returns:
             BlockedUsersResponse:
         """
-        return asyncio.run(self.user.get_blocked_users(**params))
+        return self.call_sync(self.user.get_blocked_users(**params))
 
     def unblock_user(self, user_id: int) -> Response:
         """ユーザーをアンブロックする
@@ -3125,7 +3771,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.unblock_user(user_id))
+        return self.call_sync(self.user.unblock_user(user_id))
 
     def get_hidden_users_list(self, **params) -> HiddenResponse:
         """非表示のユーザー一覧を取得する
@@ -3137,7 +3783,7 @@ class Client(WebSocketInteractor):
         Returns:
             HiddenResponse:
         """
-        return asyncio.run(self.user.get_hidden_users_list(**params))
+        return self.call_sync(self.user.get_hidden_users_list(**params))
 
     def hide_user(self, user_id: int) -> Response:
         """ユーザーを非表示にする
@@ -3148,7 +3794,7 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.hide_user(user_id))
+        return self.call_sync(self.user.hide_user(user_id))
 
     def unhide_users(self, user_ids: List[int]) -> Response:
         """ユーザーの非表示を解除する
@@ -3159,4 +3805,4 @@ class Client(WebSocketInteractor):
         Returns:
             Response:
         """
-        return asyncio.run(self.user.unhide_users(user_ids))
+        return self.call_sync(self.user.unhide_users(user_ids))
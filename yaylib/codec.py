@@ -0,0 +1,176 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+from typing import Any, Optional
+
+__all__ = [
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "get_json_codec",
+]
+
+
+class JSONCodec:
+    """JSON のエンコード、デコードを行う基底クラス"""
+
+    name = ""
+
+    def encode(self, obj: Any) -> bytes:
+        """オブジェクトを JSON のバイト列にエンコードする
+
+        Args:
+            obj (Any):
+
+        Returns:
+            bytes:
+        """
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> str:
+        """オブジェクトを JSON 文字列にエンコードする
+
+        Args:
+            obj (Any):
+
+        Returns:
+            str:
+        """
+        return self.encode(obj).decode()
+
+    def loads(self, data: bytes | str) -> Any:
+        """JSON をデコードする
+
+        Args:
+            data (bytes | str):
+
+        Raises:
+            ValueError: JSON として不正な場合
+
+        Returns:
+            Any:
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """標準ライブラリの `json` を使用するコーデック"""
+
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """`orjson` を使用するコーデック"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        import orjson
+
+        self.__orjson = orjson
+
+    def encode(self, obj: Any) -> bytes:
+        return self.__orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self.__orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """`msgspec` を使用するコーデック"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        import msgspec
+
+        self.__decode_error = msgspec.DecodeError
+        self.__encoder = msgspec.json.Encoder()
+        self.__decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        return self.__encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self.__decoder.decode(data)
+        except self.__decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+
+CODECS = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+
+def get_json_codec(codec: Optional[str | JSONCodec] = None) -> JSONCodec:
+    """JSON コーデックを取得する
+
+    Note:
+        `None` もしくは `"auto"` を指定した場合は、`orjson`、`msgspec` の順に
+        インストールされているものを使用し、どちらもなければ標準ライブラリを使用する
+
+    Args:
+        codec (str | JSONCodec, optional): コーデック名、もしくはコーデック
+
+    Raises:
+        ValueError: 不明なコーデック名の場合
+        ImportError: 指定したコーデックのライブラリがインストールされていない場合
+
+    Returns:
+        JSONCodec:
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec is None or codec == "auto":
+        for codec_class in (OrjsonCodec, MsgspecCodec):
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+        return StdlibJSONCodec()
+
+    codec_class = CODECS.get(codec)
+    if codec_class is None:
+        raise ValueError(f"Unknown JSON codec. [{codec}]")
+    return codec_class()
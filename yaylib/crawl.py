@@ -0,0 +1,137 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import hashlib
+from typing import Any, Callable, Coroutine, Iterator, Optional
+
+from .codec import JSONCodec, get_json_codec
+from .pagination import PageSpec, paginate
+from .state import CrawlCheckpoint, Storage
+
+__all__ = [
+    "Crawler",
+]
+
+
+class Crawler:
+    """カーソル方式のエンドポイントを、進捗をストレージに保存しながら取得するクラス
+
+    Note:
+        ページごとに要素と次のカーソルを一つのトランザクションで保存するため、
+        中断した場合でも `run()` を再度呼び出せば最後に保存したカーソルから再開できる。
+        取得した要素はメモリ上には保持せず、`items()` でストレージから読み出す
+
+    Args:
+        storage (Storage): 進捗を保存するストレージ（`client.state` など）
+        name (str): クロールの名前
+        method (Callable[..., Coroutine]): `client.user.get_user_followers` などの API メソッド
+        *args: API メソッドの位置引数
+        spec (PageSpec, optional): ページング方式。省略した場合はメソッドから判定する
+        prefetch (int): 先読みするページ数
+        json_codec (str | JSONCodec, optional): 要素の保存に使用する JSON コーデック
+        **params: API メソッドのキーワード引数
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        name: str,
+        method: Callable[..., Coroutine],
+        *args,
+        spec: Optional[PageSpec] = None,
+        prefetch=1,
+        json_codec: Optional[str | JSONCodec] = None,
+        **params,
+    ) -> None:
+        self.__storage = storage
+        self.__name = name
+        self.__method = method
+        self.__args = args
+        self.__spec = spec
+        self.__prefetch = prefetch
+        self.__json_codec = get_json_codec(json_codec)
+        self.__params = params
+
+    @property
+    def name(self) -> str:
+        """クロールの名前"""
+        return self.__name
+
+    @property
+    def checkpoint(self) -> Optional[CrawlCheckpoint]:
+        """保存されている進捗"""
+        return self.__storage.get_crawl(self.__name)
+
+    def __get_item_key(self, item: Any, data: Any, encoded: str) -> str:
+        item_id = getattr(item, "id", None)
+        if item_id is None and isinstance(data, dict):
+            item_id = data.get("id")
+        if item_id is not None:
+            return str(item_id)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    async def run(self, max_pages: Optional[int] = None) -> CrawlCheckpoint:
+        """保存されたカーソルから取得を再開し、最後のページまで取得する
+
+        Args:
+            max_pages (int, optional): 今回取得する最大ページ数
+
+        Returns:
+            CrawlCheckpoint: 取得後の進捗
+        """
+        checkpoint = self.checkpoint
+        if checkpoint is not None and checkpoint.done:
+            return checkpoint
+
+        async with paginate(
+            self.__method,
+            *self.__args,
+            spec=self.__spec,
+            cursor=checkpoint.cursor if checkpoint is not None else None,
+            prefetch=self.__prefetch,
+            max_pages=max_pages,
+            **self.__params,
+        ) as pages:
+            async for page in pages:
+                rows = []
+                for item in pages.get_items(page):
+                    data = getattr(item, "data", item)
+                    if hasattr(data, "to_dict"):
+                        data = data.to_dict()
+                    encoded = self.__json_codec.dumps(data)
+                    rows.append((self.__get_item_key(item, data, encoded), encoded))
+                self.__storage.save_crawl_page(
+                    self.__name, pages.cursor, rows, done=pages.done
+                )
+
+        return self.checkpoint
+
+    def items(self) -> Iterator[Any]:
+        """保存した要素を辞書型で順に取得する"""
+        for data in self.__storage.iter_crawl_items(self.__name):
+            yield self.__json_codec.loads(data)
+
+    def reset(self) -> None:
+        """進捗と保存した要素を削除する"""
+        self.__storage.delete_crawl(self.__name)
@@ -23,6 +23,7 @@ SOFTWARE.
 """
 
 from json.decoder import JSONDecodeError
+from typing import Any
 
 import aiohttp
 
@@ -575,7 +576,28 @@ class HTTPInternalServerError(HTTPError):
     """Exception raised for a 5xx HTTP status code"""
 
 
-# pylint: disable=too-many-statements
+class CircuitOpenError(YaylibError):
+    """サーキットブレーカーが開いているため、リクエストを送信せずに失敗したことを示す例外クラス"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            f"Circuit breaker for {name} is open. Retry after {retry_after:.1f} seconds."
+        )
+
+        self.__name = name
+        self.__retry_after = retry_after
+
+    @property
+    def name(self) -> str:
+        """サーキットブレーカーの名前（ホスト名）"""
+        return self.__name
+
+    @property
+    def retry_after(self) -> float:
+        """サーキットブレーカーが半開状態になるまでの秒数"""
+        return self.__retry_after
+
+
 async def raise_for_code(response: aiohttp.ClientResponse) -> None:
     """`error_code` によって例外を発生させる
 
@@ -587,11 +609,25 @@ async def raise_for_code(response: aiohttp.ClientResponse) -> None:
     """
     try:
         response_json = await response.json(content_type=None)
-        if response_json is None:
-            return None
     except JSONDecodeError:
         return None
 
+    raise_for_json(response_json)
+
+
+# pylint: disable=too-many-statements
+def raise_for_json(response_json: Any) -> None:
+    """デコード済みのレスポンスの `error_code` によって例外を発生させる
+
+    Args:
+        response_json (Any):
+
+    Raises:
+        ClientError:
+    """
+    if not isinstance(response_json, dict):
+        return
+
     err = ErrorResponse(response_json)
     if err.result is None or err.result != "error":
         return
@@ -863,6 +899,8 @@ async def raise_for_status(response: aiohttp.ClientResponse):
             raise HTTPForbiddenError(response)
         case 404:
             raise HTTPNotFoundError(response)
+        case 429:
+            raise HTTPRateLimitError(response)
         case status if status >= 500:
             raise HTTPInternalServerError(response)
         case status if status and not 200 <= status < 300:
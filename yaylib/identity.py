@@ -0,0 +1,155 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import functools
+import itertools
+import sys
+import weakref
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .models import Group, Model, Post, User
+
+__all__ = [
+    "IdentityMap",
+]
+
+DEFAULT_INTERN_FIELDS = (
+    "nickname",
+    "prefecture",
+    "generation",
+    "country_code",
+    "online_status",
+    "profile_icon",
+    "profile_icon_thumbnail",
+    "cover_image",
+    "cover_image_thumbnail",
+    "topic",
+    "icon",
+    "icon_thumbnail",
+)
+
+
+class IdentityMap:
+    """同じ識別子のモデルを一つのインスタンスにまとめるクラス
+
+    Note:
+        モデルは弱参照で保持されるため、どこからも参照されなくなれば解放される。
+        同じ識別子のモデルが再び現れた場合は、既存のインスタンスをその値で更新して返す。
+        入れ子のモデルを後から生成した場合でも、より古いレスポンスの値では更新されない。
+        ニックネームなどの繰り返し現れる文字列はインターンされる
+
+    Examples:
+        >>> client = yaylib.Client(identity_map=True)
+        >>> timeline = await client.post.get_timeline()
+        >>> timeline.posts[0].user is timeline.posts[1].user  # 同じユーザーの場合
+        True
+
+    Args:
+        models (Iterable[type], optional): まとめるモデル。省略した場合は `User`、`Group`、`Post`
+        intern_fields (Iterable[str], optional): インターンする文字列のキー
+    """
+
+    def __init__(
+        self,
+        models: Optional[Iterable[type]] = None,
+        intern_fields: Iterable[str] = DEFAULT_INTERN_FIELDS,
+    ) -> None:
+        self.__models = frozenset(models or (User, Group, Post))
+        self.__intern_fields = tuple(intern_fields)
+        self.__entities: weakref.WeakValueDictionary[Tuple[type, int], Model] = (
+            weakref.WeakValueDictionary()
+        )
+        self.__factories: Dict[Tuple[type, bool], Callable[[dict], Model]] = {}
+        self.__generations = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self.__entities)
+
+    def is_tracked(self, model: type) -> bool:
+        """モデルがまとめる対象かどうか"""
+        return model in self.__models
+
+    def get(self, model: type, model_id: Optional[int]) -> Optional[Model]:
+        """識別子に対応するモデルを取得する
+
+        Args:
+            model (type):
+            model_id (int, optional):
+
+        Returns:
+            Optional[Model]:
+        """
+        if model_id is None:
+            return None
+        return self.__entities.get((model, model_id))
+
+    def add(self, instance: Model) -> None:
+        """モデルを登録する
+
+        Args:
+            instance (Model): `id` 属性を持つモデル
+        """
+        model_id = getattr(instance, "id", None)
+        if model_id is not None:
+            self.__entities[(type(instance), model_id)] = instance
+
+    def next_generation(self) -> int:
+        """新しいレスポンスの世代を割り当てる
+
+        Returns:
+            int: これまでに割り当てたものより大きい世代
+        """
+        return next(self.__generations)
+
+    def intern(self, data: dict) -> None:
+        """辞書の文字列の値をインターンする
+
+        Args:
+            data (dict):
+        """
+        for key in self.__intern_fields:
+            value = data.get(key)
+            if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+                data[key] = sys.intern(value)
+
+    def clear(self) -> None:
+        """登録されたモデルをすべて削除する"""
+        self.__entities.clear()
+
+    def get_factory(self, model: type, slim=False) -> Callable[[dict], Model]:
+        """このマップを使用してモデルを生成する関数を取得する
+
+        Args:
+            model (type): `Model` のサブクラス
+            slim (bool): 元の辞書を保持しないモデルを生成する場合は True
+
+        Returns:
+            Callable[[dict], Model]:
+        """
+        key = (model, slim)
+        factory = self.__factories.get(key)
+        if factory is None:
+            factory = functools.partial(model.from_dict, slim=slim, identity_map=self)
+            self.__factories[key] = factory
+        return factory
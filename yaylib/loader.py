@@ -0,0 +1,254 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from .models import Post, User
+from .projection import MODELS, response_format
+
+if TYPE_CHECKING:
+    from .client import Client
+
+__all__ = [
+    "BatchLoader",
+    "DataLoader",
+]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """短い時間内に要求されたキーをまとめ、一度の一括取得で解決するクラス
+
+    Note:
+        `batch_window` 秒以内に `load()` されたキーは重複を除いて `batch_fn` に渡され、
+        結果は各呼び出し元に分配される。`max_batch_size` に達した場合は即座に取得する
+
+    Args:
+        batch_fn (Callable[[List[K]], Awaitable[Dict[K, V]]]): キーのリストから結果の辞書を返す関数
+        max_batch_size (int): 一度に取得するキーの最大数
+        batch_window (float): キーをまとめる待機時間（秒）
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size=50,
+        batch_window=0.005,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.__batch_fn = batch_fn
+        self.__max_batch_size = max_batch_size
+        self.__batch_window = batch_window
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__pending: Dict[K, asyncio.Future] = {}
+        self.__handle: Optional[asyncio.TimerHandle] = None
+        self.__tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """キーに対応する値を取得する
+
+        Args:
+            key (K):
+
+        Returns:
+            Optional[V]: 見つからなかった場合は None
+        """
+        loop = asyncio.get_running_loop()
+        if self.__loop is not loop:
+            self.__loop = loop
+            self.__pending = {}
+            self.__handle = None
+
+        future = self.__pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self.__pending[key] = future
+            if len(self.__pending) >= self.__max_batch_size:
+                self.__dispatch()
+            elif self.__handle is None:
+                self.__handle = loop.call_later(self.__batch_window, self.__dispatch)
+
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """複数のキーに対応する値を取得する
+
+        Args:
+            keys (Iterable[K]):
+
+        Returns:
+            List[Optional[V]]:
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def __dispatch(self) -> None:
+        if self.__handle is not None:
+            self.__handle.cancel()
+            self.__handle = None
+        batch, self.__pending = self.__pending, {}
+        if not batch:
+            return
+        task = self.__loop.create_task(self.__resolve(batch))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __resolve(self, batch: Dict[K, asyncio.Future]) -> None:
+        try:
+            results = await self.__batch_fn(list(batch))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+                    future.exception()  # 待機者がいない場合の未取得例外の警告を抑止する
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+
+def _get_statuses(data: Any, ids: List[int]) -> Dict[int, Any]:
+    """参加ステータスの一括取得のレスポンスから、ID ごとのステータスを取り出す
+
+    Note:
+        レスポンスは `{"statuses": {"<ID>": "<ステータス>"}}` の形式で返される。
+        含まれない ID のステータスは None とする
+
+    Args:
+        data (Any): レスポンスの辞書
+        ids (List[int]): 取得した ID
+
+    Raises:
+        ValueError: レスポンスが想定した形式でない場合
+
+    Returns:
+        Dict[int, Any]:
+    """
+    statuses = data.get("statuses") if isinstance(data, dict) else None
+    if not isinstance(statuses, dict):
+        raise ValueError(f"Unexpected joined statuses response. [{data!r}]")
+    return {i: statuses.get(str(i)) for i in ids}
+
+
+class BatchLoader:
+    """単一のエンティティの取得を一括取得エンドポイントにまとめるローダー
+
+    Note:
+        イベントハンドラなどで同時に `get_post(post_id)` を大量に呼び出す代わりに
+        `load_post(post_id)` を使うことで、リクエストを一つにまとめることができる
+
+    Args:
+        client (Client):
+        max_batch_size (int): 一度に取得する最大件数
+        batch_window (float): 取得をまとめる待機時間（秒）
+    """
+
+    def __init__(self, client: Client, max_batch_size=50, batch_window=0.005) -> None:
+        self.__client = client
+        options = {"max_batch_size": max_batch_size, "batch_window": batch_window}
+        self.__users = DataLoader(self.__fetch_users, **options)
+        self.__posts = DataLoader(self.__fetch_posts, **options)
+        self.__group_statuses = DataLoader(self.__fetch_group_statuses, **options)
+        self.__thread_statuses = DataLoader(self.__fetch_thread_statuses, **options)
+
+    async def __fetch_users(self, user_ids: List[int]) -> Dict[int, User]:
+        with response_format(MODELS):
+            response = await self.__client.user.get_users(user_ids)
+        return {user.id: user for user in response.users or []}
+
+    async def __fetch_posts(self, post_ids: List[int]) -> Dict[int, Post]:
+        with response_format(MODELS):
+            response = await self.__client.post.get_posts(post_ids)
+        return {post.id: post for post in response.posts or []}
+
+    async def __fetch_group_statuses(self, group_ids: List[int]) -> Dict[int, Any]:
+        with response_format(MODELS):
+            response = await self.__client.group.get_joined_statuses(group_ids)
+        return _get_statuses(response.data, group_ids)
+
+    async def __fetch_thread_statuses(self, thread_ids: List[int]) -> Dict[int, Any]:
+        with response_format(MODELS):
+            response = await self.__client.thread.get_thread_joined_statuses(thread_ids)
+        return _get_statuses(response.data, thread_ids)
+
+    async def load_user(self, user_id: int) -> Optional[User]:
+        """ユーザーを取得する
+
+        Args:
+            user_id (int):
+
+        Returns:
+            Optional[User]:
+        """
+        return await self.__users.load(user_id)
+
+    async def load_post(self, post_id: int) -> Optional[Post]:
+        """投稿を取得する
+
+        Args:
+            post_id (int):
+
+        Returns:
+            Optional[Post]:
+        """
+        return await self.__posts.load(post_id)
+
+    async def load_group_joined_status(self, group_id: int) -> Any:
+        """サークルの参加ステータスを取得する
+
+        Args:
+            group_id (int):
+
+        Returns:
+            Any:
+        """
+        return await self.__group_statuses.load(group_id)
+
+    async def load_thread_joined_status(self, thread_id: int) -> Any:
+        """スレッドの参加ステータスを取得する
+
+        Args:
+            thread_id (int):
+
+        Returns:
+            Any:
+        """
+        return await self.__thread_statuses.load(thread_id)
@@ -0,0 +1,394 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, List, Optional
+
+from .scheduler import BULK, request_priority
+
+__all__ = [
+    "PageSpec",
+    "Paginator",
+    "paginate",
+]
+
+
+@dataclass(slots=True)
+class PageSpec:
+    """ページングの方式
+
+    Args:
+        cursor_param (str): 次のページを取得する際に指定するパラメータ名
+        items (str): レスポンスのうち、ページの要素を保持する属性名
+        next_cursor (str, optional): レスポンスのうち、次のカーソルを保持する属性名。
+            None の場合は最後の要素の `item_cursor` 属性を用いる
+        item_cursor (str): 最後の要素から次のカーソルを求める場合の属性名
+        page_number (bool): カーソルではなくページ番号で取得するかどうか
+    """
+
+    cursor_param: str
+    items: str
+    next_cursor: Optional[str] = None
+    item_cursor: str = "id"
+    page_number: bool = False
+
+
+def _specs(names: str, spec: PageSpec) -> Dict[str, PageSpec]:
+    return {name: spec for name in names.split()}
+
+
+PAGINATION_SPECS: Dict[str, PageSpec] = {
+    # UserApi
+    **_specs(
+        "UserApi.get_user_followers UserApi.get_user_followings",
+        PageSpec("from_follow_id", "users", "last_follow_id"),
+    ),
+    "UserApi.get_active_followings": PageSpec(
+        "from_loggedin_at", "users", "last_loggedin_at"
+    ),
+    "UserApi.get_follow_request": PageSpec("from_timestamp", "users", "last_timestamp"),
+    "UserApi.get_footprints": PageSpec("from_id", "footprints"),
+    "UserApi.search_users": PageSpec("from_timestamp", "users", "next_page_value"),
+    "UserApi.search_lobi_users": PageSpec("from_str", "users", "next_page_value"),
+    "UserApi.get_hidden_users_list": PageSpec(
+        "from_str", "hidden_users", "next_page_value"
+    ),
+    # PostApi
+    **_specs(
+        "PostApi.get_user_timeline PostApi.get_my_posts PostApi.get_group_timeline "
+        "PostApi.get_timeline_by_hashtag PostApi.get_reposts PostApi.get_conversation",
+        PageSpec("from_post_id", "posts"),
+    ),
+    **_specs(
+        "PostApi.get_following_timeline PostApi.get_bookmark",
+        PageSpec("from_str", "posts", "next_page_value"),
+    ),
+    **_specs(
+        "PostApi.get_timeline_calls PostApi.get_following_call_timeline",
+        PageSpec("from_timestamp", "posts", "next_page_value"),
+    ),
+    "PostApi.get_post_likers": PageSpec("from_id", "users", "last_id"),
+    "PostApi.get_group_highlight_posts": PageSpec("from_post", "posts"),
+    # GroupApi
+    **_specs(
+        "GroupApi.get_groups GroupApi.get_my_groups",
+        PageSpec("from_timestamp", "groups", item_cursor="updated_at"),
+    ),
+    "GroupApi.get_user_groups": PageSpec("page", "groups", page_number=True),
+    "GroupApi.get_banned_group_members": PageSpec("page", "users", page_number=True),
+    # ChatApi
+    **_specs(
+        "ChatApi.get_main_chat_rooms ChatApi.get_hidden_chat_rooms "
+        "ChatApi.get_chat_requests",
+        PageSpec("from_timestamp", "chat_rooms", "next_page_value"),
+    ),
+    "ChatApi.get_messages": PageSpec("from_message_id", "messages"),
+    # NotificationApi
+    **_specs(
+        "NotificationApi.get_activities NotificationApi.get_merged_activities",
+        PageSpec("from_timestamp", "activities", "last_timestamp"),
+    ),
+    # ReviewApi
+    **_specs(
+        "ReviewApi.get_reviews ReviewApi.get_my_reviews",
+        PageSpec("from_id", "reviews"),
+    ),
+    # ThreadApi
+    **_specs(
+        "ThreadApi.get_group_thread_list",
+        PageSpec("from_str", "threads", "next_page_value"),
+    ),
+    "ThreadApi.get_thread_posts": PageSpec("from_str", "posts", "next_page_value"),
+    # CallApi
+    "CallApi.get_group_calls": PageSpec("from_timestamp", "posts", "next_page_value"),
+    "CallApi.get_games": PageSpec("from_id", "games", "from_id"),
+    "CallApi.get_genres": PageSpec("from", "genres", "next_page_value"),
+}
+
+
+def get_field(obj: Any, name: str) -> Any:
+    """モデル、レコード、辞書型のいずれからも属性を取得する"""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def get_page_spec(method: Callable[..., Coroutine]) -> PageSpec:
+    """API メソッドのページング方式を取得する
+
+    Args:
+        method (Callable[..., Coroutine]): `client.user.get_user_followers` などの API メソッド
+
+    Returns:
+        PageSpec:
+
+    Raises:
+        ValueError: ページングに対応していないメソッドの場合
+    """
+    spec = PAGINATION_SPECS.get(getattr(method, "__qualname__", ""))
+    if spec is None:
+        raise ValueError(
+            f"{getattr(method, '__qualname__', method)!r} does not support pagination."
+            " Pass spec=PageSpec(...) explicitly."
+        )
+    return spec
+
+
+def _cancel_task(task: asyncio.Task) -> None:
+    """イベントループが終了していなければタスクをキャンセルする"""
+    if not task.done() and not task.get_loop().is_closed():
+        task.cancel()
+
+
+class Paginator:
+    """カーソル方式のエンドポイントを順に取得する非同期イテレータ
+
+    Note:
+        呼び出し元がページを処理している間に、最大 `prefetch` ページ先まで取得しておく。
+        `cursor` を保存しておけば、`paginate(..., cursor=cursor)` で続きから再開できる。
+        途中で反復をやめる場合は `async with` で使用するか `aclose()` を呼び出すこと。
+        呼び出されなかった場合も、イテレータがガベージコレクションされた時点で先読みは停止する
+
+    Args:
+        method (Callable[..., Coroutine]): API メソッド
+        *args: API メソッドの位置引数
+        spec (PageSpec, optional): ページング方式。省略した場合はメソッドから判定する
+        cursor (Any, optional): 取得を開始するカーソル
+        prefetch (int): 先読みするページ数、0 の場合は先読みしない
+        max_pages (int, optional): 取得する最大ページ数
+        priority (str): リクエストの優先度クラス
+        **params: API メソッドのキーワード引数
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Coroutine],
+        *args,
+        spec: Optional[PageSpec] = None,
+        cursor: Any = None,
+        prefetch=1,
+        max_pages: Optional[int] = None,
+        priority=BULK,
+        **params,
+    ) -> None:
+        self.__method = method
+        self.__args = args
+        self.__spec = spec or get_page_spec(method)
+        self.__params = params
+        self.__prefetch = max(0, prefetch)
+        self.__max_pages = max_pages
+        self.__priority = priority
+        if cursor is None and self.__spec.page_number:
+            cursor = params.pop(self.__spec.cursor_param, 1)
+        self.__cursor = cursor
+        self.__fetch_cursor = cursor
+        self.__pages_fetched = 0
+        self.__pages_returned = 0
+        self.__done = False
+        self.__closed = False
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__slots: Optional[asyncio.Semaphore] = None
+        self.__producer: Optional[asyncio.Task] = None
+
+    @property
+    def cursor(self) -> Any:
+        """次に返すページのカーソル。チェックポイントとして保存できる"""
+        return self.__cursor
+
+    @property
+    def done(self) -> bool:
+        """最後のページまで返し終えたかどうか"""
+        return self.__done
+
+    def __reached_max_pages(self, pages: int) -> bool:
+        return self.__max_pages is not None and pages >= self.__max_pages
+
+    def get_items(self, page: Any) -> List[Any]:
+        """ページの要素を取得する"""
+        return get_field(page, self.__spec.items) or []
+
+    def __get_next_cursor(self, page: Any, cursor: Any) -> Any:
+        items = self.get_items(page)
+        if not items:
+            return None
+        if self.__spec.page_number:
+            return cursor + 1
+        if self.__spec.next_cursor is not None:
+            next_cursor = get_field(page, self.__spec.next_cursor)
+        else:
+            next_cursor = get_field(items[-1], self.__spec.item_cursor)
+        if next_cursor == cursor:
+            return None  # 同じページを繰り返し取得しないようにする
+        return next_cursor
+
+    async def __fetch(self) -> tuple:
+        """次のページを取得し、ページと次のカーソルを返す"""
+        cursor = self.__fetch_cursor
+        params = dict(self.__params)
+        if cursor is not None:
+            params[self.__spec.cursor_param] = cursor
+        with request_priority(self.__priority):
+            page = await self.__method(*self.__args, **params)
+        self.__pages_fetched += 1
+        next_cursor = self.__get_next_cursor(page, cursor)
+        self.__fetch_cursor = next_cursor
+        return page, next_cursor
+
+    async def __prefetch_page(self) -> tuple:
+        """次のページを取得し、ページと次のカーソル、最後のページかどうかを返す"""
+        page, next_cursor = await self.__fetch()
+        finished = next_cursor is None or self.__reached_max_pages(self.__pages_fetched)
+        return page, next_cursor, finished
+
+    @staticmethod
+    async def __produce(
+        ref: "weakref.WeakMethod",
+        queue: asyncio.Queue,
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """ページを先読みしてキューに追加する
+
+        Note:
+            未取得のページが `prefetch` に達している間は取得を待機する。
+            待機中はイテレータを弱参照でのみ保持し、ガベージコレクションを妨げない
+        """
+        try:
+            while True:
+                await slots.acquire()
+                fetch = ref()
+                if fetch is None:
+                    return
+                page, next_cursor, finished = await fetch()
+                del fetch
+                queue.put_nowait((page, next_cursor, None))
+                if finished:
+                    return
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            queue.put_nowait((None, None, exc))
+
+    def __aiter__(self) -> "Paginator":
+        return self
+
+    async def __anext__(self) -> Any:
+        if (
+            self.__done
+            or self.__closed
+            or self.__reached_max_pages(self.__pages_returned)
+        ):
+            raise StopAsyncIteration
+
+        if self.__prefetch == 0:
+            page, next_cursor = await self.__fetch()
+        else:
+            if self.__producer is None:
+                self.__queue = asyncio.Queue()
+                self.__slots = asyncio.Semaphore(self.__prefetch)
+                self.__producer = asyncio.ensure_future(
+                    self.__produce(
+                        weakref.WeakMethod(self.__prefetch_page),
+                        self.__queue,
+                        self.__slots,
+                    )
+                )
+                weakref.finalize(self, _cancel_task, self.__producer)
+            page, next_cursor, exc = await self.__queue.get()
+            self.__slots.release()
+            if exc is not None:
+                self.__done = True
+                raise exc
+
+        self.__cursor = next_cursor
+        self.__pages_returned += 1
+        if next_cursor is None:
+            self.__done = True
+        return page
+
+    async def items(self) -> AsyncIterator[Any]:
+        """ページをまたいで要素を順に返す"""
+        async for page in self:
+            for item in self.get_items(page):
+                yield item
+
+    async def aclose(self) -> None:
+        """先読みを停止する"""
+        self.__closed = True
+        if self.__producer is not None and not self.__producer.done():
+            self.__producer.cancel()
+            try:
+                await self.__producer
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> "Paginator":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+def paginate(
+    method: Callable[..., Coroutine],
+    *args,
+    spec: Optional[PageSpec] = None,
+    cursor: Any = None,
+    prefetch=1,
+    max_pages: Optional[int] = None,
+    priority=BULK,
+    **params,
+) -> Paginator:
+    """カーソル方式のエンドポイントをページごとに取得する非同期イテレータを作成する
+
+    Examples:
+        フォロワーを全員取得する場合
+
+        >>> async with paginate(client.user.get_user_followers, user_id) as pages:
+        >>>     async for page in pages:
+        >>>         followers.extend(page.users)
+        >>>         checkpoint = pages.cursor  # 保存しておけば続きから再開できる
+
+    Args:
+        method (Callable[..., Coroutine]): `client.user.get_user_followers` などの API メソッド
+        *args: API メソッドの位置引数
+        spec (PageSpec, optional): ページング方式。省略した場合はメソッドから判定する
+        cursor (Any, optional): 取得を開始するカーソル
+        prefetch (int): 先読みするページ数、0 の場合は先読みしない
+        max_pages (int, optional): 取得する最大ページ数
+        priority (str): リクエストの優先度クラス。既定では大量取得として扱う
+        **params: API メソッドのキーワード引数
+
+    Returns:
+        Paginator:
+    """
+    return Paginator(
+        method,
+        *args,
+        spec=spec,
+        cursor=cursor,
+        prefetch=prefetch,
+        max_pages=max_pages,
+        priority=priority,
+        **params,
+    )
@@ -0,0 +1,285 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import itertools
+import os
+from typing import Dict, Iterator, List, Optional
+
+import aiohttp
+
+from .circuit import CircuitBreakerRegistry
+from .client import Client, current_path
+from .ratelimit import RateLimiter, get_endpoint_group
+from .retry import RetryBudget, RetryPolicy
+from .scheduler import RequestScheduler
+from .state import SQLiteConnectionPool, State
+
+__all__ = [
+    "ClientPool",
+]
+
+
+async def _close_connector(connector: aiohttp.TCPConnector) -> None:
+    await connector.close()
+
+
+class ClientPool:
+    """複数のアカウントのクライアントを、一つのイベントループとコネクターで管理するクラス
+
+    Note:
+        各アカウントのクライアントは、コネクター、SQLite のコネクション、レート制限、
+        サーキットブレーカー、再試行の予算、リクエストスケジューラーを共有する。
+        レート制限とトークンの状態はアカウントごとに分けて管理される
+
+    Args:
+        base_path (str): ステートを保存するディレクトリ
+        storage_pool_size (int): 共有する SQLite のコネクション数
+        max_connections (int): 共有するコネクターの最大コネクション数
+        max_connections_per_host (int): ホストごとの最大コネクション数
+        keepalive_timeout (float): コネクションを維持する秒数
+        dns_cache_ttl (int): DNS キャッシュの有効期間（秒）
+        rate_limiter (RateLimiter, optional): 共有するレート制限
+        circuit_breaker (CircuitBreakerRegistry, optional): 共有するサーキットブレーカー
+        retry_policy (RetryPolicy, optional): 共有する再試行方針
+        scheduler (RequestScheduler, optional): 共有するリクエストスケジューラー
+        **client_options: 各クライアントに渡す引数
+    """
+
+    def __init__(
+        self,
+        *,
+        base_path=current_path + "/.config/",
+        storage_pool_size=5,
+        max_connections=100,
+        max_connections_per_host=30,
+        keepalive_timeout=30,
+        dns_cache_ttl=300,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreakerRegistry] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        **client_options,
+    ) -> None:
+        if not os.path.exists(base_path):
+            os.makedirs(base_path)
+
+        self.__base_path = base_path
+        self.__storage_pool = SQLiteConnectionPool(
+            base_path + "secret.db", storage_pool_size
+        )
+        self.__connector_options = {
+            "limit": max_connections,
+            "limit_per_host": max_connections_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": dns_cache_ttl,
+        }
+        self.__connector: Optional[aiohttp.TCPConnector] = None
+        self.__connector_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__rate_limiter = rate_limiter or RateLimiter()
+        self.__circuit_breaker = circuit_breaker or CircuitBreakerRegistry()
+        self.__retry_policy = retry_policy or RetryPolicy(budget=RetryBudget())
+        self.__scheduler = scheduler or RequestScheduler(
+            max_concurrency=max_connections
+        )
+        self.__client_options = client_options
+        self.__clients: Dict[int, Client] = {}
+        self.__counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.__clients)
+
+    def __iter__(self) -> Iterator[Client]:
+        return iter(list(self.__clients.values()))
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.__clients
+
+    def __getitem__(self, user_id: int) -> Client:
+        return self.__clients[user_id]
+
+    @property
+    def user_ids(self) -> List[int]:
+        """ログイン済みのアカウントの識別子"""
+        return list(self.__clients)
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """共有しているレート制限"""
+        return self.__rate_limiter
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        """共有しているコネクター
+
+        Note:
+            イベントループが変わった場合は、以前のループで作成したコネクターを終了して作り直す
+        """
+        loop = asyncio.get_running_loop()
+        connector = self.__connector
+        if connector is None or connector.closed or self.__connector_loop is not loop:
+            if connector is not None and not connector.closed:
+                self.__schedule_close(connector, self.__connector_loop)
+            connector = aiohttp.TCPConnector(**self.__connector_options)
+            self.__connector = connector
+            self.__connector_loop = loop
+        return connector
+
+    @staticmethod
+    def __schedule_close(
+        connector: aiohttp.TCPConnector, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """コネクターの終了を、作成したイベントループで実行するよう予約する"""
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(_close_connector(connector), loop)
+        else:
+            # ループが終了済みの場合は接続も破棄されているため、終了済みとして扱うだけでよい
+            asyncio.get_running_loop().create_task(_close_connector(connector))
+
+    def create_client(self) -> Client:
+        """共有リソースを使用する未ログインのクライアントを作成する
+
+        Note:
+            イベントループ内から呼び出す必要がある
+
+        Returns:
+            Client:
+        """
+        return Client(
+            connector=self.connector,
+            rate_limiter=self.__rate_limiter,
+            circuit_breaker=self.__circuit_breaker,
+            retry_policy=self.__retry_policy,
+            scheduler=self.__scheduler,
+            base_path=self.__base_path,
+            state=State(
+                storage_path=self.__base_path + "secret.db",
+                storage_pool=self.__storage_pool,
+            ),
+            use_portal=False,
+            **self.__client_options,
+        )
+
+    async def add_account(
+        self, email: str, password: str, two_fa_code: Optional[str] = None
+    ) -> Client:
+        """アカウントにログインし、プールに追加する
+
+        Note:
+            ローカルのストレージに認証情報がある場合は、それを使用する
+
+        Args:
+            email (str):
+            password (str):
+            two_fa_code (str, optional):
+
+        Returns:
+            Client:
+        """
+        client = self.create_client()
+        try:
+            await client.auth.login(email, password, two_fa_code)
+        except BaseException:
+            await client.aclose()
+            raise
+        self.add_client(client)
+        return client
+
+    def add_client(self, client: Client) -> None:
+        """ログイン済みのクライアントをプールに追加する
+
+        Args:
+            client (Client):
+        """
+        if client.user_id == 0:
+            raise ValueError("Only logged-in clients can be added to the pool.")
+        self.__clients[client.user_id] = client
+
+    async def remove_account(self, user_id: int) -> None:
+        """アカウントをプールから取り除く
+
+        Args:
+            user_id (int):
+        """
+        client = self.__clients.pop(user_id, None)
+        if client is not None:
+            await client.aclose()
+
+    def get(self, user_id: int) -> Optional[Client]:
+        """アカウントのクライアントを取得する
+
+        Args:
+            user_id (int):
+
+        Returns:
+            Optional[Client]:
+        """
+        return self.__clients.get(user_id)
+
+    def pick(self, method="GET", url="") -> Client:
+        """読み取り専用のリクエストに使用するクライアントを選択する
+
+        Note:
+            エンドポイントグループのレート制限に最も余裕があるアカウントを選択する。
+            余裕が同じ場合は順番に割り当てる
+
+        Args:
+            method (str): リクエストの HTTP メソッド
+            url (str): リクエストの URL
+
+        Returns:
+            Client:
+
+        Raises:
+            LookupError: プールにアカウントが存在しない場合
+        """
+        clients = list(self.__clients.values())
+        if not clients:
+            raise LookupError("No accounts in the pool.")
+
+        group = get_endpoint_group(method, url)
+        offset = next(self.__counter) % len(clients)
+        clients = clients[offset:] + clients[:offset]
+
+        def score(client: Client) -> tuple:
+            bucket = self.__rate_limiter.get_bucket(group, client.user_id)
+            return bucket.paused_for, -bucket.tokens
+
+        return min(clients, key=score)
+
+    async def aclose(self) -> None:
+        """すべてのクライアントと共有しているコネクターを終了する"""
+        clients = list(self.__clients.values())
+        self.__clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
+        if self.__connector is not None and not self.__connector.closed:
+            await self.__connector.close()
+        self.__connector = None
+        self.__connector_loop = None
+
+    async def __aenter__(self) -> "ClientPool":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
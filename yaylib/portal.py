@@ -0,0 +1,143 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BlockingPortal:
+    """専用スレッドのイベントループ上でコルーチンを実行するクラス
+
+    同期メソッドから呼び出されたコルーチンは全て同じイベントループで実行されるため、
+    複数のスレッドから同時に呼び出してもコネクションを共有できる
+    """
+
+    def __init__(self, name="yaylib-portal") -> None:
+        self.__name = name
+        self.__lock = threading.Lock()
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__shutdown_hooks: List[Callable[[], Optional[Awaitable[Any]]]] = []
+
+    @property
+    def running(self) -> bool:
+        """イベントループが起動しているか否か"""
+        return self.__loop is not None
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """ポータルのイベントループ"""
+        return self.__loop
+
+    def add_shutdown_hook(self, hook: Callable[[], Optional[Awaitable[Any]]]) -> None:
+        """イベントループの停止前に実行する処理を登録する
+
+        Args:
+            hook (Callable[[], Optional[Awaitable[Any]]]): awaitable を返す関数
+        """
+        self.__shutdown_hooks.append(hook)
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """イベントループのスレッドを起動する
+
+        Returns:
+            asyncio.AbstractEventLoop: 起動済みのイベントループ
+        """
+        with self.__lock:
+            if self.__loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self.__run_forever,
+                    args=(loop, ready),
+                    name=self.__name,
+                    daemon=True,
+                )
+                thread.start()
+                ready.wait()
+                self.__loop = loop
+                self.__thread = thread
+            return self.__loop
+
+    def call(self, coro: Coroutine[Any, Any, T]) -> T:
+        """コルーチンをイベントループに送信し、結果が返るまで待機する
+
+        Args:
+            coro (Coroutine[Any, Any, T]):
+
+        Raises:
+            RuntimeError: ポータルのスレッド内から呼び出された場合
+
+        Returns:
+            T: コルーチンの戻り値
+        """
+        loop = self.start()
+        if threading.current_thread() is self.__thread:
+            coro.close()
+            raise RuntimeError(
+                "Synchronous methods cannot be called from the portal event loop. "
+                "Use the async API instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def stop(self) -> None:
+        """登録された終了処理を実行し、イベントループのスレッドを停止する"""
+        with self.__lock:
+            loop, thread = self.__loop, self.__thread
+            if loop is None or thread is None:
+                return
+
+            for hook in self.__shutdown_hooks:
+                awaitable = hook()
+                if awaitable is not None:
+                    asyncio.run_coroutine_threadsafe(
+                        self.__await(awaitable), loop
+                    ).result()
+
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+            self.__loop = None
+            self.__thread = None
+
+    @staticmethod
+    async def __await(awaitable: Awaitable[T]) -> T:
+        return await awaitable
+
+    @staticmethod
+    def __run_forever(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
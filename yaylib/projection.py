@@ -0,0 +1,170 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import contextlib
+import functools
+from collections import namedtuple
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+__all__ = [
+    "MODELS",
+    "RAW",
+    "SLIM",
+    "Projection",
+    "get_response_format",
+    "response_format",
+]
+
+MODELS = "models"
+RAW = "raw"
+SLIM = "slim"
+
+_current_format: ContextVar[Optional[Any]] = ContextVar(
+    "yaylib_response_format", default=None
+)
+
+
+@contextlib.contextmanager
+def response_format(fmt: "str | Projection") -> Iterator[None]:
+    """ブロック内で受け取るレスポンスの形式を指定する
+
+    Examples:
+        >>> with yaylib.response_format(yaylib.RAW):
+        >>>     timeline = await client.post.get_timeline()  # dict
+
+        >>> with yaylib.response_format(yaylib.Projection("id", "user.id", "liked")):
+        >>>     timeline = await client.post.get_timeline()
+        >>>     timeline["posts"][0].user_id
+
+    Args:
+        fmt (str | Projection): `models`、`raw`、`slim`、もしくは `Projection`
+    """
+    token = _current_format.set(fmt)
+    try:
+        yield
+    finally:
+        _current_format.reset(token)
+
+
+def get_response_format(default: "str | Projection" = MODELS) -> "str | Projection":
+    """現在のレスポンスの形式を取得する
+
+    Args:
+        default (str | Projection): `response_format()` で指定されていない場合の形式
+
+    Returns:
+        str | Projection:
+    """
+    fmt = _current_format.get()
+    return default if fmt is None else fmt
+
+
+@functools.lru_cache(maxsize=None)
+def get_slim_factory(model: type) -> Callable[[dict], Any]:
+    """元の辞書を保持しないモデルを生成する関数を取得する
+
+    Args:
+        model (type): `Model` のサブクラス
+
+    Returns:
+        Callable[[dict], Any]:
+    """
+    return functools.partial(model.from_dict, slim=True)
+
+
+class Projection:
+    """レスポンスから指定したフィールドのみを取り出し、軽量なレコードを生成するクラス
+
+    Note:
+        レスポンス直下の辞書と辞書のリストがレコードに変換され、カーソルなどの
+        それ以外の値はそのまま残る。入れ子のフィールドは `.` で区切って指定し、
+        レコードの属性名は `_` で連結したもの（`user.id` は `user_id`）になる
+
+    Examples:
+        >>> projection = yaylib.Projection("id", "user.id", "liked")
+        >>> projection({"posts": [{"id": 1, "user": {"id": 2}}], "next_page_value": 1})
+        {'posts': [Record(id=1, user_id=2, liked=None)], 'next_page_value': 1}
+
+    Args:
+        *fields (str): 取り出すフィールド
+        name (str): レコードの型名
+    """
+
+    def __init__(self, *fields: str, name="Record") -> None:
+        if not fields:
+            raise ValueError("At least one field is required.")
+        self.__fields = fields
+        self.__paths: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(field.split(".")) for field in fields
+        )
+        base = namedtuple(name, [field.replace(".", "_") for field in fields])
+        self.__record = type(name, (base,), {"__slots__": (), "to_dict": base._asdict})
+
+    def __repr__(self) -> str:
+        return f"Projection{self.__fields}"
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """取り出すフィールド"""
+        return self.__fields
+
+    @property
+    def record(self) -> type:
+        """生成するレコードの型"""
+        return self.__record
+
+    def project(self, data: dict) -> tuple:
+        """辞書からレコードを生成する
+
+        Args:
+            data (dict):
+
+        Returns:
+            tuple: 指定したフィールドを持つ名前付きタプル
+        """
+        values = []
+        for path in self.__paths:
+            value = data
+            for key in path:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(key)
+            values.append(value)
+        return self.__record._make(values)
+
+    def __call__(self, response: Any) -> Any:
+        if isinstance(response, list):
+            return [self.project(item) for item in response]
+        if not isinstance(response, dict):
+            return response
+        result = {}
+        for key, value in response.items():
+            if isinstance(value, dict):
+                value = self.project(value)
+            elif isinstance(value, list) and value and isinstance(value[0], dict):
+                value = [self.project(item) for item in value]
+            result[key] = value
+        return result
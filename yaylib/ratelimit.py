@@ -0,0 +1,525 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .errors import ClientError, HTTPError
+
+__all__ = [
+    "RateLimit",
+    "RateLimitRule",
+    "TokenBucket",
+    "RateLimiter",
+    "get_endpoint_group",
+]
+
+
+@dataclass(slots=True)
+class RateLimitRule:
+    """エンドポイントグループごとのレート制限の設定
+
+    Args:
+        rate (float): 1秒あたりに補充されるトークン数
+        burst (float): バケットの容量（連続で送信可能なリクエスト数）
+        min_rate (float, optional): レート制限時に下げる送信レートの下限
+        max_rate (float, optional): 成功時に上げる送信レートの上限
+    """
+
+    rate: float
+    burst: float
+    min_rate: Optional[float] = None
+    max_rate: Optional[float] = None
+
+
+DEFAULT_RATE_LIMIT_RULES = {
+    "default": RateLimitRule(rate=2.0, burst=5),
+    "posts": RateLimitRule(rate=1.0, burst=3),
+    "chat": RateLimitRule(rate=1.0, burst=5),
+    "follow": RateLimitRule(rate=0.5, burst=2),
+    "search": RateLimitRule(rate=0.5, burst=3),
+}
+
+ENDPOINT_GROUP_PATTERNS = (
+    ("follow", re.compile(r"/(un)?follow(_request)?$|/list_followings$")),
+    ("search", re.compile(r"/search$|/posts/tags/")),
+    ("chat", re.compile(r"/chat_rooms|/hidden/chats")),
+    ("posts", re.compile(r"/posts|/conversations|/surveys")),
+)
+
+
+def get_endpoint_group(method: str, url: str) -> str:
+    """URL からエンドポイントグループを判定する
+
+    Args:
+        method (str):
+        url (str):
+
+    Returns:
+        str: `follow`、`search`、`chat`、`posts`、`default` のいずれか
+    """
+    path = urlsplit(url if "://" in url else "https://" + url).path
+    for group, pattern in ENDPOINT_GROUP_PATTERNS:
+        if pattern.search(path):
+            if group == "follow" and method.upper() == "GET":
+                continue
+            return group
+    return "default"
+
+
+class TokenBucket:
+    """トークンバケット方式でリクエストの送信間隔を制御するクラス
+
+    Note:
+        トークンは予約制で消費される。`acquire()` で待機するコルーチンは一つずつ順番に予約し、
+        順番は優先度の高いものから、同じ優先度では到着順に回ってくる。
+        レート制限に達した場合は送信レートを乗算的に下げ、成功するたびに加算的に戻す (AIMD)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+    ) -> None:
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be positive.")
+        self.__base_rate = float(rate)
+        self.__rate = float(rate)
+        self.__min_rate = float(min_rate) if min_rate else self.__base_rate / 10
+        self.__max_rate = float(max_rate) if max_rate else self.__base_rate
+        self.__burst = float(burst)
+        self.__tokens = float(burst)
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+        self.__busy = False
+        self.__waiters: List[tuple] = []
+        self.__counter = itertools.count()
+
+    @property
+    def rate(self) -> float:
+        """1秒あたりに補充されるトークン数"""
+        return self.__rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.__rate = min(max(float(value), self.__min_rate), self.__max_rate)
+
+    @property
+    def burst(self) -> float:
+        """バケットの容量"""
+        return self.__burst
+
+    @property
+    def tokens(self) -> float:
+        """現在のトークン数（予約済みの分は負の値になる）"""
+        with self.__lock:
+            self.__refill(time.monotonic())
+            return self.__tokens
+
+    @property
+    def paused_for(self) -> float:
+        """一時停止が解除されるまでの秒数"""
+        return max(0.0, self.__updated_at - time.monotonic())
+
+    def __refill(self, now: float) -> None:
+        if now > self.__updated_at:
+            elapsed = now - self.__updated_at
+            self.__tokens = min(self.__burst, self.__tokens + elapsed * self.__rate)
+            self.__updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """トークンを予約し、利用可能になるまでの待機秒数を返す
+
+        Args:
+            tokens (float, optional):
+
+        Returns:
+            float: 待機秒数
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+            self.__tokens -= tokens
+            delay = max(0.0, self.__updated_at - now)
+            if self.__tokens < 0:
+                delay += -self.__tokens / self.__rate
+            return delay
+
+    def refund(self, tokens: float = 1) -> None:
+        """予約したトークンを返却する
+
+        Args:
+            tokens (float, optional):
+        """
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.__tokens = min(self.__burst, self.__tokens + tokens)
+
+    def pause(self, seconds: float) -> None:
+        """指定した秒数の間、トークンの補充と払い出しを停止する
+
+        Args:
+            seconds (float):
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+            until = now + max(0.0, seconds)
+            if until > self.__updated_at:
+                self.__tokens = min(self.__tokens, 1.0)
+                self.__updated_at = until
+
+    def decrease(self, factor: float = 0.5) -> None:
+        """送信レートを乗算的に下げる
+
+        Args:
+            factor (float, optional):
+        """
+        self.rate = self.__rate * factor
+
+    def increase(self, ratio: float = 0.05) -> None:
+        """送信レートを設定値に対する割合で加算的に上げる
+
+        Args:
+            ratio (float, optional):
+        """
+        if self.__rate < self.__max_rate:
+            self.rate = self.__rate + self.__base_rate * ratio
+
+    def __wake_next(self) -> None:
+        """待機中のコルーチンのうち、優先度の最も高いものに順番を渡す"""
+        while self.__waiters:
+            _, _, loop, waiter = heapq.heappop(self.__waiters)
+            if not waiter.done():
+                loop.call_soon_threadsafe(self.__grant, waiter)
+                return
+        self.__busy = False
+
+    def __grant(self, waiter: asyncio.Future) -> None:
+        with self.__lock:
+            if waiter.done():
+                self.__wake_next()  # 順番が回る前にキャンセルされた場合は次に渡す
+            else:
+                waiter.set_result(None)
+
+    async def __wait_turn(self, priority: int) -> bool:
+        """予約の順番が回ってくるまで待機し、待機した場合は True を返す"""
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            if not self.__busy:
+                self.__busy = True
+                return False
+            waiter = loop.create_future()
+            entry = (priority, next(self.__counter), loop, waiter)
+            heapq.heappush(self.__waiters, entry)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self.__lock:
+                if waiter.done() and not waiter.cancelled():
+                    self.__wake_next()  # 順番が回った直後にキャンセルされた場合は次に渡す
+                elif entry in self.__waiters:
+                    self.__waiters.remove(entry)
+                    heapq.heapify(self.__waiters)
+            raise
+        return True
+
+    async def acquire(self, tokens: float = 1, *, priority: int = 0) -> float:
+        """トークンが利用可能になるまで待機する
+
+        Note:
+            予約したトークンが利用可能になるまでは次のコルーチンは予約しないため、
+            後から到着した優先度の高いリクエストは、先に待機している優先度の低い
+            リクエストより先に送信される
+
+        Args:
+            tokens (float, optional):
+            priority (int, optional): 優先度。値が小さいほど先に順番が回ってくる
+
+        Returns:
+            float: 実際に待機した秒数
+        """
+        start = time.monotonic()
+        queued = 0.0
+        if await self.__wait_turn(priority):
+            queued = time.monotonic() - start
+        try:
+            delay = self.reserve(tokens)
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    self.refund(tokens)
+                    raise
+            return queued + delay
+        finally:
+            with self.__lock:
+                self.__wake_next()
+
+    def __repr__(self):
+        return f"TokenBucket(rate={self.__rate}, burst={self.__burst})"
+
+
+class RateLimiter:
+    """エンドポイントグループ、アカウントごとのトークンバケットを管理するクラス
+
+    Examples:
+        >>> limiter = yaylib.RateLimiter({"posts": yaylib.RateLimitRule(rate=2, burst=5)})
+        >>> client = yaylib.Client(rate_limiter=limiter)
+
+    Args:
+        rules (Dict[str, RateLimitRule], optional): デフォルト設定を上書きするルール
+        adaptive (bool, optional): レート制限の応答に応じて送信レートを調整するか否か
+        decrease_factor (float, optional): レート制限時に送信レートに掛ける係数
+        increase_ratio (float, optional): 成功時に設定値に対して加算する送信レートの割合
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, RateLimitRule]] = None,
+        *,
+        adaptive=True,
+        decrease_factor=0.5,
+        increase_ratio=0.05,
+    ) -> None:
+        self.__rules = dict(DEFAULT_RATE_LIMIT_RULES)
+        self.__rules.update(rules or {})
+        self.__adaptive = adaptive
+        self.__decrease_factor = decrease_factor
+        self.__increase_ratio = increase_ratio
+        self.__buckets: Dict[Tuple[int, str], TokenBucket] = {}
+        self.__account_paused_until: Dict[int, float] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def rules(self) -> Dict[str, RateLimitRule]:
+        """エンドポイントグループごとのルール"""
+        return self.__rules
+
+    def get_rule(self, group: str) -> RateLimitRule:
+        """エンドポイントグループのルールを取得する
+
+        Args:
+            group (str):
+
+        Returns:
+            RateLimitRule:
+        """
+        return self.__rules.get(group) or self.__rules["default"]
+
+    def get_bucket(self, group: str, account_id: int = 0) -> TokenBucket:
+        """エンドポイントグループ、アカウントに対応するトークンバケットを取得する
+
+        Args:
+            group (str):
+            account_id (int, optional):
+
+        Returns:
+            TokenBucket:
+        """
+        key = (account_id, group)
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            with self.__lock:
+                bucket = self.__buckets.get(key)
+                if bucket is None:
+                    rule = self.get_rule(group)
+                    bucket = TokenBucket(
+                        rule.rate, rule.burst, rule.min_rate, rule.max_rate
+                    )
+                    paused_until = self.__account_paused_until.get(account_id, 0)
+                    if paused_until > time.monotonic():
+                        bucket.pause(paused_until - time.monotonic())
+                    self.__buckets[key] = bucket
+        return bucket
+
+    async def acquire(
+        self, method: str, url: str, account_id: int = 0, *, priority: int = 0
+    ) -> float:
+        """リクエストの送信が可能になるまで待機する
+
+        Args:
+            method (str):
+            url (str):
+            account_id (int, optional):
+            priority (int, optional): 優先度。値が小さいほど先に送信される
+
+        Returns:
+            float: 実際に待機した秒数
+        """
+        group = get_endpoint_group(method, url)
+        bucket = self.get_bucket(group, account_id)
+        return await bucket.acquire(priority=priority)
+
+    def on_success(self, method: str, url: str, account_id: int = 0) -> None:
+        """リクエストの成功を記録し、送信レートを加算的に上げる
+
+        Args:
+            method (str):
+            url (str):
+            account_id (int, optional):
+        """
+        if self.__adaptive:
+            group = get_endpoint_group(method, url)
+            self.get_bucket(group, account_id).increase(self.__increase_ratio)
+
+    def on_rate_limited(
+        self, method: str, url: str, account_id: int = 0, retry_after: float = 0
+    ) -> None:
+        """レート制限を記録し、該当するエンドポイントグループのみを一時停止する
+
+        Args:
+            method (str):
+            url (str):
+            account_id (int, optional):
+            retry_after (float, optional): 一時停止する秒数
+        """
+        group = get_endpoint_group(method, url)
+        bucket = self.get_bucket(group, account_id)
+        bucket.pause(retry_after)
+        if self.__adaptive:
+            bucket.decrease(self.__decrease_factor)
+
+    def pause_account(self, account_id: int, seconds: float) -> None:
+        """アカウントの全てのエンドポイントグループを一時停止する
+
+        Args:
+            account_id (int):
+            seconds (float):
+        """
+        with self.__lock:
+            self.__account_paused_until[account_id] = time.monotonic() + seconds
+            buckets = [
+                bucket
+                for (bucket_account_id, _), bucket in self.__buckets.items()
+                if bucket_account_id == account_id
+            ]
+        for bucket in buckets:
+            bucket.pause(seconds)
+
+
+class RateLimit:
+    """レート制限によるリトライを管理するクラス"""
+
+    def __init__(
+        self, wait_on_ratelimit: bool, max_retries: int, retry_after=60 * 5
+    ) -> None:
+        self.__wait_on_ratelimit = wait_on_ratelimit
+        self.__max_retries = max_retries
+        self.__retries_performed = 0
+        self.__retry_after = retry_after
+
+    @property
+    def retries_performed(self) -> int:
+        """レート制限によるリトライ回数
+
+        Returns:
+            int: リトライ回数
+        """
+        return self.__retries_performed
+
+    @retries_performed.setter
+    def retries_performed(self, value: int) -> None:
+        self.__retries_performed = min(value, self.__max_retries)
+
+    @property
+    def max_retries(self) -> int:
+        """レート制限によるリトライ回数の上限
+
+        Returns:
+            int: リトライ回数の上限
+        """
+        return self.__max_retries
+
+    @property
+    def max_retries_reached(self) -> bool:
+        """リトライ回数上限に達したか否か"""
+        return not self.__wait_on_ratelimit or (
+            self.__retries_performed >= self.__max_retries
+        )
+
+    def reset(self) -> None:
+        """レート制限をリセットする"""
+        self.__retries_performed = 0
+
+    def get_retry_after(self, err: Exception) -> float:
+        """サーバーから返された `retry_in`、`ban_until`、`Retry-After` を元に待機秒数を取得する
+
+        Note:
+            いずれも存在しない場合は `retry_after` を返す
+
+        Args:
+            err (Exception):
+
+        Returns:
+            float: 待機秒数
+        """
+        if isinstance(err, ClientError):
+            if err.response.retry_in:
+                return max(0.0, float(err.response.retry_in))
+            if err.response.ban_until:
+                ban_until = float(err.response.ban_until)
+                if ban_until > 1e12:
+                    ban_until /= 1000
+                return max(0.0, ban_until - time.time())
+        elif isinstance(err, HTTPError):
+            retry_after = err.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        return float(self.__retry_after)
+
+    async def wait(
+        self, err: Exception, pause: Optional[Callable[[float], None]] = None
+    ) -> None:
+        """レート制限が解除されるまで待機する
+
+        Note:
+            `pause` が指定された場合は自身では待機せず、待機秒数を渡して呼び出す
+
+        Args:
+            err (Exception): レート制限による例外
+            pause (Callable[[float], None], optional): 待機秒数を受け取る関数
+
+        Raises:
+            Exception: リトライ回数の上限でスロー
+        """
+        if not self.__wait_on_ratelimit or self.max_retries_reached:
+            raise err
+        retry_after = self.get_retry_after(err)
+        if pause is not None:
+            pause(retry_after)
+        else:
+            await asyncio.sleep(retry_after)
+        self.__retries_performed += 1
@@ -0,0 +1,248 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Iterable, Optional, Tuple, Type
+
+import aiohttp
+
+from .errors import HTTPInternalServerError
+
+__all__ = [
+    "RetryBudget",
+    "RetryPolicy",
+]
+
+DEFAULT_RETRYABLE_ERRORS: Tuple[Type[BaseException], ...] = (
+    HTTPInternalServerError,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+
+# リクエストがサーバーに届いていないことが確実なため、冪等でないメソッドでも再試行できる例外
+DEFAULT_SAFE_ERRORS: Tuple[Type[BaseException], ...] = (aiohttp.ClientConnectorError,)
+
+DEFAULT_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+
+class RetryBudget:
+    """一定期間内の再試行回数をリクエスト数に対する割合で制限するクラス
+
+    Note:
+        サーバー障害時にすべてのリクエストが再試行され、負荷が増幅されるのを防ぐ。
+        `ttl` 秒間に許可される再試行回数は `min_retries_per_second * ttl + ratio * リクエスト数` となる
+
+    Args:
+        ratio (float): リクエスト数に対して許可する再試行の割合
+        min_retries_per_second (float): リクエスト数に関わらず許可する1秒あたりの再試行回数
+        ttl (float): 集計対象とする期間（秒）
+    """
+
+    def __init__(self, ratio=0.2, min_retries_per_second=1.0, ttl=10.0) -> None:
+        if ratio < 0 or min_retries_per_second < 0 or ttl <= 0:
+            raise ValueError("ratio must be non-negative and ttl must be positive.")
+        self.__ratio = ratio
+        self.__min_retries = min_retries_per_second * ttl
+        self.__ttl = ttl
+        self.__requests: Deque[float] = deque()
+        self.__retries: Deque[float] = deque()
+        self.__lock = threading.Lock()
+
+    def __prune(self, now: float) -> None:
+        threshold = now - self.__ttl
+        while self.__requests and self.__requests[0] <= threshold:
+            self.__requests.popleft()
+        while self.__retries and self.__retries[0] <= threshold:
+            self.__retries.popleft()
+
+    @property
+    def available(self) -> float:
+        """現在許可されている残りの再試行回数"""
+        with self.__lock:
+            self.__prune(time.monotonic())
+            allowed = self.__min_retries + self.__ratio * len(self.__requests)
+            return max(0.0, allowed - len(self.__retries))
+
+    def record_request(self) -> None:
+        """リクエストの送信を記録する"""
+        with self.__lock:
+            now = time.monotonic()
+            self.__prune(now)
+            self.__requests.append(now)
+
+    def try_withdraw(self) -> bool:
+        """再試行が許可されていれば、その回数を記録する
+
+        Returns:
+            bool: 再試行が許可された場合は True
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__prune(now)
+            allowed = self.__min_retries + self.__ratio * len(self.__requests)
+            if len(self.__retries) + 1 > allowed:
+                return False
+            self.__retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """リクエストの再試行方針
+
+    Args:
+        max_retries (int): 最大再試行回数
+        backoff_factor (float): 指数バックオフの基準となる秒数
+        max_backoff (float): バックオフの上限（秒）
+        jitter (str): `full`、`equal`、`none` のいずれか
+        retryable_errors (Iterable[Type[BaseException]], optional): 再試行の対象とする例外
+        safe_errors (Iterable[Type[BaseException]], optional): 冪等でないメソッドでも再試行できる例外
+        idempotent_methods (Iterable[str], optional): 冪等とみなす HTTP メソッド
+        budget (RetryBudget, optional): 再試行の予算、None の場合は制限しない
+        deadline (float, optional): 再試行を含めたリクエスト全体の制限時間（秒）
+    """
+
+    JITTER_MODES = ("full", "equal", "none")
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=1.5,
+        max_backoff=60.0,
+        *,
+        jitter="full",
+        retryable_errors: Optional[Iterable[Type[BaseException]]] = None,
+        safe_errors: Optional[Iterable[Type[BaseException]]] = None,
+        idempotent_methods: Optional[Iterable[str]] = None,
+        budget: Optional[RetryBudget] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        if jitter not in self.JITTER_MODES:
+            raise ValueError(f"jitter must be one of {self.JITTER_MODES}.")
+        self.__max_retries = max(0, max_retries)
+        self.__backoff_factor = backoff_factor
+        self.__max_backoff = max_backoff
+        self.__jitter = jitter
+        self.__retryable_errors = tuple(
+            DEFAULT_RETRYABLE_ERRORS if retryable_errors is None else retryable_errors
+        )
+        self.__safe_errors = tuple(
+            DEFAULT_SAFE_ERRORS if safe_errors is None else safe_errors
+        )
+        self.__idempotent_methods = frozenset(
+            method.upper()
+            for method in (
+                DEFAULT_IDEMPOTENT_METHODS
+                if idempotent_methods is None
+                else idempotent_methods
+            )
+        )
+        self.__budget = budget
+        self.__deadline = deadline
+
+    @property
+    def max_retries(self) -> int:
+        """最大再試行回数"""
+        return self.__max_retries
+
+    @property
+    def budget(self) -> Optional[RetryBudget]:
+        """再試行の予算"""
+        return self.__budget
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """再試行を含めたリクエスト全体の制限時間（秒）"""
+        return self.__deadline
+
+    def is_idempotent(self, method: str) -> bool:
+        """HTTP メソッドが冪等かどうか"""
+        return method.upper() in self.__idempotent_methods
+
+    def is_retryable(self, method: str, err: BaseException) -> bool:
+        """例外が再試行の対象かどうか
+
+        Note:
+            冪等でないメソッドは、リクエストがサーバーに届いていないことが確実な場合のみ再試行する
+        """
+        if isinstance(err, self.__safe_errors):
+            return True
+        return self.is_idempotent(method) and isinstance(err, self.__retryable_errors)
+
+    def get_backoff(self, attempt: int) -> float:
+        """再試行までの待機時間を求める
+
+        Args:
+            attempt (int): 失敗した試行の番号（0始まり）
+
+        Returns:
+            float: 待機時間（秒）
+        """
+        backoff = min(self.__max_backoff, self.__backoff_factor * (2**attempt))
+        if self.__jitter == "full":
+            return random.uniform(0, backoff)
+        if self.__jitter == "equal":
+            return backoff / 2 + random.uniform(0, backoff / 2)
+        return backoff
+
+    def get_deadline(self) -> Optional[float]:
+        """現在のイベントループの時刻を基準にした期限を求める"""
+        if self.__deadline is None:
+            return None
+        return asyncio.get_running_loop().time() + self.__deadline
+
+    def should_retry(
+        self,
+        method: str,
+        err: BaseException,
+        attempt: int,
+        backoff: float,
+        *,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        """再試行を行うかどうかを判定する
+
+        Args:
+            method (str):
+            err (BaseException): 発生した例外
+            attempt (int): 失敗した試行の番号（0始まり）
+            backoff (float): 再試行までの待機時間（秒）
+            deadline (float, optional): `get_deadline()` で求めた期限
+
+        Returns:
+            bool: 再試行する場合は True
+        """
+        if attempt >= self.__max_retries or not self.is_retryable(method, err):
+            return False
+        if (
+            deadline is not None
+            and asyncio.get_running_loop().time() + backoff >= deadline
+        ):
+            return False
+        if self.__budget is not None and not self.__budget.try_withdraw():
+            return False
+        return True
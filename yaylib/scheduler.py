@@ -0,0 +1,252 @@
+"""
+MIT License
+
+Copyright (c) 2023 ekkx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import contextlib
+import re
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+__all__ = [
+    "INTERACTIVE",
+    "NORMAL",
+    "BULK",
+    "PriorityClass",
+    "RequestScheduler",
+    "get_request_priority",
+    "request_priority",
+]
+
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BULK = "bulk"
+
+
+@dataclass(slots=True)
+class PriorityClass:
+    """優先度クラスごとの設定
+
+    Args:
+        priority (int): 優先度。値が小さいほど先に送信される
+        max_concurrency (int): 同時に送信できるリクエスト数の上限
+    """
+
+    priority: int
+    max_concurrency: int
+
+
+DEFAULT_PRIORITY_CLASSES = {
+    INTERACTIVE: PriorityClass(priority=0, max_concurrency=16),
+    NORMAL: PriorityClass(priority=1, max_concurrency=16),
+    BULK: PriorityClass(priority=2, max_concurrency=4),
+}
+
+INTERACTIVE_PATTERNS = (
+    re.compile(r"/chat_rooms/\d+/messages/new$"),
+    re.compile(r"/chat_rooms/new$"),
+)
+
+_current_priority: ContextVar[Optional[str]] = ContextVar(
+    "yaylib_request_priority", default=None
+)
+
+
+@contextlib.contextmanager
+def request_priority(name: str) -> Iterator[None]:
+    """ブロック内で送信するリクエストの優先度クラスを指定する
+
+    Examples:
+        >>> with yaylib.request_priority(yaylib.BULK):
+        >>>     timeline = await client.post.get_timeline()
+
+    Args:
+        name (str): `interactive`、`normal`、`bulk` などの優先度クラス名
+    """
+    token = _current_priority.set(name)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def get_request_priority(method: str, url: str) -> str:
+    """リクエストの優先度クラスを判定する
+
+    Note:
+        `request_priority()` で指定されていればそれを使用し、指定されていない場合は
+        メッセージの送信を `interactive`、それ以外を `normal` とする
+
+    Args:
+        method (str):
+        url (str):
+
+    Returns:
+        str: 優先度クラス名
+    """
+    name = _current_priority.get()
+    if name is not None:
+        return name
+    if method.upper() == "POST":
+        path = urlsplit(url if "://" in url else "https://" + url).path
+        for pattern in INTERACTIVE_PATTERNS:
+            if pattern.search(path):
+                return INTERACTIVE
+    return NORMAL
+
+
+class RequestScheduler:
+    """優先度クラスごとに同時送信数を制限し、優先度の高いリクエストから送信するクラス
+
+    Note:
+        全体で `max_concurrency` 件までのリクエストを同時に送信する。空きを待つリクエストは
+        優先度の高いクラスから順に、同じクラス内では到着順に送信される。
+        `bulk` の同時送信数を低く抑えることで、大量の取得中でも対話的なリクエストの枠が残る
+
+    Args:
+        classes (Dict[str, PriorityClass], optional): 優先度クラスごとの設定
+        max_concurrency (int): 全体の同時送信数の上限
+    """
+
+    def __init__(
+        self,
+        classes: Optional[Dict[str, PriorityClass]] = None,
+        max_concurrency=32,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.__classes = {**DEFAULT_PRIORITY_CLASSES, **(classes or {})}
+        self.__order = sorted(
+            self.__classes, key=lambda name: self.__classes[name].priority
+        )
+        self.__max_concurrency = max_concurrency
+        self.__active = 0
+        self.__class_active: Dict[str, int] = dict.fromkeys(self.__classes, 0)
+        self.__waiters: Dict[str, Deque[asyncio.Future]] = {
+            name: deque() for name in self.__classes
+        }
+
+    @property
+    def active(self) -> int:
+        """送信中のリクエスト数"""
+        return self.__active
+
+    def get_active(self, name: str) -> int:
+        """優先度クラスの送信中のリクエスト数"""
+        return self.__class_active.get(self.__resolve(name), 0)
+
+    def get_waiting(self, name: str) -> int:
+        """優先度クラスの空きを待っているリクエスト数"""
+        return len(self.__waiters[self.__resolve(name)])
+
+    def get_priority(self, name: str) -> int:
+        """優先度クラスの優先度を取得する"""
+        return self.__classes[self.__resolve(name)].priority
+
+    def __resolve(self, name: str) -> str:
+        return name if name in self.__classes else NORMAL
+
+    def __has_capacity(self, name: str) -> bool:
+        return (
+            self.__active < self.__max_concurrency
+            and self.__class_active[name] < self.__classes[name].max_concurrency
+        )
+
+    def __has_priority_waiters(self, name: str) -> bool:
+        """同じか高い優先度のクラスに、送信可能な待機中のリクエストがあるか"""
+        priority = self.__classes[name].priority
+        for other in self.__order:
+            if self.__classes[other].priority > priority:
+                break
+            if self.__waiters[other] and self.__has_capacity(other):
+                return True
+        return False
+
+    def __grant(self, name: str) -> None:
+        self.__active += 1
+        self.__class_active[name] += 1
+
+    def __dispatch(self) -> None:
+        """空きがあれば、優先度の高いクラスの待機中のリクエストから送信を許可する"""
+        for name in self.__order:
+            waiters = self.__waiters[name]
+            while waiters and self.__has_capacity(name):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self.__grant(name)
+                waiter.set_result(None)
+            if self.__active >= self.__max_concurrency:
+                return
+
+    async def acquire(self, name: str) -> None:
+        """送信の枠が空くまで待機する
+
+        Args:
+            name (str): 優先度クラス名
+        """
+        name = self.__resolve(name)
+        if self.__has_capacity(name) and not self.__has_priority_waiters(name):
+            self.__grant(name)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.__waiters[name].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(name)  # 許可された直後にキャンセルされた場合は返却する
+            else:
+                try:
+                    self.__waiters[name].remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self, name: str) -> None:
+        """送信の枠を返却する
+
+        Args:
+            name (str): 優先度クラス名
+        """
+        name = self.__resolve(name)
+        self.__active -= 1
+        self.__class_active[name] -= 1
+        self.__dispatch()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, name: str) -> AsyncIterator[None]:
+        """送信の枠を確保するコンテキストマネージャー
+
+        Args:
+            name (str): 優先度クラス名
+        """
+        await self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
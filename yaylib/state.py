@@ -24,10 +24,12 @@ SOFTWARE.
 
 import base64
 import hashlib
+import json
 import sqlite3
 from dataclasses import dataclass
+from datetime import datetime
 from queue import Queue
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Tuple
 
 from cryptography.fernet import Fernet
 
@@ -43,6 +45,39 @@ class LocalUser:
     device_uuid: str
     access_token: str
     refresh_token: str
+    access_token_expires_at: int = 0
+    client_ip: str = ""
+    client_ip_expires_at: int = 0
+
+
+@dataclass(slots=True)
+class CrawlCheckpoint:
+    """ストレージ内のクロールの進捗"""
+
+    name: str
+    cursor: Any = None
+    done: bool = False
+    pages: int = 0
+    items: int = 0
+    updated_at: int = 0
+
+
+USER_COLUMNS = (
+    "id",
+    "email",
+    "device_uuid",
+    "access_token",
+    "refresh_token",
+    "access_token_expires_at",
+    "client_ip",
+    "client_ip_expires_at",
+)
+
+USER_COLUMN_MIGRATIONS = (
+    ("access_token_expires_at", "INTEGER NOT NULL DEFAULT 0"),
+    ("client_ip", "TEXT NOT NULL DEFAULT ''"),
+    ("client_ip_expires_at", "INTEGER NOT NULL DEFAULT 0"),
+)
 
 
 class Crypto:
@@ -134,7 +169,7 @@ class SQLiteConnectionPool:
     def __init__(self, db_path, pool_size=5):
         self.__pool = Queue(maxsize=pool_size)
         for _ in range(pool_size):
-            self.__pool.put(sqlite3.connect(db_path))
+            self.__pool.put(sqlite3.connect(db_path, check_same_thread=False))
 
     def get_connection(self) -> sqlite3.Connection:
         """コネクションを取得する"""
@@ -148,8 +183,13 @@ class SQLiteConnectionPool:
 class Storage:
     """クライアントのステートのデータベース操作を行う"""
 
-    def __init__(self, path: str, pool_size=5):
-        self.__pool = SQLiteConnectionPool(path, pool_size)
+    def __init__(
+        self,
+        path: str,
+        pool_size=5,
+        pool: Optional[SQLiteConnectionPool] = None,
+    ):
+        self.__pool = pool or SQLiteConnectionPool(path, pool_size)
 
         conn = self.__pool.get_connection()
         try:
@@ -161,14 +201,48 @@ class Storage:
                     email TEXT NOT NULL,
                     device_uuid TEXT NOT NULL,
                     access_token TEXT NOT NULL,
-                    refresh_token TEXT NOT NULL
+                    refresh_token TEXT NOT NULL,
+                    access_token_expires_at INTEGER NOT NULL DEFAULT 0,
+                    client_ip TEXT NOT NULL DEFAULT '',
+                    client_ip_expires_at INTEGER NOT NULL DEFAULT 0
+                );
+                """
+            )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawls (
+                    name TEXT PRIMARY KEY,
+                    cursor TEXT,
+                    done INTEGER NOT NULL DEFAULT 0,
+                    pages INTEGER NOT NULL DEFAULT 0,
+                    updated_at INTEGER NOT NULL DEFAULT 0
+                );
+                """
+            )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawl_items (
+                    crawl TEXT NOT NULL,
+                    item_key TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (crawl, item_key)
                 );
                 """
             )
+            self.__migrate(cursor)
             conn.commit()
         finally:
             self.__pool.return_connection(conn)
 
+    @staticmethod
+    def __migrate(cursor: sqlite3.Cursor) -> None:
+        """既存のテーブルに不足しているカラムを追加する"""
+        cursor.execute("PRAGMA table_info(users)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for column, definition in USER_COLUMN_MIGRATIONS:
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE users ADD COLUMN {column} {definition}")
+
     def get_user(
         self, user_id: Optional[int] = None, email: Optional[str] = None
     ) -> Optional[LocalUser]:
@@ -186,7 +260,9 @@ class Storage:
                 where = "email = ?"
                 params.append(email)
 
-            cursor.execute(f"SELECT * FROM users WHERE {where}", params)
+            cursor.execute(
+                f"SELECT {', '.join(USER_COLUMNS)} FROM users WHERE {where}", params
+            )
             user = cursor.fetchone()
         finally:
             self.__pool.return_connection(conn)
@@ -200,6 +276,9 @@ class Storage:
             device_uuid=user[2],
             access_token=user[3],
             refresh_token=user[4],
+            access_token_expires_at=user[5],
+            client_ip=user[6],
+            client_ip_expires_at=user[7],
         )
 
     def create_user(self, user: LocalUser) -> bool:
@@ -208,13 +287,19 @@ class Storage:
         try:
             cursor = conn.cursor()
             cursor.execute(
-                "INSERT INTO users (id, email, device_uuid, access_token, refresh_token) VALUES (?, ?, ?, ?, ?)",
+                f"""
+                INSERT INTO users ({', '.join(USER_COLUMNS)})
+                VALUES ({', '.join('?' * len(USER_COLUMNS))})
+                """,
                 (
                     user.user_id,
                     user.email,
                     user.device_uuid,
                     user.access_token,
                     user.refresh_token,
+                    user.access_token_expires_at,
+                    user.client_ip,
+                    user.client_ip_expires_at,
                 ),
             )
             conn.commit()
@@ -232,6 +317,9 @@ class Storage:
         device_uuid: Optional[str] = None,
         access_token: Optional[str] = None,
         refresh_token: Optional[str] = None,
+        access_token_expires_at: Optional[int] = None,
+        client_ip: Optional[str] = None,
+        client_ip_expires_at: Optional[int] = None,
     ) -> bool:
         """ユーザーを更新する"""
         conn = self.__pool.get_connection()
@@ -247,11 +335,25 @@ class Storage:
                 updates.append("access_token = ?")
             if refresh_token is not None:
                 updates.append("refresh_token = ?")
+            if access_token_expires_at is not None:
+                updates.append("access_token_expires_at = ?")
+            if client_ip is not None:
+                updates.append("client_ip = ?")
+            if client_ip_expires_at is not None:
+                updates.append("client_ip_expires_at = ?")
 
             sql = f"UPDATE users SET {', '.join(updates)} WHERE id = ?"
             params = [
                 param
-                for param in [email, device_uuid, access_token, refresh_token]
+                for param in [
+                    email,
+                    device_uuid,
+                    access_token,
+                    refresh_token,
+                    access_token_expires_at,
+                    client_ip,
+                    client_ip_expires_at,
+                ]
                 if param is not None
             ]
             params.append(user_id)
@@ -277,6 +379,114 @@ class Storage:
         finally:
             self.__pool.return_connection(conn)
 
+    def get_crawl(self, name: str) -> Optional[CrawlCheckpoint]:
+        """クロールの進捗を取得する"""
+        conn = self.__pool.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT cursor, done, pages, updated_at FROM crawls WHERE name = ?",
+                (name,),
+            )
+            crawl = cursor.fetchone()
+            if crawl is None:
+                return None
+            cursor.execute("SELECT COUNT(*) FROM crawl_items WHERE crawl = ?", (name,))
+            items = cursor.fetchone()[0]
+        finally:
+            self.__pool.return_connection(conn)
+
+        return CrawlCheckpoint(
+            name=name,
+            cursor=json.loads(crawl[0]) if crawl[0] is not None else None,
+            done=bool(crawl[1]),
+            pages=crawl[2],
+            items=items,
+            updated_at=crawl[3],
+        )
+
+    def save_crawl_page(
+        self,
+        name: str,
+        cursor: Any,
+        items: Iterable[Tuple[str, str]],
+        done=False,
+    ) -> bool:
+        """取得したページの要素と次のカーソルを一つのトランザクションで保存する
+
+        Args:
+            name (str): クロールの名前
+            cursor (Any): 次のページのカーソル（JSON に変換可能な値）
+            items (Iterable[Tuple[str, str]]): 要素のキーと JSON 文字列の組
+            done (bool): 最後のページかどうか
+        """
+        conn = self.__pool.get_connection()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO crawl_items (crawl, item_key, data) VALUES (?, ?, ?)",
+                    ((name, key, data) for key, data in items),
+                )
+                conn.execute(
+                    """
+                    INSERT INTO crawls (name, cursor, done, pages, updated_at)
+                    VALUES (?, ?, ?, 1, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        cursor = excluded.cursor,
+                        done = excluded.done,
+                        pages = pages + 1,
+                        updated_at = excluded.updated_at
+                    """,
+                    (
+                        name,
+                        json.dumps(cursor) if cursor is not None else None,
+                        int(done),
+                        int(datetime.now().timestamp()),
+                    ),
+                )
+            return True
+        except sqlite3.IntegrityError:
+            return False
+        finally:
+            self.__pool.return_connection(conn)
+
+    def iter_crawl_items(self, name: str, batch_size=500) -> Iterator[str]:
+        """クロールで保存した要素の JSON 文字列を保存順に取得する"""
+        last_rowid = 0
+        while True:
+            conn = self.__pool.get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT rowid, data FROM crawl_items
+                    WHERE crawl = ? AND rowid > ?
+                    ORDER BY rowid LIMIT ?
+                    """,
+                    (name, last_rowid, batch_size),
+                )
+                rows = cursor.fetchall()
+            finally:
+                self.__pool.return_connection(conn)
+            if not rows:
+                return
+            for rowid, data in rows:
+                last_rowid = rowid
+                yield data
+
+    def delete_crawl(self, name: str) -> bool:
+        """クロールの進捗と保存した要素を削除する"""
+        conn = self.__pool.get_connection()
+        try:
+            with conn:
+                conn.execute("DELETE FROM crawl_items WHERE crawl = ?", (name,))
+                conn.execute("DELETE FROM crawls WHERE name = ?", (name,))
+            return True
+        except sqlite3.IntegrityError:
+            return False
+        finally:
+            self.__pool.return_connection(conn)
+
 
 class State(Storage):
     """単一クライアントのステートを管理するクラス"""
@@ -286,15 +496,19 @@ class State(Storage):
         *,
         storage_path: str,
         storage_pool_size=5,
+        storage_pool: Optional[SQLiteConnectionPool] = None,
         password: Optional[str] = None,
     ):
-        super().__init__(storage_path, storage_pool_size)
+        super().__init__(storage_path, storage_pool_size, storage_pool)
 
         self.user_id = 0
         self.email = ""
         self.device_uuid = utils.generate_uuid(True)
         self.access_token = ""
         self.refresh_token = ""
+        self.access_token_expires_at = 0
+        self.client_ip = ""
+        self.client_ip_expires_at = 0
 
         self.__crypto = Crypto(password)
 
@@ -309,6 +523,9 @@ class State(Storage):
         self.access_token = user.access_token
         self.refresh_token = user.refresh_token
         self.device_uuid = user.device_uuid
+        self.access_token_expires_at = user.access_token_expires_at
+        self.client_ip = user.client_ip
+        self.client_ip_expires_at = user.client_ip_expires_at
 
     def get_user_by_email(self, email: str) -> Optional[LocalUser]:
         """メールアドレスからユーザーを取得する
@@ -354,6 +571,8 @@ class State(Storage):
         user.device_uuid = self.__crypto.decrypt(user.device_uuid)
         user.access_token = self.__crypto.decrypt(user.access_token)
         user.refresh_token = self.__crypto.decrypt(user.refresh_token)
+        if user.client_ip:
+            user.client_ip = self.__crypto.decrypt(user.client_ip)
         return user
 
     def save(self) -> bool:
@@ -372,6 +591,9 @@ class State(Storage):
                 device_uuid=self.__crypto.encrypt(self.device_uuid),
                 access_token=self.__crypto.encrypt(self.access_token),
                 refresh_token=self.__crypto.encrypt(self.refresh_token),
+                access_token_expires_at=self.access_token_expires_at,
+                client_ip=self.__encrypt_optional(self.client_ip),
+                client_ip_expires_at=self.client_ip_expires_at,
             )
         )
 
@@ -390,8 +612,15 @@ class State(Storage):
             device_uuid=self.__crypto.encrypt(self.device_uuid),
             access_token=self.__crypto.encrypt(self.access_token),
             refresh_token=self.__crypto.encrypt(self.refresh_token),
+            access_token_expires_at=self.access_token_expires_at,
+            client_ip=self.__encrypt_optional(self.client_ip),
+            client_ip_expires_at=self.client_ip_expires_at,
         )
 
+    def __encrypt_optional(self, text: str) -> str:
+        """空文字列以外を暗号化する"""
+        return self.__crypto.encrypt(text) if text else text
+
     def destory(self, user_id: int) -> bool:
         """データベース内のテーブルからユーザーを削除する
 
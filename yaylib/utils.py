@@ -130,6 +130,15 @@ def filter_dict(params: Optional[dict] = None) -> Optional[dict]:
     return new_params
 
 
+def make_hashable(value: Any) -> Any:
+    """dict や list を含む値を、辞書のキーとして使えるハッシュ可能な値に変換する"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, make_hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(make_hashable(v) for v in value)
+    return value
+
+
 def generate_uuid(uuid_type=True):
     generated_uuid = str(uuid.uuid4())
     if uuid_type:
@@ -169,6 +178,20 @@ def generate_jwt() -> str:
     return payload + "." + sig
 
 
+def get_expires_at(expires_in: Optional[int]) -> int:
+    """有効期間の秒数から有効期限の UNIX 時刻を求める
+
+    Args:
+        expires_in (int, optional): 有効期間（秒）
+
+    Returns:
+        int: 有効期限、不明な場合は 0
+    """
+    if not expires_in:
+        return 0
+    return int(datetime.now().timestamp()) + int(expires_in)
+
+
 def is_valid_image_format(image_format: str):
     allowed_formats = [".jpg", ".jpeg", ".png", ".gif"]
     return image_format in allowed_formats
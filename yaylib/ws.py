@@ -22,13 +22,15 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import asyncio
 from typing import Optional
 
 import aiohttp
 
 from . import config
+from .circuit import is_circuit_failure
+from .codec import JSONCodec, get_json_codec
 from .models import Message, WSChannelMessage, WSMessage
+from .projection import MODELS, response_format
 
 
 class Intents:
@@ -75,13 +77,18 @@ class WebSocketInteractor(WSEventListener):
         "group_update": "GroupUpdatesChannel",
     }
 
-    def __init__(self, client, intents: Intents):
+    def __init__(
+        self,
+        client,
+        intents: Intents,
+        json_codec: Optional[str | JSONCodec] = None,
+    ):
         # pylint: disable=import-outside-toplevel
         from .client import Client
 
         self.__client: Client = client
         self.__intents = intents
-        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__json_codec = get_json_codec(json_codec)
         self.__ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self.__ws_token: Optional[str] = None
 
@@ -94,7 +101,8 @@ class WebSocketInteractor(WSEventListener):
                 {
                     "command": command,
                     "identifier": f'{{"channel":"{channel}"}}',
-                }
+                },
+                dumps=self.__json_codec.dumps,
             )
 
     # ---------- event handlers ----------
@@ -157,8 +165,12 @@ class WebSocketInteractor(WSEventListener):
         self.__client.logger.debug("ws: __on_open()")
 
     async def __on_message(self, data: dict):
+        identifier = data.get("identifier")
+        if isinstance(identifier, str):
+            data["identifier"] = self.__json_codec.loads(identifier)
+
         channel_msg = WSChannelMessage(data)
-        self.__client.logger.debug(f"ws: __on_message({channel_msg})")
+        self.__client.logger.debug("ws: __on_message(%s)", channel_msg)
 
         event_handlers = {
             "ping": self.__on_ping_event,
@@ -184,7 +196,7 @@ class WebSocketInteractor(WSEventListener):
             await channel_handler(content)
         else:
             self.__client.logger.debug(
-                f"Unknown channel: {channel_msg.identifier.channel}"
+                "Unknown channel: %s", channel_msg.identifier.channel
             )
 
     async def __on_error(self, data: dict):
@@ -207,24 +219,39 @@ class WebSocketInteractor(WSEventListener):
             await self.__client.auth.login(email, password)
 
         if self.__ws_token is None:
-            self.__ws_token = (await self.__client.misc.get_web_socket_token()).token
-
-        self.__session = aiohttp.ClientSession()
-        async with self.__session.ws_connect(
-            f"wss://{config.CABLE_HOST}/?token={self.__ws_token}&app_version={config.VERSION_NAME}"
-        ) as ws:
+            with response_format(MODELS):
+                response = await self.__client.misc.get_web_socket_token()
+            self.__ws_token = response.token
+
+        url = f"wss://{config.CABLE_HOST}/?token={self.__ws_token}&app_version={config.VERSION_NAME}"
+        breaker = self.__client.circuit_breaker.get_breaker("GET", url)
+        probe = breaker.acquire()
+        try:
+            ws = await self.__client.session.ws_connect(
+                url, proxy=self.__client.proxy_url
+            )
+        except BaseException as exc:
+            if is_circuit_failure(exc):
+                breaker.record_failure(probe)
+            else:
+                breaker.release(probe)
+            raise
+        breaker.record_success(probe)
+
+        async with ws:
             self.__ws = ws
 
             await self.__on_open()
 
+            loads = self.__json_codec.loads
             async for msg in ws:
                 match msg.type:
                     case aiohttp.WSMsgType.TEXT:
-                        await self.__on_message(msg.json())
+                        await self.__on_message(msg.json(loads=loads))
                     case aiohttp.WSMsgType.ERROR:
-                        await self.__on_error(msg.json())
+                        await self.__on_error(msg.json(loads=loads))
                     case aiohttp.WSMsgType.CLOSE:
-                        await self.__on_close(msg.json())
+                        await self.__on_close(msg.json(loads=loads))
 
     def run(self, email: Optional[str] = None, password: Optional[str] = None) -> None:
         """WebSocket の接続を確立する
@@ -233,12 +260,9 @@ class WebSocketInteractor(WSEventListener):
             email (str, optional):
             password (str, optional):
         """
-        asyncio.run(self.__start_ws(email, password))
+        self.__client.call_sync(self.__start_ws(email, password))
 
     async def stop(self) -> None:
         """WebSocket の接続を終了する"""
         if self.__ws is not None:
             await self.__ws.close()
-
-        if self.__session is not None:
-            await self.__session.close()